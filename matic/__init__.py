@@ -1,6 +1,13 @@
+from __future__ import annotations
+
 from logging import getLogger
+from typing import TYPE_CHECKING
+
+from matic.utils.lazy_import import lazy_attributes
 
-from matic.pos import POSClient
+if TYPE_CHECKING:
+    from matic.plasma import PlasmaClient
+    from matic.pos import POSClient
 
 __version__ = '0.1.0b2'
 
@@ -11,4 +18,12 @@ logger = getLogger(__name__)
 """
 
 
-__all__ = ['POSClient', 'logger']
+__all__ = ['PlasmaClient', 'POSClient', 'logger']
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        'PlasmaClient': 'matic.plasma.plasma_client',
+        'POSClient': 'matic.pos.pos_client',
+    },
+)
@@ -7,8 +7,10 @@ from eth_typing import HexAddress
 from web3.types import BlockIdentifier, RPCEndpoint, RPCResponse
 
 from matic.json_types import (
+    FeeSpeed,
     IBlock,
     IBlockWithTransaction,
+    IFeeSuggestion,
     ITransactionData,
     ITransactionReceipt,
     ITransactionRequestConfig,
@@ -43,6 +45,52 @@ class BaseWeb3Client(ABC):
     ) -> ITransactionWriteResult:
         """Perform a writing (modifying) operation."""
 
+    def sign_transaction(
+        self, config: ITransactionRequestConfig, private_key: str
+    ) -> bytes:
+        """Sign complete transaction locally (no network calls), return raw bytes."""
+        raise NotImplementedError(
+            f'{type(self).__name__} does not support signing transactions locally.'
+        )
+
+    def send_raw_transaction(
+        self,
+        raw_transaction: bytes,
+        config: ITransactionRequestConfig | None = None,
+    ) -> ITransactionWriteResult:
+        """Send transaction signed locally (config it was built from is optional)."""
+        raise NotImplementedError(
+            f'{type(self).__name__} does not support sending raw transactions.'
+        )
+
+    def send_raw_transactions(
+        self, transactions: Sequence[tuple[bytes, ITransactionRequestConfig]]
+    ) -> list[ITransactionWriteResult | Exception]:
+        """Send transactions signed locally (with their configs) in order.
+
+        Sending stops at the first failure, later transactions are not sent
+        (they would wait for its nonce).
+
+        Returns:
+            Result or error of every transaction.
+        """
+        results: list[ITransactionWriteResult | Exception] = []
+        failure: Exception | None = None
+        for raw, config in transactions:
+            if failure is not None:
+                results.append(
+                    ValueError(f'Not sent: earlier transaction failed ({failure})')
+                )
+                continue
+            try:
+                results.append(self.send_raw_transaction(raw, config))
+            except NotImplementedError:
+                raise
+            except Exception as e:  # noqa: PIE786
+                failure = e
+                results.append(e)
+        return results
+
     @property
     @abstractmethod
     def gas_price(self) -> int:
@@ -52,6 +100,12 @@ class BaseWeb3Client(ABC):
     def estimate_gas(self, config: ITransactionRequestConfig) -> int:
         """Estimate gas amount for transaction."""
 
+    def get_fee_suggestion(
+        self, speed: FeeSpeed | None = None
+    ) -> IFeeSuggestion | None:
+        """Get EIP-1559 fees for transaction (None to leave them to the node)."""
+        return None
+
     @property
     @abstractmethod
     def chain_id(self) -> int:
@@ -83,6 +137,10 @@ class BaseWeb3Client(ABC):
     ) -> IBlockWithTransaction:
         """Get block (with decoded transaction data) by hash or number."""
 
+    def get_block_number(self) -> int:
+        """Get number of the latest block."""
+        return self.get_block('latest').number
+
     def get_root_hash(self, start_block: int, end_block: int) -> bytes:
         """Get root hash for two blocks."""
         return bytes.fromhex(
@@ -123,10 +181,13 @@ class BaseContractMethod(ABC):
         self,
         tx: ITransactionRequestConfig | None = None,
         return_transaction: bool = False,
+        block_identifier: BlockIdentifier | None = None,
     ) -> Any:
         """Perform a read operation.
 
         This does not sign a transaction and does not affect the chain.
+        ``block_identifier`` is passed only when block is pinned, so methods
+        written before it was added keep working.
         """
 
     @abstractmethod
@@ -141,6 +202,14 @@ class BaseContractMethod(ABC):
         Transaction is signed (with given PK), affects the chain.
         """
 
+    def build_transaction(
+        self, tx: ITransactionRequestConfig
+    ) -> ITransactionRequestConfig:
+        """Add contract address and call data to transaction (no network calls)."""
+        raise NotImplementedError(
+            f'{type(self).__name__} cannot build transactions offline.'
+        )
+
     @abstractmethod
     def estimate_gas(self, tx: ITransactionRequestConfig) -> int:
         """Estimate gas for given transaction.
@@ -153,6 +222,16 @@ class BaseContractMethod(ABC):
     def encode_abi(self) -> bytes:
         """Encode args according to method ABI and prepend the selector."""
 
+    def decode_result(self, data: bytes) -> Any:
+        """Decode raw data returned by this method call.
+
+        Methods that do not implement it are read one by one,
+        not through :class:`~matic.utils.multicall.Multicall`.
+        """
+        raise NotImplementedError(
+            f'{type(self).__name__} does not support decoding of raw results.'
+        )
+
 
 class BaseContract(ABC):
     """Reference implementation of class defining smart contract."""
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from matic.json_types import ITransactionWriteResult
+
 
 class MaticException(Exception):
     """Base exception class for this library."""
@@ -27,3 +32,27 @@ class EIP1559NotSupportedException(MaticException):
 
 class NullSpenderAddressException(MaticException):
     """Please provide spender address."""
+
+
+class MulticallCallFailedException(MaticException):
+    """Read aggregated into multicall has failed (reverted)."""
+
+    def __init__(self, message: str, return_data: bytes = b'') -> None:
+        super().__init__(message)
+        self.return_data = return_data
+
+
+class BulkSendException(MaticException):
+    """Some transactions of a bulk send were not sent."""
+
+    def __init__(
+        self,
+        message: str,
+        results: Sequence[ITransactionWriteResult | None],
+        errors: dict[int, BaseException],
+    ) -> None:
+        super().__init__(message)
+        self.results = results
+        """Results of sent transactions by input index (None if not sent)."""
+        self.errors = errors
+        """Errors of transactions that were not sent by input index."""
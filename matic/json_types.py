@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Callable, Sequence, TypedDict, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Literal,
+    Sequence,
+    TypedDict,
+    TypeVar,
+)
 
 from eth_typing import ChecksumAddress, HexAddress, HexStr
 from typing_extensions import NotRequired
 
+import matic
+
 if TYPE_CHECKING:
+    from web3.types import BlockIdentifier
+
     from matic.plasma.contracts import DepositManager, RegistryContract, WithdrawManager
     from matic.pos.root_chain_manager import RootChainManager
     from matic.utils.exit_util import ExitUtil
@@ -83,12 +96,32 @@ class ITransactionRequestConfig(ConfigWithFrom, total=False):
     """Transaction type."""
 
 
+FeeSpeed = Literal['slow', 'normal', 'fast']
+"""Desired speed of transaction inclusion (see :mod:`matic.web3_client.fee_oracle`)."""
+
+
+class IFeeSuggestion(TypedDict):
+    """EIP-1559 fees suggested for a transaction."""
+
+    max_fee_per_gas: int
+    """Max total fee per gas unit."""
+    max_priority_fee_per_gas: int
+    """Max tip per gas unit to block producer."""
+
+
 @_with_doc_mro(ITransactionRequestConfig)
 class ITransactionOption(ITransactionRequestConfig):
     """Transaction config: this can be passed as option to almost all methods."""
 
     return_transaction: NotRequired[bool]
     """Skip writing step and return prepared transaction."""
+    use_signer_pool: NotRequired[bool]
+    """Send write from the least loaded key of the chain signer pool.
+
+    See :mod:`matic.utils.signer_pool`.
+    """
+    block_identifier: NotRequired[BlockIdentifier]
+    """Block to read state at (reads only; number, hash or tag like ``latest``)."""
 
 
 @_with_doc_mro(ITransactionOption, ITransactionRequestConfig)
@@ -146,6 +179,26 @@ class NeighbourClientConfig(TypedDict):
     """Web3 provider to use."""
     default_config: ConfigWithFrom
     """Any required configuration (must include "from" key)."""
+    direct_reads: NotRequired[bool]
+    """Read from contracts with bare ``eth_call``, bypassing web3 middlewares."""
+    multicall_address: NotRequired[HexAddress]
+    """Multicall3 contract address (canonical deployment is used by default)."""
+    read_cache_size: NotRequired[int]
+    """Max number of cached reads at finalized blocks (no caching by default)."""
+    manage_nonces: NotRequired[bool]
+    """Hand out nonces of senders locally (see :mod:`matic.utils.nonce_manager`)."""
+    cache_gas_estimates: NotRequired[bool]
+    """Reuse gas estimates of similar calls (see :mod:`matic.utils.gas_estimator`)."""
+    fee_speed: NotRequired[FeeSpeed]
+    """Speed to suggest EIP-1559 fees of transactions for (``'normal'`` by default)."""
+    fee_refresh_interval: NotRequired[float]
+    """Min time (in seconds) between fee samples, block time of chain is good."""
+    signers: NotRequired[Sequence[str]]
+    """Private keys to spread writes over (see :mod:`matic.utils.signer_pool`)."""
+    accelerate_after_blocks: NotRequired[int]
+    """Replace writes pending that many blocks (see :mod:`matic.utils.accelerator`)."""
+    max_fee_cap: NotRequired[int]
+    """Max fee per gas (in wei) fee bumping may reach (no cap by default)."""
 
 
 class IBaseClientConfig(TypedDict):
@@ -159,6 +212,11 @@ class IBaseClientConfig(TypedDict):
     """Parent chain configuration."""
     child: NotRequired[NeighbourClientConfig]
     """Child chain configuration."""
+    prefetch: NotRequired[bool | Literal['background']]
+    """Fetch all ABIs bridge client may need concurrently on instantiation.
+
+    ``True`` waits for them, ``'background'`` does not block.
+    """
 
 
 @_with_doc_mro(IBaseClientConfig)
@@ -308,10 +366,37 @@ class ITransactionWriteResult(ABC):
         return self.get_receipt()
 
     @abstractmethod
-    def get_receipt(self, timeout: int = ...) -> ITransactionReceipt:
+    def get_receipt(self, timeout: float = ...) -> ITransactionReceipt:
         """Get receipt (wait max ``timeout`` seconds)."""
         ...
 
+    def done(self) -> bool:
+        """Check whether receipt is known (or waiting for it has failed)."""
+        return 'receipt' in self.__dict__
+
+    def add_done_callback(self, fn: Callable[[ITransactionWriteResult], Any]) -> None:
+        """Call ``fn(self)`` once receipt is known.
+
+        By default receipt is waited for in a separate thread.
+        """
+
+        def wait() -> None:
+            try:
+                self.receipt  # Cached: done() is true from now on
+            except Exception as e:  # noqa: PIE786
+                matic.logger.info('Waiting for receipt failed: %r', e)
+            fn(self)
+
+        threading.Thread(target=wait, daemon=True).start()
+
+    def add_replacement(
+        self, tx_hash: bytes, tx_params: ITransactionRequestConfig
+    ) -> None:
+        """Track transaction replacing this one (with the same nonce)."""
+        raise NotImplementedError(
+            f'{type(self).__name__} does not support replacement transactions.'
+        )
+
 
 @dataclass
 class ILog:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Iterator
 
 from eth_typing import HexAddress
 
@@ -13,6 +13,7 @@ from matic.json_types import (
     ITransactionWriteResult,
 )
 from matic.plasma.plasma_token import PlasmaToken
+from matic.utils.multicall import DEFAULT_CHUNK_SIZE
 from matic.utils.web3_side_chain_client import Web3SideChainClient
 
 
@@ -104,14 +105,31 @@ class ERC721(PlasmaToken):
         """Perform transfer to another address."""
         return self.transfer_erc_721(from_, to, token_id, private_key, option)
 
+    def iter_all_tokens(
+        self,
+        user_address: HexAddress,
+        limit: int | None = None,
+        page_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int | None = None,
+    ) -> Iterator[int]:
+        """Iterate over token ids of the given user, reading them by pages.
+
+        See :meth:`~matic.utils.base_token.BaseToken.iter_reads` for
+        ``page_size`` and ``concurrency``.
+        """
+        count = self.resolve_read(self.get_tokens_count(user_address))
+        if limit is not None and count > limit:
+            count = limit
+
+        yield from self.iter_reads(
+            lambda i: self.get_token_id_at_index_for_user(i, user_address),
+            count,
+            page_size,
+            concurrency,
+        )
+
     def get_all_tokens(
         self, user_address: HexAddress, limit: int | None = None
     ) -> list[int]:
         """Get all token ids that belong to the given user."""
-        if limit is None:
-            limit = self.get_tokens_count(user_address)
-        # TODO: should be async
-
-        return [
-            self.get_token_id_at_index_for_user(i, user_address) for i in range(limit)
-        ]
+        return list(self.iter_all_tokens(user_address, limit))
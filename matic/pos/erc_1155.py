@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Iterable, Sequence
+from typing import Iterable, Sequence, cast
 
 from eth_typing import HexAddress
 
@@ -16,6 +16,8 @@ class ERC1155(TokenWithApproveAll):
     """Name of a contract."""
     BURN_EVENT_SIGNATURE: bytes = POSLogEventSignature.ERC_1155_TRANSFER
     """Burn event signature: used for exit methods."""
+    BALANCE_BATCH_SIZE: int = 500
+    """Max number of balances read by one ``balanceOfBatch`` call."""
 
     @property
     def mintable_predicate_address(self) -> HexAddress | None:
@@ -34,6 +36,31 @@ class ERC1155(TokenWithApproveAll):
         method = self.method('balanceOf', user_address, token_id)
         return self.process_read(method, option)
 
+    def get_balances(
+        self,
+        pairs: Sequence[tuple[HexAddress, int]],
+        option: ITransactionOption | None = None,
+        batch_size: int | None = None,
+    ) -> list[int]:
+        """Get balances for supplied ``(user_address, token_id)`` pairs.
+
+        Balances are read with ``balanceOfBatch``, by chunks of ``batch_size``
+        pairs (:attr:`BALANCE_BATCH_SIZE` by default) to stay within
+        response size and gas limits of ``eth_call``.
+        """
+        batch_size = batch_size or self.BALANCE_BATCH_SIZE
+        balances: list[int] = []
+        for start in range(0, len(pairs), batch_size):
+            chunk = pairs[start : start + batch_size]
+            method = self.method(
+                'balanceOfBatch',
+                [user_address for user_address, _ in chunk],
+                [token_id for _, token_id in chunk],
+            )
+            chunk_option = cast(ITransactionOption, dict(option)) if option else None
+            balances.extend(self.resolve_read(self.process_read(method, chunk_option)))
+        return balances
+
     def approve_all_for_mintable(
         self, private_key: str | None = None, option: ITransactionOption | None = None
     ):
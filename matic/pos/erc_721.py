@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Iterator, Sequence
 
 from eth_typing import HexAddress
 
 from matic.constants import POSLogEventSignature
 from matic.json_types import IExitTransactionOption, ITransactionOption
 from matic.pos.pos_token import TokenWithApproveAll
+from matic.utils.multicall import DEFAULT_CHUNK_SIZE, then
 
 
 class ERC721(TokenWithApproveAll):
@@ -30,7 +31,7 @@ class ERC721(TokenWithApproveAll):
     ) -> int:
         """Get tokens count for the user."""
         method = self.method('balanceOf', user_address)
-        return int(self.process_read(method, options))
+        return then(self.process_read(method, options), int)
 
     def get_token_id_at_index_for_user(
         self,
@@ -41,20 +42,36 @@ class ERC721(TokenWithApproveAll):
         """Get token id on supplied index for user."""
         method = self.method('tokenOfOwnerByIndex', user_address, index)
 
-        return int(self.process_read(method, options))
+        return then(self.process_read(method, options), int)
+
+    def iter_all_tokens(
+        self,
+        user_address: HexAddress,
+        limit: int | None = None,
+        page_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int | None = None,
+    ) -> Iterator[int]:
+        """Iterate over tokens of user, reading them by pages.
+
+        See :meth:`~matic.utils.base_token.BaseToken.iter_reads` for
+        ``page_size`` and ``concurrency``.
+        """
+        count = self.resolve_read(self.get_tokens_count(user_address))
+        if limit is not None and count > limit:
+            count = limit
+
+        yield from self.iter_reads(
+            lambda i: self.get_token_id_at_index_for_user(i, user_address),
+            count,
+            page_size,
+            concurrency,
+        )
 
     def get_all_tokens(
         self, user_address: HexAddress, limit: int | None = None
     ) -> list[int]:
         """Get all tokens for user."""
-        count = self.get_tokens_count(user_address)
-        if limit is not None and count > limit:
-            count = limit
-
-        # TODO: should be async
-        return [
-            self.get_token_id_at_index_for_user(i, user_address) for i in range(count)
-        ]
+        return list(self.iter_all_tokens(user_address, limit))
 
     def is_approved(
         self, token_id: int, option: ITransactionOption | None = None
@@ -62,7 +79,10 @@ class ERC721(TokenWithApproveAll):
         """Check if given token is approved for contract."""
         self.check_for_root()
         method = self.method('getApproved', token_id)
-        return self.predicate_address == self.process_read(method, option)
+        return then(
+            self.process_read(method, option),
+            lambda approved: self.predicate_address == approved,
+        )
 
     def approve(
         self,
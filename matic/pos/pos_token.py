@@ -13,6 +13,7 @@ from matic.json_types import (
 from matic.pos.root_chain_manager import RootChainManager
 from matic.utils.base_token import BaseToken
 from matic.utils.exit_util import ExitUtil
+from matic.utils.multicall import then
 from matic.utils.web3_side_chain_client import Web3SideChainClient
 
 
@@ -161,7 +162,7 @@ class TokenWithApproveAll(POSToken):
         method = self.contract.method(
             'isApprovedForAll', user_address, self.predicate_address
         )
-        return bool(self.process_read(method, option))
+        return then(self.process_read(method, option), bool)
 
     def _approve_all(
         self,
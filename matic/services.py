@@ -1,20 +1,55 @@
 from __future__ import annotations
 
+import asyncio
+import operator
 import os
-from typing import Any
+import random
+import threading
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from matic.json_types import CheckpointedBlock
+from matic.utils.disk_cache import DiskCache
 from matic.utils.polyfill import removeprefix, removesuffix
 
+if TYPE_CHECKING:
+    import aiohttp
+
 __all__ = [
     'DEFAULT_ABI_STORE_URL',
     'DEFAULT_PROOF_API_URL',
+    'DEFAULT_TIMEOUT',
+    'DISK_CACHE',
+    'async_get_abi',
+    'async_get_abis',
+    'async_get_address',
+    'async_get_block_included',
+    'async_get_blocks_included',
+    'async_get_proof',
+    'close_async_session',
+    'close_session',
+    'configure_async_session',
+    'configure_disk_cache',
+    'configure_session',
     'get_abi',
     'get_address',
+    'get_async_session',
     'get_block_included',
     'get_proof',
+    'get_session',
 ]
 
 DEFAULT_ABI_STORE_URL: str = os.getenv(
@@ -25,6 +60,221 @@ DEFAULT_ABI_STORE_URL: str = os.getenv(
 DEFAULT_PROOF_API_URL: str = os.getenv('MATIC_PROOF_API', '')
 """Default url of proof API. Must be set to use fast proofs."""
 
+_Timeout = Union[float, Tuple[float, float]]
+
+DEFAULT_TIMEOUT: _Timeout = (
+    float(os.getenv('MATIC_HTTP_CONNECT_TIMEOUT', 5)),
+    float(os.getenv('MATIC_HTTP_READ_TIMEOUT', 30)),
+)
+"""Default ``(connect, read)`` timeout (in seconds) for every HTTP request.
+
+Can be set with ``MATIC_HTTP_CONNECT_TIMEOUT`` and ``MATIC_HTTP_READ_TIMEOUT``.
+"""
+
+DISK_CACHE: DiskCache | None = (
+    DiskCache(os.environ['MATIC_CACHE_DIR'], float(os.getenv('MATIC_CACHE_TTL', 86400)))
+    if os.getenv('MATIC_CACHE_DIR')
+    else None
+)
+"""Persistent cache of ABI store responses (disabled if ``None``).
+
+Enabled on import if ``MATIC_CACHE_DIR`` (and optionally ``MATIC_CACHE_TTL``)
+environmental variable is set. See also :func:`configure_disk_cache`.
+"""
+
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+_async_sessions: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, aiohttp.ClientSession
+] = weakref.WeakKeyDictionary()
+# Loops hold only weak references to their tasks
+_async_session_closers: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, asyncio.Task[None]
+] = weakref.WeakKeyDictionary()
+_async_options: dict[str, Any] = {
+    'limit': 100,
+    'limit_per_host': 10,
+    'max_retries': 3,
+    'backoff_factor': 0.3,
+}
+
+_T = TypeVar('_T')
+
+
+class _JitteredRetry(Retry):
+    """Retry policy with "full jitter" exponential backoff.
+
+    Concurrent workers that failed together should not retry together.
+    """
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+
+def _build_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    max_retries: int = 3,
+    backoff_factor: float = 0.3,
+) -> requests.Session:
+    retry = _JitteredRetry(
+        total=max_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=_RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def configure_session(
+    *,
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    max_retries: int = 3,
+    backoff_factor: float = 0.3,
+) -> requests.Session:
+    """(Re)create the HTTP session shared by all functions of this module.
+
+    Connections are kept alive and reused between calls, so only the first
+    request to ABI store or proof API pays for TCP/TLS handshake.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Max number of connections kept alive for one host.
+        pool_block: Block instead of opening extra connections
+            when all ``pool_maxsize`` connections to the host are busy.
+        max_retries: Max number of retries for failed GET request
+            (connection errors and 429/5xx responses).
+        backoff_factor: Base of exponential backoff between retries
+            (in seconds).
+
+    Returns:
+        New session instance (it is already installed as shared).
+    """
+    global _session
+
+    session = _build_session(
+        pool_connections, pool_maxsize, pool_block, max_retries, backoff_factor
+    )
+    with _session_lock:
+        old, _session = _session, session
+    if old is not None:
+        old.close()
+    return session
+
+
+def get_session() -> requests.Session:
+    """Get the shared HTTP session, creating it with defaults if necessary."""
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            _session = _build_session()
+        return _session
+
+
+def close_session() -> None:
+    """Close the shared HTTP session and release all pooled connections."""
+    global _session
+
+    with _session_lock:
+        old, _session = _session, None
+    if old is not None:
+        old.close()
+
+
+def configure_disk_cache(
+    directory: str | os.PathLike[str] | None = None,
+    ttl: float = 86400,
+    enabled: bool = True,
+) -> DiskCache | None:
+    """Enable (or disable) persistent cache of ABI store responses.
+
+    Addresses and ABIs are stored pre-parsed in ``directory`` and reused by
+    all processes. After ``ttl`` seconds they are revalidated with ABI store
+    using ``ETag`` and ``Last-Modified`` headers.
+
+    Args:
+        directory: Cache directory (``$XDG_CACHE_HOME/matic`` by default).
+        ttl: Seconds before entry is revalidated.
+        enabled: Pass ``False`` to disable cache.
+
+    Returns:
+        Installed cache instance or ``None``.
+    """
+    global DISK_CACHE
+
+    DISK_CACHE = DiskCache(directory, ttl) if enabled else None
+    return DISK_CACHE  # noqa: PIE781
+
+
+def _get_json(url: str, timeout: _Timeout | None = None) -> Any:
+    response = get_session().get(url, timeout=timeout or DEFAULT_TIMEOUT)
+    response.raise_for_status()
+    return response.json()
+
+
+def _conditional_headers(etag: str | None, last_modified: str | None) -> dict[str, str]:
+    headers = {}
+    if etag:
+        headers['If-None-Match'] = etag
+    if last_modified:
+        headers['If-Modified-Since'] = last_modified
+    return headers
+
+
+def _get_json_conditional(
+    url: str, etag: str | None, last_modified: str | None
+) -> tuple[Any, str | None, str | None]:
+    headers = _conditional_headers(etag, last_modified)
+    response = get_session().get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+    if response.status_code == 304:
+        return None, etag, last_modified
+    response.raise_for_status()
+    return (
+        response.json(),
+        response.headers.get('ETag'),
+        response.headers.get('Last-Modified'),
+    )
+
+
+def _get_store_json(url: str, parse: Callable[[Any], Any] = lambda data: data) -> Any:
+    cache = DISK_CACHE
+    if cache is None:
+        return parse(_get_json(url))
+    return cache.get(url, _get_json_conditional, parse)
+
+
+def _create_abi_url(
+    network: str,
+    version: str,
+    bridge_type: str,
+    contract_name: str,
+    base_url: str | None = None,
+) -> str:
+    base_url = removesuffix(base_url or DEFAULT_ABI_STORE_URL, '/')
+    path = f'{network}/{version}/artifacts/{bridge_type}/{contract_name}.json'
+    return f'{base_url}/{path}'
+
+
+def _create_address_url(network: str, version: str, base_url: str | None = None) -> str:
+    base_url = removesuffix(base_url or DEFAULT_ABI_STORE_URL, '/')
+    return f'{base_url}/{network}/{version}/index.json'
+
 
 def get_abi(
     network: str,
@@ -34,18 +284,15 @@ def get_abi(
     base_url: str | None = None,
 ) -> dict[str, Any]:
     """Get ABI dict for contract."""
-    base_url = removesuffix(base_url or DEFAULT_ABI_STORE_URL, '/')
-    url = f'{base_url}/{network}/{version}/artifacts/{bridge_type}/{contract_name}.json'
-    return requests.get(url).json()['abi']
+    url = _create_abi_url(network, version, bridge_type, contract_name, base_url)
+    return _get_store_json(url, operator.itemgetter('abi'))
 
 
 def get_address(
     network: str, version: str, base_url: str | None = None
 ) -> dict[str, Any]:
     """Fetch dictionary with addresses of contracts deployed on network."""
-    base_url = removesuffix(base_url or DEFAULT_ABI_STORE_URL, '/')
-    url = f'{base_url}/{network}/{version}/index.json'
-    return requests.get(url).json()
+    return _get_store_json(_create_address_url(network, version, base_url))
 
 
 def _create_proof_url(network: str, url: str, base_url: str | None = None) -> str:
@@ -56,12 +303,23 @@ def _create_proof_url(network: str, url: str, base_url: str | None = None) -> st
     return f'{base_url}/{"matic" if network == "mainnet" else "mumbai"}/{url}'
 
 
-def get_block_included(
+def _create_block_included_url(
     network: str, block_number: int, base_url: str | None = None
-) -> CheckpointedBlock:
-    """Get block information by number."""
-    url = _create_proof_url(network, f'/block-included/{block_number}')
-    data = requests.get(url).json()
+) -> str:
+    return _create_proof_url(network, f'/block-included/{block_number}', base_url)
+
+
+def _create_fast_proof_url(
+    network: str, start: int, end: int, block_number: int, base_url: str | None = None
+) -> str:
+    return _create_proof_url(
+        network,
+        f'/fast-merkle-proof?start={start}&end={end}&number={block_number}',
+        base_url,
+    )
+
+
+def _parse_block_included(data: dict[str, Any]) -> CheckpointedBlock:
     return CheckpointedBlock(
         header_block_number=int(data['headerBlockNumber'], 16),
         block_number=int(data['blockNumber']),
@@ -74,12 +332,257 @@ def get_block_included(
     )
 
 
+def _parse_proof(data: dict[str, Any]) -> bytes:
+    return bytes.fromhex(removeprefix(data['proof'], '0x'))
+
+
+def get_block_included(
+    network: str, block_number: int, base_url: str | None = None
+) -> CheckpointedBlock:
+    """Get block information by number."""
+    url = _create_block_included_url(network, block_number, base_url)
+    return _parse_block_included(_get_json(url))
+
+
 def get_proof(
     network: str, start: int, end: int, block_number: int, base_url: str | None = None
 ) -> bytes:
     """Get proof from API."""
-    url = _create_proof_url(
-        network,
-        f'/fast-merkle-proof?start={start}&end={end}&number={block_number}',
+    url = _create_fast_proof_url(network, start, end, block_number, base_url)
+    return _parse_proof(_get_json(url))
+
+
+# Async API
+
+
+def configure_async_session(
+    *,
+    limit: int = 100,
+    limit_per_host: int = 10,
+    max_retries: int = 3,
+    backoff_factor: float = 0.3,
+) -> None:
+    """Set options for async HTTP sessions created after this call.
+
+    One :class:`aiohttp.ClientSession` is shared per event loop.
+    Call :func:`close_async_session` to apply new options to current loop.
+
+    Args:
+        limit: Max number of simultaneous connections.
+        limit_per_host: Max number of simultaneous connections to one host.
+        max_retries: Max number of retries for failed GET request
+            (connection errors, timeouts and 429/5xx responses).
+        backoff_factor: Base of exponential backoff between retries, in seconds.
+    """
+    _async_options.update(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        max_retries=max_retries,
+        backoff_factor=backoff_factor,
+    )
+
+
+def get_async_session() -> aiohttp.ClientSession:
+    """Get async HTTP session shared within running event loop.
+
+    Must be called from a coroutine. The session is closed when
+    :func:`asyncio.run` shuts the loop down; loops driven by hand must
+    call :func:`close_async_session` before closing.
+    """
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    session = _async_sessions.get(loop)
+    if session is None or session.closed:
+        old_closer = _async_session_closers.get(loop)
+        if old_closer is not None:
+            old_closer.cancel()
+        connector = aiohttp.TCPConnector(
+            limit=_async_options['limit'],
+            limit_per_host=_async_options['limit_per_host'],
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        _async_sessions[loop] = session
+        _async_session_closers[loop] = loop.create_task(_close_on_cancel(session))
+    return session
+
+
+async def _close_on_cancel(session: aiohttp.ClientSession) -> None:
+    """Wait until cancelled, then close session.
+
+    :func:`asyncio.run` cancels and awaits all pending tasks before closing
+    the loop, so this is the shutdown hook of the session.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.create_future()
+    finally:
+        if _async_sessions.get(loop) is session:
+            del _async_sessions[loop]
+            _async_session_closers.pop(loop, None)
+        await session.close()
+
+
+async def close_async_session() -> None:
+    """Close async HTTP session of running event loop, if any."""
+    loop = asyncio.get_running_loop()
+    closer = _async_session_closers.pop(loop, None)
+    session = _async_sessions.pop(loop, None)
+    if closer is not None:
+        closer.cancel()
+    if session is not None:
+        await session.close()
+
+
+def _async_backoff_time(attempt: int) -> float:
+    return random.uniform(0, _async_options['backoff_factor'] * 2**attempt)
+
+
+async def _async_get_json_conditional(
+    url: str,
+    etag: str | None,
+    last_modified: str | None,
+    timeout: _Timeout | None = None,
+) -> tuple[Any, str | None, str | None]:
+    import aiohttp
+
+    timeout = timeout or DEFAULT_TIMEOUT
+    connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+    client_timeout = aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+    headers = _conditional_headers(etag, last_modified)
+    max_retries = _async_options['max_retries']
+
+    session = get_async_session()
+    attempt = 0
+    while True:
+        try:
+            async with session.get(
+                url, headers=headers, timeout=client_timeout
+            ) as response:
+                if response.status == 304:
+                    return None, etag, last_modified
+                if response.status not in _RETRY_STATUSES or attempt >= max_retries:
+                    response.raise_for_status()
+                    return (
+                        await response.json(content_type=None),
+                        response.headers.get('ETag'),
+                        response.headers.get('Last-Modified'),
+                    )
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            if attempt >= max_retries:
+                raise
+        await asyncio.sleep(_async_backoff_time(attempt))
+        attempt += 1
+
+
+async def _async_get_json(url: str, timeout: _Timeout | None = None) -> Any:
+    data, _, _ = await _async_get_json_conditional(url, None, None, timeout)
+    return data
+
+
+async def _async_get_store_json(
+    url: str, parse: Callable[[Any], Any] = lambda data: data
+) -> Any:
+    cache = DISK_CACHE
+    if cache is None:
+        return parse(await _async_get_json(url))
+    return await cache.async_get(url, _async_get_json_conditional, parse)
+
+
+async def _gather_limited(
+    awaitables: Iterable[Awaitable[_T]], concurrency: int
+) -> list[_T]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(aw: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await aw
+
+    return list(await asyncio.gather(*map(run, awaitables)))
+
+
+async def async_get_abi(
+    network: str,
+    version: str,
+    bridge_type: str,
+    contract_name: str,
+    base_url: str | None = None,
+) -> dict[str, Any]:
+    """Get ABI dict for contract (async version of :func:`get_abi`)."""
+    url = _create_abi_url(network, version, bridge_type, contract_name, base_url)
+    return await _async_get_store_json(url, operator.itemgetter('abi'))
+
+
+async def async_get_address(
+    network: str, version: str, base_url: str | None = None
+) -> dict[str, Any]:
+    """Fetch contract addresses (async version of :func:`get_address`)."""
+    return await _async_get_store_json(_create_address_url(network, version, base_url))
+
+
+async def async_get_block_included(
+    network: str, block_number: int, base_url: str | None = None
+) -> CheckpointedBlock:
+    """Get block information (async version of :func:`get_block_included`)."""
+    url = _create_block_included_url(network, block_number, base_url)
+    return _parse_block_included(await _async_get_json(url))
+
+
+async def async_get_proof(
+    network: str, start: int, end: int, block_number: int, base_url: str | None = None
+) -> bytes:
+    """Get proof from API (async version of :func:`get_proof`)."""
+    url = _create_fast_proof_url(network, start, end, block_number, base_url)
+    return _parse_proof(await _async_get_json(url))
+
+
+async def async_get_abis(
+    network: str,
+    version: str,
+    contracts: Iterable[tuple[str, str]],
+    base_url: str | None = None,
+    *,
+    concurrency: int = 10,
+) -> dict[tuple[str, str], dict[str, Any]]:
+    """Fetch many ABI dicts concurrently.
+
+    Args:
+        network: Network name.
+        version: Network version.
+        contracts: ``(bridge_type, contract_name)`` pairs.
+        base_url: ABI store URL.
+        concurrency: Max number of requests in flight.
+
+    Returns:
+        Mapping from ``(bridge_type, contract_name)`` to ABI.
+    """
+    keys = list(dict.fromkeys(contracts))
+    abis = await _gather_limited(
+        (async_get_abi(network, version, *key, base_url) for key in keys),
+        concurrency,
+    )
+    return dict(zip(keys, abis))
+
+
+async def async_get_blocks_included(
+    network: str,
+    block_numbers: Iterable[int],
+    base_url: str | None = None,
+    *,
+    concurrency: int = 10,
+) -> list[CheckpointedBlock]:
+    """Get information about many blocks concurrently.
+
+    Args:
+        network: Network name.
+        block_numbers: Numbers of blocks to look up.
+        base_url: Proof API URL.
+        concurrency: Max number of requests in flight.
+
+    Returns:
+        Block information, in the order of ``block_numbers``.
+    """
+    return await _gather_limited(
+        (async_get_block_included(network, n, base_url) for n in block_numbers),
+        concurrency,
     )
-    return bytes.fromhex(removeprefix(requests.get(url).json()['proof'], '0x'))
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable
 
 import sha3  # pysha3
 
-from matic.abstracts import BaseWeb3Client
-from matic.web3_client import Web3Client as Web3ClientClass
+from matic.utils.lazy_import import lazy_attributes
+
+if TYPE_CHECKING:
+    from matic.abstracts import BaseWeb3Client
 
 __all__ = ['keccak256', 'resolve', 'Web3Client']
 
@@ -43,5 +45,10 @@ def resolve(obj: dict[str, Any], path: str | Iterable[str]) -> Any:
     return obj
 
 
-Web3Client: type[BaseWeb3Client] = Web3ClientClass
-"""This can be assigned to use any other client class."""
+Web3Client: type[BaseWeb3Client]
+"""This can be assigned to use any other client class.
+
+Defaults to :class:`matic.web3_client.Web3Client` (imported on first access).
+"""
+
+__getattr__, __dir__ = lazy_attributes(__name__, {'Web3Client': 'matic.web3_client'})
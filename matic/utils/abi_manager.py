@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Final
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Final, Iterable, cast
 
 from typing_extensions import TypedDict
 
-from matic.services import get_abi, get_address
+from matic import services
 from matic.utils import resolve
+from matic.utils.abi_snapshot import load_snapshot
 
 
 class _CacheItem(TypedDict):
@@ -16,16 +19,44 @@ class _CacheItem(TypedDict):
 CACHE: dict[tuple[str, str], _CacheItem] = {}
 DEFAULT_BRIDGE_TYPE: Final = 'plasma'
 
+# In-flight ABI requests: (network, version, bridge_type, contract_name) -> result
+_PENDING: dict[tuple[str, str, str, str], Future[dict[str, Any]]] = {}
+_PENDING_LOCK = threading.Lock()
+
 
 class ABIManager:
-    """Caching manager for fetched contract ABI dicts."""
+    """Caching manager for fetched contract ABI dicts.
+
+    Addresses and ABIs are taken from (in order of preference):
+
+    - process-wide cache (if other manager for same network was created before);
+    - offline snapshot shipped with the package
+      (see :mod:`matic.utils.abi_snapshot`);
+    - ABI store (HTTP request), possibly through persistent disk cache
+      (see :func:`~matic.services.configure_disk_cache`).
 
-    def __init__(self, network_name: str, version: str) -> None:
+    Args:
+        network_name: Network name ('mainnet' or 'testnet').
+        version: Network version ('v1' or 'mumbai').
+        refresh: Ignore cache and snapshot and fetch addresses from ABI store.
+    """
+
+    def __init__(self, network_name: str, version: str, refresh: bool = False) -> None:
         self.network_name, self.version = network_name, version
 
-        addr = get_address(network_name, version)
-        CACHE[(network_name, version)] = {
-            'address': addr,
+        if refresh:
+            self.refresh()
+        elif (network_name, version) not in CACHE:
+            snapshot = load_snapshot(network_name, version)
+            if snapshot is None:
+                self.refresh()
+            else:
+                CACHE[(network_name, version)] = cast(_CacheItem, snapshot)
+
+    def refresh(self) -> None:
+        """Drop cached ABIs and re-fetch addresses from ABI store."""
+        CACHE[(self.network_name, self.version)] = {
+            'address': services.get_address(self.network_name, self.version),
             'abi': {},
         }
 
@@ -36,22 +67,89 @@ class ABIManager:
             path,
         )
 
+    def _get_cached_abi(
+        self, contract_name: str, bridge_type: str
+    ) -> dict[str, Any] | None:
+        return (
+            CACHE[(self.network_name, self.version)]['abi']
+            .get(bridge_type, {})
+            .get(contract_name)
+        )
+
+    def _load_abi(self, contract_name: str, bridge_type: str) -> dict[str, Any]:
+        """Fetch ABI, joining the request for same contract if it is in flight."""
+        key = (self.network_name, self.version, bridge_type, contract_name)
+        with _PENDING_LOCK:
+            abi = self._get_cached_abi(contract_name, bridge_type)
+            if abi is not None:
+                return abi
+            future = _PENDING.get(key)
+            is_owner = future is None
+            if future is None:
+                future = _PENDING[key] = Future()
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            abi = services.get_abi(
+                self.network_name, self.version, bridge_type, contract_name
+            )
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self.set_abi(contract_name, bridge_type, abi)
+            future.set_result(abi)
+            return abi
+        finally:
+            with _PENDING_LOCK:
+                del _PENDING[key]
+
     def get_abi(
         self, contract_name: str, bridge_type: str | None = None
     ) -> dict[str, Any]:
         """Get ABI dict for contract and memoise it."""
         bridge_type = bridge_type or DEFAULT_BRIDGE_TYPE
-        abi = (
-            CACHE[(self.network_name, self.version)]['abi']
-            .get(bridge_type, {})
-            .get(contract_name)
-        )
+        abi = self._get_cached_abi(contract_name, bridge_type)
         if abi is not None:
             return abi
+        return self._load_abi(contract_name, bridge_type)
 
-        abi = get_abi(self.network_name, self.version, bridge_type, contract_name)
-        self.set_abi(contract_name, bridge_type, abi)
-        return abi
+    def prefetch(
+        self, contracts: Iterable[tuple[str | None, str]], max_workers: int = 8
+    ) -> list[Future[dict[str, Any]]]:
+        """Start fetching ABIs of given contracts concurrently.
+
+        Requests run in background threads. Any :meth:`get_abi` call for
+        a contract being fetched waits for that request instead of sending
+        another one.
+
+        Args:
+            contracts: ``(bridge_type, contract_name)`` pairs.
+            max_workers: Max number of requests in flight.
+
+        Returns:
+            Futures resolving to ABI dicts (only for contracts not cached yet).
+        """
+        missing = [
+            (bridge_type or DEFAULT_BRIDGE_TYPE, name)
+            for bridge_type, name in dict.fromkeys(contracts)
+            if self._get_cached_abi(name, bridge_type or DEFAULT_BRIDGE_TYPE) is None
+        ]
+        if not missing:
+            return []
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(max_workers, len(missing)),
+            thread_name_prefix='matic-abi',
+        )
+        futures = [
+            executor.submit(self._load_abi, name, bridge_type)
+            for bridge_type, name in missing
+        ]
+        executor.shutdown(wait=False)
+        return futures
 
     def set_abi(
         self, contract_name: str, bridge_type: str, abi: dict[str, Any]
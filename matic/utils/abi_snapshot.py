@@ -0,0 +1,171 @@
+"""Offline snapshot of ABI store shipped with the package.
+
+Snapshot is a set of gzipped JSON files (one per network),
+each holding contract addresses and ABIs of all contracts this library uses.
+It allows :class:`~matic.utils.abi_manager.ABIManager` to start
+without any HTTP requests for known networks.
+
+Snapshot is generated before release with::
+
+    python -m matic.utils.abi_snapshot
+
+It fails (and so does the release) if some network or contract is missing.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Final, Iterable
+
+from matic import services
+
+__all__ = [
+    'KNOWN_NETWORKS',
+    'SNAPSHOT_CONTRACTS',
+    'SNAPSHOT_DIR',
+    'SNAPSHOT_FORMAT',
+    'build_snapshot',
+    'check_snapshot',
+    'load_snapshot',
+    'write_snapshot',
+]
+
+SNAPSHOT_FORMAT: Final = 1
+"""Version of snapshot file layout. Files with other version are ignored."""
+
+SNAPSHOT_DIR: Path = Path(__file__).resolve().parent.parent / 'abi_snapshot'
+"""Directory with snapshot files."""
+
+KNOWN_NETWORKS: Final = (('mainnet', 'v1'), ('testnet', 'mumbai'))
+"""``(network, version)`` pairs included into snapshot."""
+
+SNAPSHOT_CONTRACTS: Final = (
+    ('genesis', 'StateReceiver'),
+    ('plasma', 'ChildERC20'),
+    ('plasma', 'ChildERC721'),
+    ('plasma', 'DepositManager'),
+    ('plasma', 'ERC20Predicate'),
+    ('plasma', 'ERC721Predicate'),
+    ('plasma', 'MRC20'),
+    ('plasma', 'Registry'),
+    ('plasma', 'RootChain'),
+    ('plasma', 'WithdrawManager'),
+    ('pos', 'ChildERC20'),
+    ('pos', 'ChildERC721'),
+    ('pos', 'ChildERC1155'),
+    ('pos', 'RootChainManager'),
+)
+"""``(bridge_type, contract_name)`` pairs included into snapshot."""
+
+
+def _snapshot_path(network: str, version: str, directory: Path | None = None) -> Path:
+    return (directory or SNAPSHOT_DIR) / f'{network}-{version}.json.gz'
+
+
+def load_snapshot(
+    network: str, version: str, directory: Path | None = None
+) -> dict[str, Any] | None:
+    """Load snapshot of given network, if available.
+
+    Snapshot is ignored if it was taken from ABI store other than
+    :data:`~matic.services.DEFAULT_ABI_STORE_URL` or has unknown format.
+
+    Returns:
+        Dictionary with keys ``address`` and ``abi``
+        (``{bridge_type: {contract_name: abi}}``) or ``None``.
+    """
+    try:
+        with gzip.open(_snapshot_path(network, version, directory), 'rt') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        data.get('format') != SNAPSHOT_FORMAT
+        or data.get('source') != services.DEFAULT_ABI_STORE_URL
+    ):
+        return None
+    return {'address': data['address'], 'abi': data['abi']}
+
+
+def build_snapshot(
+    network: str,
+    version: str,
+    contracts: Iterable[tuple[str, str]] = SNAPSHOT_CONTRACTS,
+) -> dict[str, Any]:
+    """Download addresses and ABIs of given network from ABI store."""
+    abi: dict[str, dict[str, Any]] = {}
+    for bridge_type, name in contracts:
+        abi.setdefault(bridge_type, {})[name] = services.get_abi(
+            network, version, bridge_type, name
+        )
+    return {
+        'format': SNAPSHOT_FORMAT,
+        'source': services.DEFAULT_ABI_STORE_URL,
+        'created_at': int(time.time()),
+        'address': services.get_address(network, version),
+        'abi': abi,
+    }
+
+
+def write_snapshot(
+    network: str,
+    version: str,
+    directory: Path | None = None,
+    contracts: Iterable[tuple[str, str]] = SNAPSHOT_CONTRACTS,
+) -> Path:
+    """Build snapshot of given network and save it to disk.
+
+    Returns:
+        Path of written file.
+    """
+    data = build_snapshot(network, version, contracts)
+    path = _snapshot_path(network, version, directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+    with gzip.open(tmp, 'wt') as f:
+        json.dump(data, f, separators=(',', ':'), sort_keys=True)
+    tmp.replace(path)
+    return path
+
+
+def check_snapshot(
+    network: str,
+    version: str,
+    directory: Path | None = None,
+    contracts: Iterable[tuple[str, str]] = SNAPSHOT_CONTRACTS,
+) -> None:
+    """Check that snapshot of given network is usable and complete.
+
+    Raises:
+        ValueError: if snapshot cannot be loaded or misses addresses or ABIs.
+    """
+    data = load_snapshot(network, version, directory)
+    if data is None:
+        raise ValueError(f'No usable snapshot of {network}/{version}.')
+    if not data['address']:
+        raise ValueError(f'Snapshot of {network}/{version} has no addresses.')
+    missing = [
+        f'{bridge_type}/{name}'
+        for bridge_type, name in contracts
+        if not data['abi'].get(bridge_type, {}).get(name)
+    ]
+    if missing:
+        raise ValueError(f'Snapshot of {network}/{version} misses ABIs: {missing}.')
+
+
+def main() -> None:
+    """Regenerate snapshot files for all known networks, fail if incomplete."""
+    for network, version in KNOWN_NETWORKS:
+        path = write_snapshot(network, version)
+        check_snapshot(network, version)
+        print(f'{network}/{version}: {path}', file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
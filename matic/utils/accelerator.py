@@ -0,0 +1,200 @@
+"""Fee bumping of stuck transactions.
+
+A transaction sent with too low fee stays pending until fees drop, which
+may take long. :class:`Accelerator` watches transactions sent with
+:meth:`~matic.utils.base_token.BaseToken.process_write` and replaces those
+pending for ``after_blocks`` blocks with the same transaction paying more
+(replace-by-fee: same nonce, fees raised by ``bump_percent``, at least the
+current suggestion of the fee oracle). Replacements are limited by
+``max_bumps`` and ``fee_cap``.
+
+Enable it with ``accelerate_after_blocks`` key of parent or child config::
+
+    pos_client = POSClient({'parent': {..., 'accelerate_after_blocks': 3}, ...})
+    result = pos_client.erc_20(token, True).withdraw_exit(burn_tx_hash)
+    result.get_receipt()  # receipt of the transaction that was mined
+
+The result tracks all replacements (see
+:meth:`~matic.json_types.ITransactionWriteResult.add_replacement`): its
+hash is the hash of the mined transaction once receipt is known.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Final, cast
+
+import matic
+from matic.abstracts import BaseWeb3Client
+from matic.json_types import ITransactionRequestConfig, ITransactionWriteResult
+
+__all__ = [
+    'DEFAULT_BUMP_PERCENT',
+    'DEFAULT_MAX_BUMPS',
+    'DEFAULT_POLL_INTERVAL',
+    'MIN_BUMP_PERCENT',
+    'Accelerator',
+]
+
+DEFAULT_BUMP_PERCENT: Final = 15
+"""Fee increase (in percents) of replacement."""
+
+MIN_BUMP_PERCENT: Final = 10
+"""Min fee increase (in percents) of replacement accepted by nodes."""
+
+DEFAULT_MAX_BUMPS: Final = 5
+"""Max number of replacements of one transaction."""
+
+DEFAULT_POLL_INTERVAL: Final = 1.0
+"""Time (in seconds) between checks for new blocks."""
+
+_FEE_KEYS: Final = ('gas_price', 'max_fee_per_gas', 'max_priority_fee_per_gas')
+
+
+@dataclass
+class _Tracked:
+    result: ITransactionWriteResult
+    private_key: str | None
+    sent_at: int | None = None
+    """Block number the last transaction was seen pending at first."""
+    bumps: int = 0
+
+
+class Accelerator:
+    """Thread-safe fee bumper of pending transactions on one chain.
+
+    Background thread runs only while there are tracked transactions.
+
+    Args:
+        client: Client of the chain.
+        after_blocks: Number of blocks without inclusion before replacement.
+        bump_percent: Fee increase (in percents) of every replacement.
+        max_bumps: Max number of replacements of one transaction.
+        fee_cap: Max fee per gas (in wei) replacement may pay (no cap if missing).
+        poll_interval: Time (in seconds) between checks for new blocks.
+    """
+
+    def __init__(
+        self,
+        client: BaseWeb3Client,
+        after_blocks: int,
+        bump_percent: int = DEFAULT_BUMP_PERCENT,
+        max_bumps: int = DEFAULT_MAX_BUMPS,
+        fee_cap: int | None = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        if after_blocks < 1:
+            raise ValueError('after_blocks must be positive.')
+        self.client = client
+        self.after_blocks = after_blocks
+        self.bump_percent = bump_percent
+        self.max_bumps = max_bumps
+        self.fee_cap = fee_cap
+        self.poll_interval = poll_interval
+        self._tracked: list[_Tracked] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._tracked)
+
+    def track(
+        self, result: ITransactionWriteResult, private_key: str | None = None
+    ) -> None:
+        """Replace transaction with higher fees while it is pending.
+
+        Args:
+            result: Result of sent transaction (its config must be complete).
+            private_key: Sender private key
+                (replacements are signed by provider if missing).
+        """
+        tracked = _Tracked(result, private_key)
+        with self._lock:
+            self._tracked.append(tracked)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='matic-accelerator', daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.poll_interval)
+            try:
+                self._check()
+            except Exception as e:  # noqa: PIE786
+                matic.logger.warning('Failed to check pending transactions: %r', e)
+            with self._lock:
+                if not self._tracked:
+                    self._thread = None
+                    return
+
+    def _check(self) -> None:
+        with self._lock:
+            self._tracked = [
+                tracked
+                for tracked in self._tracked
+                if tracked.bumps < self.max_bumps and not tracked.result.done()
+            ]
+            tracked_now = list(self._tracked)
+
+        block_number = self.client.get_block_number()
+        for tracked in tracked_now:
+            if tracked.sent_at is None:
+                tracked.sent_at = block_number
+            elif block_number - tracked.sent_at >= self.after_blocks:
+                tracked.sent_at = block_number
+                tracked.bumps += 1
+                self._replace(tracked)
+
+    def _replace(self, tracked: _Tracked) -> None:
+        result = tracked.result
+        config = self.bump_fees(result.transaction_config)
+        if config is None:
+            # Fees cannot be raised (cap is reached or they are unknown)
+            tracked.bumps = self.max_bumps
+            return
+
+        try:
+            if tracked.private_key:
+                raw = self.client.sign_transaction(config, tracked.private_key)
+                replacement = self.client.send_raw_transaction(raw, config)
+            else:
+                replacement = self.client.write(config)
+        except Exception as e:  # noqa: PIE786
+            # E.g. "nonce too low": the previous one is mined already
+            matic.logger.warning('Failed to replace transaction: %r', e)
+            return
+        matic.logger.info('replaced pending transaction, config: %s', config)
+        result.add_replacement(replacement.transaction_hash, config)
+
+    def bump_fees(
+        self, config: ITransactionRequestConfig
+    ) -> ITransactionRequestConfig | None:
+        """Get config of replacement transaction (None if fees cannot be raised)."""
+        current = cast('dict[str, int | None]', config)
+        fees = {key: fee for key in _FEE_KEYS if (fee := current.get(key))}
+        suggestion: dict[str, int]
+        if 'gas_price' in fees:
+            suggestion = {'gas_price': self.client.gas_price}
+        else:
+            suggestion = cast('dict[str, int]', self.client.get_fee_suggestion() or {})
+
+        new_fees = {}
+        for key, fee in fees.items():
+            bumped = fee * (100 + self.bump_percent) // 100
+            new_fee = max(bumped, suggestion.get(key, 0))
+            if self.fee_cap is not None:
+                new_fee = min(new_fee, self.fee_cap)
+            # Nodes reject replacements that do not raise all fees enough
+            if new_fee < fee * (100 + MIN_BUMP_PERCENT) // 100:
+                return None
+            new_fees[key] = new_fee
+        if not new_fees:
+            return None
+
+        new_config = cast('dict[str, Any]', config.copy())
+        new_config.update(new_fees)
+        return cast(ITransactionRequestConfig, new_config)
@@ -1,7 +1,20 @@
 from __future__ import annotations
 
-from typing import Any, Generic, TypeVar, cast
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Generator,
+    Generic,
+    Iterable,
+    Iterator,
+    TypeVar,
+    cast,
+)
 
+from eth_account import Account
 from eth_typing import HexAddress
 
 import matic
@@ -13,12 +26,19 @@ from matic.exceptions import (
 )
 from matic.json_types import (
     IBaseClientConfig,
+    IFeeSuggestion,
     ITransactionOption,
     ITransactionRequestConfig,
     ITransactionWriteResult,
 )
+from matic.utils.bulk_sender import DEFAULT_MAX_IN_FLIGHT, BulkSender
+from matic.utils.gas_estimator import is_gas_error
+from matic.utils.multicall import DEFAULT_CHUNK_SIZE
 from matic.utils.web3_side_chain_client import Web3SideChainClient
 
+if TYPE_CHECKING:
+    from matic.web3_client.signing_pool import SigningPool
+
 _C = TypeVar('_C', bound=IBaseClientConfig)
 
 
@@ -75,25 +95,172 @@ class BaseToken(Generic[_C]):
         Args:
             method: Method instance (with arguments passed on instantiation)
             option: Additional parameters.
-                May contain special key ``return_transaction`` (see Returns section)
+                May contain special keys ``return_transaction`` (see Returns section)
+                and ``use_signer_pool`` (see :mod:`matic.utils.signer_pool`).
             private_key: Sender private key
-                (may be missing, if your provider supports implicit tx signing)
+                (may be missing, if your provider supports implicit tx signing
+                or signer pool is used)
 
         Returns:
             ITransactionWriteResult if actual write was performed;
                 ITransactionRequestConfig if `return_transaction=True`.
                 (builds the final transaction dictionary and returns it).
+
+        Raises:
+            ValueError: if signer pool is requested, but cannot be used.
         """
         return_tx = bool(option and option.pop('return_transaction', False))
+        if option and option.pop('use_signer_pool', False):
+            pool = self.client.get_signer_pool(self.is_parent)
+            if pool is None:
+                raise ValueError('Signer pool is used, but chain has no "signers".')
+            if private_key or return_tx or 'from' in option:
+                raise ValueError(
+                    'Signer pool cannot be used with private key, "from"'
+                    ' or "return_transaction".'
+                )
+
+            def send(address: HexAddress, key: str) -> ITransactionWriteResult:
+                tx_config = cast(
+                    ITransactionOption, {**(option or {}), 'from': address}
+                )
+                return self.process_write(method, tx_config, key)
+
+            return pool.write(send)
+
+        try:
+            result = self._write(method, option, private_key, return_tx)
+        except Exception as e:  # noqa: PIE786
+            cache = self.client.get_gas_estimate_cache(self.is_parent)
+            if (
+                return_tx
+                or (option and option.get('gas_limit'))
+                or cache is None
+                or not is_gas_error(e)
+                or not cache.invalidate(method)
+            ):
+                raise
+            # Rejected, not broadcast: estimate live (reverts are raised)
+            matic.logger.info('Write with cached gas estimate failed: %r', e)
+            result = self._write(method, option, private_key, return_tx)
+
+        accelerator = self.client.get_accelerator(self.is_parent)
+        if accelerator is not None and not return_tx:
+            accelerator.track(result, private_key)
+        return result
+
+    def _write(
+        self,
+        method: BaseContractMethod,
+        option: ITransactionOption | None,
+        private_key: str | None,
+        return_tx: bool,
+    ) -> ITransactionWriteResult:
         config = self.create_transaction_config(
             tx_config=option,
             is_write=True,
             method=method,
             is_parent=self.is_parent,
+            reserve_nonce=not return_tx,
         )
 
         matic.logger.info('process write config: %s', config)
-        return method.write(config, private_key, return_tx)
+        with self._track_nonce(config):
+            return method.write(config, private_key, return_tx)
+
+    def process_write_many(
+        self,
+        methods: Iterable[BaseContractMethod],
+        private_key: str,
+        option: ITransactionOption | None = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        signing_pool: SigningPool | None = None,
+    ) -> list[ITransactionWriteResult]:
+        """Perform many write operations, pipelining them.
+
+        See :mod:`matic.utils.bulk_sender` for details.
+
+        Args:
+            methods: Method instances (with arguments passed on instantiation).
+            private_key: Sender private key (transactions are signed locally).
+            option: Additional parameters common for all transactions.
+            max_in_flight: Max number of transactions being prepared or sent at once.
+            signing_pool: Pool of processes to sign transactions in.
+
+        Returns:
+            Results of all transactions, in order of input.
+
+        Raises:
+            BulkSendException: if some transactions were not sent.
+        """
+        sender = BulkSender(self, private_key, max_in_flight, signing_pool)
+        return sender.send(methods, option)
+
+    def sign_write(
+        self,
+        method: BaseContractMethod,
+        option: ITransactionOption,
+        private_key: str,
+    ) -> bytes:
+        """Build and sign write transaction offline (with zero network calls).
+
+        Transaction can be broadcast later with
+        :meth:`~matic.abstracts.BaseWeb3Client.send_raw_transaction`.
+
+        Args:
+            method: Method instance (with arguments passed on instantiation).
+            option: Fully specified parameters (merged with default config):
+                ``nonce``, ``gas_limit``, ``chain_id`` and ``gas_price``
+                or both EIP-1559 fees. Sender is always the owner of the key.
+            private_key: Sender private key.
+
+        Returns:
+            Signed raw transaction.
+
+        Raises:
+            ValueError: if transaction parameters are not fully specified.
+            EIP1559NotSupportedException: if EIP-1559 fees are given, but
+                chain does not support them.
+        """
+        config = self.create_offline_transaction_config(option, self.is_parent)
+        # Signer is the sender, whatever default config says
+        config['from'] = Account.from_key(private_key).address
+        client = self.get_client(self.is_parent)
+        return client.sign_transaction(method.build_transaction(config), private_key)
+
+    def create_offline_transaction_config(
+        self, tx_config: ITransactionOption, is_parent: bool
+    ) -> ITransactionRequestConfig:
+        """Merge default config in and check that nothing has to be looked up.
+
+        Raises:
+            ValueError: if nonce, gas limit, chain id or fees are missing.
+            EIP1559NotSupportedException: if EIP-1559 fees are given, but
+                chain does not support them.
+        """
+        merged_config: dict[str, Any] = dict(self.client.get_default_config(is_parent))
+        merged_config.update(tx_config)
+        merged_config.pop('return_transaction', None)
+        merged_config.pop('use_signer_pool', None)
+        config = cast(ITransactionRequestConfig, merged_config)
+
+        missing = [
+            key for key in ('nonce', 'gas_limit', 'chain_id') if config.get(key) is None
+        ]
+        is_max_fee_provided = (
+            config.get('max_fee_per_gas') is not None
+            and config.get('max_priority_fee_per_gas') is not None
+        )
+        if config.get('gas_price') is None and not is_max_fee_provided:
+            missing.append('gas_price or max_fee_per_gas/max_priority_fee_per_gas')
+        if missing:
+            raise ValueError(
+                f'Offline transaction is not fully specified, missing: {missing}.'
+            )
+        # Known from network config loaded on client creation: no requests
+        if is_max_fee_provided and not self.client.is_eip_1559_supported(is_parent):
+            raise EIP1559NotSupportedException
+        return config
 
     def send_transaction(
         self,
@@ -110,11 +277,28 @@ class BaseToken(Generic[_C]):
             is_write=True,
             method=None,
             is_parent=self.is_parent,
+            reserve_nonce=not return_tx,
         )
 
         matic.logger.info('process write config: %s', config)
 
-        return client.write(config, private_key, return_tx)
+        with self._track_nonce(config):
+            return client.write(config, private_key, return_tx)
+
+    @contextmanager
+    def _track_nonce(self, config: ITransactionRequestConfig) -> Iterator[None]:
+        """Commit nonce reserved for config if sending succeeds, release otherwise."""
+        manager = self.client.get_nonce_manager(self.is_parent)
+        if manager is None or not manager.is_reserved(config['from'], config['nonce']):
+            yield
+            return
+
+        try:
+            yield
+        except BaseException as e:
+            manager.release(config['from'], config['nonce'], e)
+            raise
+        manager.commit(config['from'], config['nonce'])
 
     def read_transaction(self, option: ITransactionOption | None = None) -> Any:
         """Send read (non-modifying) transaction without RPC method.
@@ -150,14 +334,26 @@ class BaseToken(Generic[_C]):
         Args:
             method: Method instance (with arguments passed on instantiation)
             option: Additional parameters.
-                May contain special key ``return_transaction`` (see Returns section)
+                May contain special keys ``return_transaction`` (see Returns section)
+                and ``block_identifier`` (block to read state at).
 
         Returns:
             ITransactionWriteResult if actual write was performed;
                 ITransactionRequestConfig if `return_transaction=True`.
                 (builds the final transaction dictionary and returns it).
+                Inside ``multicall()`` block (see :mod:`matic.utils.multicall`)
+                the read is queued and future of its result is returned.
         """
         return_tx = bool(option and option.pop('return_transaction', False))
+        block = option.pop('block_identifier', None) if option else None
+        multicall = self.client.get_active_multicall(self.is_parent)
+        if (
+            multicall is not None
+            and not return_tx
+            and block in (None, multicall.block_identifier)
+        ):
+            return multicall.add(method)
+
         config = self.create_transaction_config(
             tx_config=option,
             is_write=False,
@@ -166,7 +362,62 @@ class BaseToken(Generic[_C]):
         )
         matic.logger.info('read tx config created: %s', config)
 
-        return method.read(config, return_tx)
+        # Custom methods may not accept block_identifier: passed only if pinned
+        if block is None:
+            return method.read(config, return_tx)
+        return method.read(config, return_tx, block_identifier=block)
+
+    def resolve_read(self, result: Any) -> Any:
+        """Get value of :meth:`process_read` result.
+
+        If the read was queued to multicall, queue is sent first.
+        """
+        if not isinstance(result, Future):
+            return result
+        multicall = self.client.get_active_multicall(self.is_parent)
+        if multicall is not None:
+            multicall.flush()
+        return result.result()
+
+    def iter_reads(
+        self,
+        read: Callable[[int], Any],
+        count: int,
+        page_size: int = DEFAULT_CHUNK_SIZE,
+        concurrency: int | None = None,
+    ) -> Generator[Any, None, None]:
+        """Perform ``read(i)`` for every ``i`` in ``range(count)``, yield in order.
+
+        Reads are done by pages. Every page is one multicall (see
+        :meth:`~matic.utils.web3_side_chain_client.Web3SideChainClient.multicall`),
+        or, if ``concurrency`` is given, reads of a page are run by that many
+        threads. Only one page is held in memory, iteration can be stopped early.
+        If Multicall3 is not deployed on the chain, reads are done one by one.
+
+        Args:
+            read: Function reading by index (usually with :meth:`process_read`).
+            count: Number of reads.
+            page_size: Number of reads in one page.
+            concurrency: Number of threads (use them instead of multicall).
+        """
+        pages = (
+            range(start, min(start + page_size, count))
+            for start in range(0, count, page_size)
+        )
+        if concurrency is not None:
+            with ThreadPoolExecutor(concurrency) as executor:
+                for page in pages:
+                    yield from list(executor.map(read, page))
+            return
+        if not self.client.has_multicall(self.is_parent):
+            yield from map(read, range(count))
+            return
+
+        for page in pages:
+            with self.client.multicall(self.is_parent, page_size):
+                results = [read(i) for i in page]
+            for result in results:
+                yield result.result() if isinstance(result, Future) else result
 
     def get_client(self, is_parent: bool) -> BaseWeb3Client:
         """Get web3 client instance."""
@@ -178,28 +429,53 @@ class BaseToken(Generic[_C]):
         client = self.get_client(is_parent)
         return client.get_contract(token_address, abi)
 
+    def _estimate_method_gas(
+        self,
+        method: BaseContractMethod,
+        config: ITransactionRequestConfig,
+        is_parent: bool,
+    ) -> int:
+        cache = self.client.get_gas_estimate_cache(is_parent)
+        if cache is None:
+            return method.estimate_gas(config)
+        return cache.estimate(method, config)
+
+    def _submit_fee_suggestion(
+        self, tx_config: ITransactionRequestConfig, is_parent: bool
+    ) -> Future[IFeeSuggestion | None] | None:
+        is_eip_1559_supported = self.client.is_eip_1559_supported(is_parent)
+        is_max_fee_provided = tx_config.get('max_fee_per_gas') or tx_config.get(
+            'max_priority_fee_per_gas'
+        )
+
+        if not is_eip_1559_supported and is_max_fee_provided:
+            raise EIP1559NotSupportedException
+        if not is_eip_1559_supported or is_max_fee_provided or 'gas_price' in tx_config:
+            return None
+        # Suggested fees are usually served from memory, see FeeOracle
+        client = self.get_client(is_parent)
+        return self.client.executor.submit(client.get_fee_suggestion)
+
     def create_transaction_config(
         self,
         tx_config: ITransactionRequestConfig | None,
         method: BaseContractMethod | None,
         is_parent: bool,
         is_write: bool,
+        reserve_nonce: bool = False,
+        fill_nonce: bool = True,
     ) -> ITransactionRequestConfig:
         """Fill in missing fields in transaction request.
 
+        If ``reserve_nonce`` is set and chain has nonce manager
+        (see :mod:`matic.utils.nonce_manager`), missing nonce is reserved there.
+        Caller must commit or release it. Missing nonce is left as is
+        if ``fill_nonce`` is not set.
+
         Warning: this method may raise if your transaction cannot be executed,
             pass ``gas_limit`` to prevent it from happening.
         """
-        if is_parent:
-            default_config = (  # type: ignore[attr-defined]
-                self.client.config.get('parent') or {}
-            ).get('default_config')
-        else:
-            default_config = (  # type: ignore[attr-defined]
-                self.client.config.get('child') or {}
-            ).get('default_config')
-
-        merged_config = dict(default_config or {})
+        merged_config = dict(self.client.get_default_config(is_parent))
         merged_config.update(tx_config or {})
 
         tx_config = cast(ITransactionRequestConfig, merged_config)
@@ -212,29 +488,40 @@ class BaseToken(Generic[_C]):
         def estimate_gas(config: ITransactionRequestConfig) -> int:
             if method:
                 config.pop('value', None)  # already registered on method => ignored
-                return method.estimate_gas(config)
+                return self._estimate_method_gas(method, config, is_parent)
             else:
                 return client.estimate_gas(config)
 
         if not is_write:
             return tx_config
 
-        is_eip_1559_supported = self.client.is_eip_1559_supported(is_parent)
-        is_max_fee_provided = tx_config.get('max_fee_per_gas') or tx_config.get(
-            'max_priority_fee_per_gas'
-        )
+        fees = self._submit_fee_suggestion(tx_config, is_parent)
 
-        if not is_eip_1559_supported and is_max_fee_provided:
-            raise EIP1559NotSupportedException
+        nonce_manager = self.client.get_nonce_manager(is_parent)
+        if not (reserve_nonce and fill_nonce):
+            nonce_manager = None
+
+        # Independent lookups: pending nonce is fetched while gas is estimated
+        nonce: Future[int] | None = None
+        if tx_config.get('nonce') is None and nonce_manager is None and fill_nonce:
+            nonce = self.client.executor.submit(
+                client.get_transaction_count, tx_config['from'], 'pending'
+            )
 
         if not tx_config.get('gas_limit'):
             tx_config['gas_limit'] = estimate_gas(tx_config)
 
-        if not tx_config.get('nonce'):
-            tx_config['nonce'] = client.get_transaction_count(
-                tx_config['from'], 'pending'
-            )
         tx_config.setdefault('chain_id', client.chain_id)
+        suggestion = fees and fees.result()
+        if suggestion:
+            tx_config['max_fee_per_gas'] = suggestion['max_fee_per_gas']
+            priority_fee = suggestion['max_priority_fee_per_gas']
+            tx_config['max_priority_fee_per_gas'] = priority_fee
+        if nonce is not None:
+            tx_config['nonce'] = nonce.result()
+        elif tx_config.get('nonce') is None and nonce_manager is not None:
+            # Last step: nothing may fail after nonce is reserved
+            tx_config['nonce'] = nonce_manager.reserve(tx_config['from'])
 
         return tx_config
 
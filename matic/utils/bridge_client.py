@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from typing import Generic, TypeVar
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import ClassVar, Generic, Sequence, TypeVar
 
+from eth_typing import HexAddress
+
+import matic
 from matic.constants import POSLogEventSignature
 from matic.json_types import IBaseClientConfig
 from matic.utils.base_token import BaseToken
 from matic.utils.exit_util import ExitUtil
+from matic.utils.multicall import DEFAULT_CHUNK_SIZE
+from matic.utils.snapshot import PortfolioSnapshot
 from matic.utils.web3_side_chain_client import Web3SideChainClient
 
 _C = TypeVar('_C', bound=IBaseClientConfig)
@@ -21,14 +27,54 @@ class BridgeClient(Generic[_C]):
 
     Should be set after instantiation to prevent cycles.
     """
+    ABI_CONTRACTS: ClassVar[tuple[tuple[str, str], ...]] = (
+        ('genesis', 'StateReceiver'),
+    )
+    """``(bridge_type, contract_name)`` of contracts this client may use.
+
+    These are fetched on instantiation if ``prefetch`` option is set.
+    """
 
     def __init__(self, config: _C):
         self.client = Web3SideChainClient(config)
 
+        prefetch = config.get('prefetch')
+        if prefetch:
+            futures = self.client.abi_manager.prefetch(self.ABI_CONTRACTS)
+            if prefetch != 'background':
+                wait(futures)
+                for future in futures:
+                    # Failed ones will be retried (and raise) on first use
+                    if future.exception() is not None:
+                        matic.logger.warning(
+                            'ABI prefetch failed: %r', future.exception()
+                        )
+
     def is_checkpointed(self, tx_hash: bytes) -> bool:
         """Check if transaction is checkpointed."""
         return self.exit_util.is_checkpointed(tx_hash)
 
+    def snapshot_balances(
+        self,
+        users: Sequence[HexAddress],
+        parent_tokens: Sequence[HexAddress] = (),
+        child_tokens: Sequence[HexAddress] = (),
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> PortfolioSnapshot:
+        """Read ERC-20 balances of users on both chains.
+
+        Every chain is read at one (latest) block with Multicall3,
+        both chains are read concurrently. See :mod:`matic.utils.snapshot`.
+        """
+        with ThreadPoolExecutor(2) as executor:
+            parent = executor.submit(
+                self.client.snapshot_balances, parent_tokens, users, True, chunk_size
+            )
+            child = executor.submit(
+                self.client.snapshot_balances, child_tokens, users, False, chunk_size
+            )
+            return PortfolioSnapshot(parent=parent.result(), child=child.result())
+
     def is_deposited(self, deposit_tx_hash: bytes) -> bool:
         """Check if deposit has finished after exit (StateSynced happened)."""
         client = self.client
@@ -44,7 +90,9 @@ class BridgeClient(Generic[_C]):
         )
 
         receipt = client.parent.get_transaction_receipt(deposit_tx_hash)
-        last_state_id = token.process_read(token.contract.method('lastStateId'))
+        last_state_id = token.resolve_read(
+            token.process_read(token.contract.method('lastStateId'))
+        )
 
         event_signature = POSLogEventSignature.STATE_SYNCED_EVENT
         try:
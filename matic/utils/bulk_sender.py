@@ -0,0 +1,256 @@
+"""Pipelined sending of many transactions from one wallet.
+
+Sending transactions one by one waits for preparation requests (gas
+estimate, fees, nonce) and then for the send of each transaction.
+:class:`BulkSender` streams them through three overlapping stages instead:
+
+1. preparation of up to ``max_in_flight`` transactions at once
+   (in own thread pool, nonce is not requested);
+2. nonce reservation and local signing (in worker processes with
+   :class:`~matic.web3_client.signing_pool.SigningPool`), in order of input;
+3. sending of signed transactions in groups of ``max_in_flight``, in order
+   of nonces, while next ones are prepared. With
+   :class:`~matic.web3_client.batching.BatchingHTTPProvider` each group is
+   one JSON-RPC batch of ``eth_sendRawTransaction`` requests.
+
+Usually it is used via :meth:`~matic.utils.base_token.BaseToken.process_write_many`::
+
+    token = pos_client.erc_20(token_address)
+    methods = (token.contract.method('transfer', to, amount) for to in recipients)
+    results = token.process_write_many(methods, private_key)
+
+Nonces come from the nonce manager of the chain (see
+:mod:`matic.utils.nonce_manager`), a private one is used if it is disabled.
+Transactions are estimated against current state: a transaction depending
+on an earlier one from the same batch needs explicit ``gas_limit``.
+
+Nonces leave no gaps: after the first transaction that fails to be signed or
+sent, later ones are not sent and the nonce is resynced with the chain. With
+batching, the node may already have accepted later transactions of the failed
+group: they are reported as sent and are mined once the failed nonce is used
+again (e.g. by the next write).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Final, Iterable, Iterator, cast
+
+from eth_account import Account
+
+from matic.abstracts import BaseContractMethod
+from matic.exceptions import BulkSendException
+from matic.json_types import (
+    ITransactionOption,
+    ITransactionRequestConfig,
+    ITransactionWriteResult,
+)
+from matic.utils.nonce_manager import NonceManager
+
+if TYPE_CHECKING:
+    from matic.utils.base_token import BaseToken
+    from matic.web3_client.signing_pool import SigningPool
+
+__all__ = ['DEFAULT_MAX_IN_FLIGHT', 'BulkSender']
+
+DEFAULT_MAX_IN_FLIGHT: Final = 16
+"""Max number of transactions being prepared (and being sent) at once."""
+
+
+class BulkSender:
+    """Pipelined sender of contract calls signed with one private key.
+
+    Args:
+        token: Token the transactions are prepared by (chain is taken from it).
+        private_key: Sender private key.
+        max_in_flight: Max number of transactions prepared or sent at once.
+        signing_pool: Pool of processes to sign transactions in
+            (they are signed in current thread by default).
+    """
+
+    def __init__(
+        self,
+        token: BaseToken[Any],
+        private_key: str,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        signing_pool: SigningPool | None = None,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError('max_in_flight must be positive.')
+        self.token = token
+        self.private_key = private_key
+        self.max_in_flight = max_in_flight
+        self.signing_pool = signing_pool
+        self.sender = Account.from_key(private_key).address
+        self.client = token.get_client(token.is_parent)
+        self.nonce_manager = token.client.get_nonce_manager(
+            token.is_parent
+        ) or NonceManager(self.client)
+        self._failure: Exception | None = None
+
+    def send(
+        self,
+        methods: Iterable[BaseContractMethod],
+        option: ITransactionOption | None = None,
+    ) -> list[ITransactionWriteResult]:
+        """Send calls of methods (in order of nonces) with common options.
+
+        Returns:
+            Results of all transactions, in order of input.
+
+        Raises:
+            BulkSendException: if some transactions were not sent
+                (ones before the first failure are sent anyway).
+        """
+        self._failure = None
+        results: list[ITransactionWriteResult | None] = []
+        errors: dict[int, BaseException] = {}
+        for index, result in enumerate(self._stream(methods, option)):
+            if isinstance(result, Exception):
+                results.append(None)
+                errors[index] = result
+            else:
+                results.append(result)
+
+        if errors:
+            raise BulkSendException(
+                f'{len(errors)} of {len(results)} transactions were not sent.',
+                results,
+                errors,
+            )
+        return cast('list[ITransactionWriteResult]', results)
+
+    def _stream(
+        self,
+        methods: Iterable[BaseContractMethod],
+        option: ITransactionOption | None,
+    ) -> Iterator[ITransactionWriteResult | Exception]:
+        """Run all stages, yield result or error of each method in order."""
+        preparing: deque[Future[ITransactionRequestConfig]] = deque()
+        ready: list[ITransactionRequestConfig | Exception] = []
+
+        # Not the client executor: preparation waits for lookups submitted there
+        with ThreadPoolExecutor(
+            self.max_in_flight, thread_name_prefix='matic-bulk'
+        ) as executor:
+            for method in methods:
+                preparing.append(executor.submit(self._prepare, method, option))
+                if len(preparing) >= self.max_in_flight:
+                    ready.append(self._reserve_nonce(preparing.popleft()))
+                # Next transactions are being prepared while these are sent
+                if len(ready) >= self.max_in_flight:
+                    yield from self._send(self._sign(ready))
+                    ready = []
+
+            while preparing:
+                ready.append(self._reserve_nonce(preparing.popleft()))
+        yield from self._send(self._sign(ready))
+
+    def _prepare(
+        self, method: BaseContractMethod, option: ITransactionOption | None
+    ) -> ITransactionRequestConfig:
+        if self._failure is not None:
+            raise self._not_sent()
+        # Signer is the sender, whatever default config says
+        tx_config = {**(option or {}), 'from': self.sender}
+        config = self.token.create_transaction_config(
+            tx_config=cast(ITransactionRequestConfig, tx_config),
+            method=method,
+            is_parent=self.token.is_parent,
+            is_write=True,
+            fill_nonce=False,
+        )
+        # Legacy pricing if EIP-1559 fees are not known (shared cached price)
+        if not ('max_fee_per_gas' in config or 'max_priority_fee_per_gas' in config):
+            config.setdefault('gas_price', self.client.gas_price)
+        return method.build_transaction(config)
+
+    def _reserve_nonce(
+        self, prepared: Future[ITransactionRequestConfig]
+    ) -> ITransactionRequestConfig | Exception:
+        try:
+            config = prepared.result()
+        except Exception as e:  # noqa: PIE786
+            return e
+        if self._failure is not None:
+            return self._not_sent()
+        # Nonces are reserved in order of input: no gaps while all are sent
+        if config.get('nonce') is None:
+            config['nonce'] = self.nonce_manager.reserve(config['from'])
+        return config
+
+    def _sign(
+        self, ready: list[ITransactionRequestConfig | Exception]
+    ) -> list[tuple[bytes, ITransactionRequestConfig] | Exception]:
+        configs = [item for item in ready if not isinstance(item, Exception)]
+        raws: list[bytes | Exception]
+        try:
+            if self.signing_pool is None:
+                raws = [self._sign_one(config) for config in configs]
+            else:
+                raws = self.signing_pool.sign_transactions(configs)
+        except Exception as e:  # noqa: PIE786
+            # E.g. broken process pool: none of transactions is signed
+            raws = [e] * len(configs)
+
+        signed = iter(zip(raws, configs))
+        items: list[tuple[bytes, ITransactionRequestConfig] | Exception] = []
+        for item in ready:
+            if isinstance(item, Exception):
+                items.append(item)
+                continue
+            raw, config = next(signed)
+            # Later nonces are not sent after a failure: there would be a gap
+            if self._failure is not None:
+                self.nonce_manager.release(config['from'], config['nonce'])
+                items.append(self._not_sent())
+            elif isinstance(raw, Exception):
+                self._fail(config, raw)
+                items.append(raw)
+            else:
+                items.append((raw, config))
+        return items
+
+    def _sign_one(self, config: ITransactionRequestConfig) -> bytes | Exception:
+        try:
+            return self.client.sign_transaction(config, self.private_key)
+        except Exception as e:  # noqa: PIE786
+            return e
+
+    def _send(
+        self, signed: list[tuple[bytes, ITransactionRequestConfig] | Exception]
+    ) -> list[ITransactionWriteResult | Exception]:
+        # Only transactions before the first failure are signed
+        transactions = [item for item in signed if not isinstance(item, Exception)]
+        sent: Iterator[ITransactionWriteResult | Exception] = iter(())
+        if transactions:
+            sent = iter(self.client.send_raw_transactions(transactions))
+
+        failed = False
+        results: list[ITransactionWriteResult | Exception] = []
+        for item in signed:
+            if isinstance(item, Exception):
+                results.append(item)
+                continue
+            config = item[1]
+            result = next(sent)
+            if not isinstance(result, Exception):
+                # Accepted even after a failure (batch): it is queued by node
+                self.nonce_manager.commit(config['from'], config['nonce'])
+            elif failed:
+                self.nonce_manager.release(config['from'], config['nonce'])
+            else:
+                self._fail(config, result)
+                failed = True
+            results.append(result)
+        return results
+
+    def _fail(self, config: ITransactionRequestConfig, error: Exception) -> None:
+        """Stop sending after failure of transaction, resync its nonce."""
+        self._failure = error
+        self.nonce_manager.release(config['from'], config['nonce'], error)
+        self.nonce_manager.resync(config['from'])
+
+    def _not_sent(self) -> Exception:
+        return ValueError(f'Not sent: earlier transaction failed ({self._failure})')
@@ -0,0 +1,190 @@
+"""Persistent cache for ABI store responses.
+
+Responses are stored post-processed (e.g. only ABI of an artifact), so warm
+start parses just the needed part of large artifacts. Entries are plain JSON:
+the directory may be shared, and loading it must not execute code.
+Entries older than TTL are revalidated with conditional request
+(``If-None-Match``/``If-Modified-Since``).
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+import matic
+
+__all__ = ['CacheEntry', 'DiskCache', 'default_cache_dir']
+
+ConditionalFetch = Callable[
+    [str, Optional[str], Optional[str]], Tuple[Any, Optional[str], Optional[str]]
+]
+"""Function ``(url, etag, last_modified) -> (data, etag, last_modified)``.
+
+Must return ``data=None`` if server replied "304 Not Modified".
+"""
+
+AsyncConditionalFetch = Callable[
+    [str, Optional[str], Optional[str]],
+    Awaitable[Tuple[Any, Optional[str], Optional[str]]],
+]
+"""Coroutine function with the same contract as :data:`ConditionalFetch`."""
+
+
+def default_cache_dir() -> Path:
+    """Get default cache directory (respects ``XDG_CACHE_HOME``)."""
+    base = os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(base) / 'matic'
+
+
+@dataclass
+class CacheEntry:
+    """Single cached response."""
+
+    url: str
+    """Requested URL."""
+    data: Any
+    """Parsed (and post-processed) response body, JSON-serializable."""
+    fetched_at: float
+    """Timestamp of last successful (re)validation."""
+    etag: str | None = None
+    """``ETag`` header of response."""
+    last_modified: str | None = None
+    """``Last-Modified`` header of response."""
+
+
+class DiskCache:
+    """Directory-based cache of parsed HTTP responses.
+
+    Args:
+        directory: Directory to store entries in.
+        ttl: Seconds after which entry is revalidated with ABI store.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str] | None = None, ttl: float = 86400
+    ):
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.ttl = ttl
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f'{hashlib.sha256(url.encode()).hexdigest()}.json'
+
+    def read(self, url: str) -> CacheEntry | None:
+        """Read entry from disk, if present and valid."""
+        try:
+            with open(self._path(url), encoding='utf-8') as f:
+                entry = CacheEntry(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except Exception:  # noqa: PIE786
+            matic.logger.warning('Corrupted cache entry for %s ignored', url)
+            return None
+
+        return entry if entry.url == url else None
+
+    def write(self, entry: CacheEntry) -> None:
+        """Save entry to disk atomically."""
+        path = self._path(entry.url)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(dataclasses.asdict(entry), f, separators=(',', ':'))
+            tmp.replace(path)
+        except OSError as e:
+            matic.logger.warning('Cannot write cache entry for %s: %s', entry.url, e)
+
+    def get(
+        self,
+        url: str,
+        fetch: ConditionalFetch,
+        parse: Callable[[Any], Any] = lambda data: data,
+    ) -> Any:
+        """Get cached data for URL, fetching or revalidating it if needed.
+
+        If revalidation fails, stale data is returned.
+
+        Args:
+            url: URL to fetch.
+            fetch: Function performing conditional request.
+            parse: Post-processing of fetched data before it is stored.
+
+        Returns:
+            Stored (parsed) data.
+        """
+        entry = self.read(url)
+        if entry is not None and self._is_fresh(entry):
+            return entry.data
+
+        try:
+            if entry is None:
+                result = fetch(url, None, None)
+            else:
+                result = fetch(url, entry.etag, entry.last_modified)
+        except Exception:  # noqa: PIE786
+            if entry is None:
+                raise
+            return self._stale(url, entry)
+        return self._update(url, entry, result, parse)
+
+    async def async_get(
+        self,
+        url: str,
+        fetch: AsyncConditionalFetch,
+        parse: Callable[[Any], Any] = lambda data: data,
+    ) -> Any:
+        """Async version of :meth:`get`, ``fetch`` is a coroutine function."""
+        entry = self.read(url)
+        if entry is not None and self._is_fresh(entry):
+            return entry.data
+
+        try:
+            if entry is None:
+                result = await fetch(url, None, None)
+            else:
+                result = await fetch(url, entry.etag, entry.last_modified)
+        except Exception:  # noqa: PIE786
+            if entry is None:
+                raise
+            return self._stale(url, entry)
+        return self._update(url, entry, result, parse)
+
+    def _is_fresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.fetched_at < self.ttl
+
+    def _stale(self, url: str, entry: CacheEntry) -> Any:
+        matic.logger.warning('Revalidation of %s failed, using stale data', url)
+        return entry.data
+
+    def _update(
+        self,
+        url: str,
+        entry: CacheEntry | None,
+        result: tuple[Any, str | None, str | None],
+        parse: Callable[[Any], Any],
+    ) -> Any:
+        data, etag, last_modified = result
+        if data is None:
+            if entry is None:
+                # "Not modified" with nothing stored (e.g. from a proxy)
+                raise ValueError(f'No data for {url}: not modified, but not cached')
+            entry.fetched_at = time.time()
+            entry.etag = etag or entry.etag
+            entry.last_modified = last_modified or entry.last_modified
+        else:
+            entry = CacheEntry(url, parse(data), time.time(), etag, last_modified)
+
+        self.write(entry)
+        return entry.data
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self.directory.glob('*.json'):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,179 @@
+"""Cache of gas estimates for repetitive contract calls.
+
+Gas estimation is a full EVM simulation on the node, while calls of the same
+contract method with arguments of the same size (``approve``, ``transfer``,
+``deposit`` of one token) usually need the same amount of gas.
+:class:`GasEstimateCache` estimates such call once and then serves the
+estimate (with safety margin) from memory, refreshing it in background.
+
+Enable it with ``cache_gas_estimates`` key of parent or child config::
+
+    pos_client = POSClient({'child': {..., 'cache_gas_estimates': True}, ...})
+
+If node rejects a write with cached estimate for too low gas (see
+:func:`is_gas_error`), nothing is broadcast: the estimate is dropped and
+the write is retried once with live estimate (so a revert is raised as usual).
+Other errors are raised as is, the transaction may be broadcast already.
+
+Warning:
+    A call that would revert now is not detected before sending when its
+    estimate is cached and node accepts such transaction: it fails on chain.
+    So does a call that needs more gas than cached estimate with margin
+    (it runs out of gas on chain). Pass ``gas_limit`` explicitly or keep
+    the cache disabled if this is not acceptable.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Final
+
+import matic
+from matic.abstracts import BaseContractMethod
+from matic.json_types import ITransactionRequestConfig
+
+__all__ = [
+    'DEFAULT_GAS_MULTIPLIER',
+    'DEFAULT_REFRESH_INTERVAL',
+    'GAS_ERROR_MARKERS',
+    'GasEstimateCache',
+    'is_gas_error',
+]
+
+DEFAULT_GAS_MULTIPLIER: Final = 1.5
+"""Safety margin applied to cached estimates.
+
+Gas of the same call may differ with state: e.g. ERC-20 transfer to a new
+holder costs ~1.5 times more than to an existing one.
+"""
+
+DEFAULT_REFRESH_INTERVAL: Final = 60.0
+"""Age (in seconds) of estimate after which it is refreshed in background."""
+
+GAS_ERROR_MARKERS: Final = (
+    'intrinsic gas too low',
+    'gas too low',
+    'insufficient gas',
+)
+"""Parts of node error messages rejecting transaction for too low gas limit."""
+
+
+def is_gas_error(error: BaseException) -> bool:
+    """Check whether node rejected transaction (before broadcast) for low gas."""
+    message = str(error).lower()
+    return any(marker in message for marker in GAS_ERROR_MARKERS)
+
+
+@dataclass
+class _Entry:
+    gas: int
+    updated_at: float
+    refreshing: bool = False
+    served: bool = False
+
+
+class GasEstimateCache:
+    """Thread-safe cache of gas estimates for one chain.
+
+    Key is ``(contract address, selector, calldata length)``. First call with
+    a key is estimated live (errors are raised as usual), its estimate is used
+    as is and cached; next ones get ``gas * multiplier`` immediately.
+    Estimates older than
+    ``refresh_interval`` are refreshed in background with arguments of the
+    current call. If refresh fails (call reverts), the estimate is dropped,
+    so the next call is estimated live again.
+
+    Args:
+        executor: Executor for background refreshes.
+        multiplier: Safety margin for cached estimates.
+        refresh_interval: Age (in seconds) of estimate to refresh it.
+    """
+
+    def __init__(
+        self,
+        executor: Executor,
+        multiplier: float = DEFAULT_GAS_MULTIPLIER,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+    ) -> None:
+        self.executor = executor
+        self.multiplier = multiplier
+        self.refresh_interval = refresh_interval
+        self._entries: dict[tuple[str, bytes, int], _Entry] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all estimates."""
+        with self._lock:
+            self._entries.clear()
+
+    def invalidate(self, method: BaseContractMethod) -> bool:
+        """Drop estimate of method call if it was served from cache.
+
+        Returns:
+            Whether there was such estimate (so live one may differ).
+        """
+        key = self._key(method)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry.served:
+                return False
+            del self._entries[key]
+        return True
+
+    @staticmethod
+    def _key(method: BaseContractMethod) -> tuple[str, bytes, int]:
+        data = method.encode_abi()
+        return (method.address.lower(), data[:4], len(data))
+
+    def estimate(
+        self, method: BaseContractMethod, config: ITransactionRequestConfig
+    ) -> int:
+        """Get gas limit for method call (cached or live estimate)."""
+        key = self._key(method)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.served = True
+            refresh = (
+                entry is not None
+                and not entry.refreshing
+                and now - entry.updated_at >= self.refresh_interval
+            )
+            if refresh:
+                assert entry is not None
+                entry.refreshing = True
+
+        if entry is None:
+            gas = method.estimate_gas(config)
+            with self._lock:
+                self._entries[key] = _Entry(gas, now)
+            return gas
+
+        if refresh:
+            self.executor.submit(self._refresh, key, method, config.copy())
+        return int(entry.gas * self.multiplier)
+
+    def _refresh(
+        self,
+        key: tuple[str, bytes, int],
+        method: BaseContractMethod,
+        config: ITransactionRequestConfig,
+    ) -> None:
+        try:
+            gas = method.estimate_gas(config)
+        except Exception as e:  # noqa: PIE786
+            matic.logger.info('Dropping gas estimate of %s: %r', key, e)
+            with self._lock:
+                self._entries.pop(key, None)
+            return
+
+        with self._lock:
+            self._entries[key] = _Entry(gas, time.monotonic())
@@ -0,0 +1,42 @@
+"""Lazy (`PEP 562 <https://peps.python.org/pep-0562/>`_) attributes of packages."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable, Mapping
+
+__all__ = ['lazy_attributes']
+
+
+def lazy_attributes(
+    package: str, attributes: Mapping[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for a package.
+
+    Attribute is imported from its module on first access and then stored
+    in the package namespace, so it can be reassigned as usual.
+
+    Args:
+        package: Name of package (``__name__``).
+        attributes: Mapping from attribute name to name of module defining it.
+
+    Returns:
+        ``(__getattr__, __dir__)`` functions.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name = attributes[name]
+        except KeyError:
+            raise AttributeError(
+                f'module {package!r} has no attribute {name!r}'
+            ) from None
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *attributes})
+
+    return __getattr__, __dir__
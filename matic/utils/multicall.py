@@ -0,0 +1,245 @@
+"""Aggregation of contract reads with `Multicall3 <https://www.multicall3.com/>`_.
+
+Every read is a separate ``eth_call``. :class:`Multicall` queues reads and
+sends them as few ``aggregate3`` calls: each of them executes up to
+``chunk_size`` reads in one round trip. Every read still fails (or succeeds)
+on its own.
+
+Usually it is used through
+:meth:`~matic.utils.web3_side_chain_client.Web3SideChainClient.multicall`::
+
+    with pos_client.client.multicall(is_parent=False):
+        balances = [token.get_balance(user) for user in users]
+
+    print([balance.result() for balance in balances])
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Final
+
+from eth_typing import HexAddress, HexStr
+from web3.types import BlockIdentifier
+
+from matic.abstracts import BaseContractMethod, BaseWeb3Client
+from matic.exceptions import MulticallCallFailedException
+from matic.json_types import ITransactionRequestConfig
+
+__all__ = [
+    'DEFAULT_CHUNK_SIZE',
+    'MULTICALL3_ABI',
+    'MULTICALL3_ADDRESS',
+    'Multicall',
+    'then',
+]
+
+MULTICALL3_ADDRESS: Final = HexAddress(
+    HexStr('0xcA11bde05977b3631167028862bE2a173976CA11')
+)
+"""Address of Multicall3 (the same on all supported chains)."""
+
+DEFAULT_CHUNK_SIZE: Final = 100
+"""Max number of reads in one ``aggregate3`` call."""
+
+MULTICALL3_ABI: Final = [
+    {
+        'type': 'function',
+        'name': 'aggregate3',
+        'stateMutability': 'payable',
+        'inputs': [
+            {
+                'name': 'calls',
+                'type': 'tuple[]',
+                'components': [
+                    {'name': 'target', 'type': 'address'},
+                    {'name': 'allowFailure', 'type': 'bool'},
+                    {'name': 'callData', 'type': 'bytes'},
+                ],
+            }
+        ],
+        'outputs': [
+            {
+                'name': 'returnData',
+                'type': 'tuple[]',
+                'components': [
+                    {'name': 'success', 'type': 'bool'},
+                    {'name': 'returnData', 'type': 'bytes'},
+                ],
+            }
+        ],
+    }
+]
+"""ABI of Multicall3 (``aggregate3`` function only)."""
+
+# Error(string) selector, used by revert("reason")
+_ERROR_SELECTOR: Final = bytes.fromhex('08c379a0')
+
+
+def then(value: Any, callback: Callable[[Any], Any]) -> Any:
+    """Apply callback to value, or to result of future (returning new future).
+
+    Allows to post-process result of
+    :meth:`~matic.utils.base_token.BaseToken.process_read`,
+    which is a future when read is queued to multicall.
+    """
+    if not isinstance(value, Future):
+        return callback(value)
+
+    result: Future[Any] = Future()
+
+    def done(future: Future[Any]) -> None:
+        try:
+            result.set_result(callback(future.result()))
+        except BaseException as e:  # noqa: PIE786
+            result.set_exception(e)
+
+    value.add_done_callback(done)
+    return result
+
+
+def _can_decode(method: BaseContractMethod) -> bool:
+    return type(method).decode_result is not BaseContractMethod.decode_result
+
+
+def _failure_message(method: BaseContractMethod, data: bytes) -> str:
+    reason = ''
+    if data.startswith(_ERROR_SELECTOR):
+        try:
+            length = int.from_bytes(data[36:68], 'big')
+            reason = ': ' + data[68 : 68 + length].decode()
+        except UnicodeDecodeError:
+            pass
+    return f'Call to {method.address} reverted{reason}'
+
+
+class Multicall:
+    """Collector of contract reads, sent together as ``aggregate3`` calls.
+
+    Reads are sent on :meth:`flush` (and on exit, if used as context manager).
+    Failure of one read does not affect others: its future gets
+    :exc:`~matic.exceptions.MulticallCallFailedException` (if reverted)
+    or decoding error.
+
+    Args:
+        client: Client of the chain to read from.
+        address: Multicall3 contract address.
+        chunk_size: Max number of reads in one ``eth_call``.
+        tx: Parameters of ``eth_call`` (e.g. ``from``).
+        block_identifier: Block to read state at (default block if missing).
+    """
+
+    def __init__(
+        self,
+        client: BaseWeb3Client,
+        address: HexAddress = MULTICALL3_ADDRESS,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        tx: ITransactionRequestConfig | None = None,
+        block_identifier: BlockIdentifier | None = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be positive.')
+        self.client = client
+        self.address = address
+        self.chunk_size = chunk_size
+        self.tx = tx
+        self.block_identifier = block_identifier
+        self._contract = client.get_contract(address, MULTICALL3_ABI)
+        self._queue: list[tuple[BaseContractMethod, Future[Any]]] = []
+        self._futures: list[Future[Any]] = []
+        self._lock = threading.Lock()
+
+    def add(self, method: BaseContractMethod) -> Future[Any]:
+        """Queue a read.
+
+        Methods without :meth:`~matic.abstracts.BaseContractMethod.decode_result`
+        are read immediately instead.
+
+        Returns:
+            Future resolving to decoded result after :meth:`flush`.
+        """
+        future: Future[Any] = Future()
+        with self._lock:
+            self._futures.append(future)
+            if _can_decode(method):
+                self._queue.append((method, future))
+                return future
+
+        try:
+            # Custom methods may not accept block_identifier: passed only if pinned
+            if self.block_identifier is None:
+                future.set_result(method.read(self.tx))
+            else:
+                future.set_result(
+                    method.read(self.tx, block_identifier=self.block_identifier)
+                )
+        except Exception as e:  # noqa: PIE786
+            future.set_exception(e)
+        return future
+
+    def flush(self) -> None:
+        """Send all queued reads."""
+        with self._lock:
+            queue, self._queue = self._queue, []
+
+        for start in range(0, len(queue), self.chunk_size):
+            self._send(queue[start : start + self.chunk_size])
+
+    def cancel(self) -> None:
+        """Drop all queued reads (their futures are cancelled)."""
+        with self._lock:
+            queue, self._queue = self._queue, []
+        for _, future in queue:
+            future.cancel()
+
+    def _send(self, chunk: list[tuple[BaseContractMethod, Future[Any]]]) -> None:
+        calls = [(method.address, True, method.encode_abi()) for method, _ in chunk]
+        try:
+            results = self._contract.method('aggregate3', calls).read(
+                self.tx, block_identifier=self.block_identifier
+            )
+        except Exception as e:  # noqa: PIE786
+            for _, future in chunk:
+                future.set_exception(e)
+            return
+
+        for (method, future), (success, data) in zip(chunk, results):
+            if not success:
+                future.set_exception(
+                    MulticallCallFailedException(_failure_message(method, data), data)
+                )
+                continue
+            try:
+                future.set_result(method.decode_result(data))
+            except Exception as e:  # noqa: PIE786
+                future.set_exception(e)
+
+    def results(self, return_exceptions: bool = False) -> list[Any]:
+        """Flush and get results of all reads in order they were added.
+
+        Args:
+            return_exceptions: Put exceptions of failed reads into the list
+                instead of raising first of them.
+        """
+        self.flush()
+        with self._lock:
+            futures = list(self._futures)
+
+        if not return_exceptions:
+            return [future.result() for future in futures]
+
+        results = []
+        for future in futures:
+            error = future.exception()
+            results.append(future.result() if error is None else error)
+        return results
+
+    def __enter__(self) -> Multicall:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self.cancel()
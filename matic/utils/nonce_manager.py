@@ -0,0 +1,126 @@
+"""Local nonce management for high-rate transaction sending.
+
+Without it every write asks the node for ``pending`` transaction count of
+the sender. This costs a round trip, and concurrent writes from one address
+get the same nonce. :class:`NonceManager` asks the node once per address
+and then hands nonces out locally.
+
+Enable it with ``manage_nonces`` key of parent or child config::
+
+    pos_client = POSClient({'parent': {..., 'manage_nonces': True}, ...})
+
+Nonces passed explicitly (``nonce`` option) are never touched. If the wallet
+also sends transactions by other means, call :meth:`NonceManager.resync`
+(it is also resynced when node rejects a nonce as already used).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Final
+
+from eth_typing import HexAddress
+
+from matic.abstracts import BaseWeb3Client
+
+__all__ = ['NONCE_ERROR_MARKERS', 'NonceManager', 'is_nonce_error']
+
+NONCE_ERROR_MARKERS: Final = (
+    'nonce too low',
+    'nonce too high',
+    'invalid nonce',
+    'invalid transaction nonce',
+    'already known',
+    'known transaction',
+    'replacement transaction underpriced',
+    'nonce has already been used',
+)
+"""Parts of node error messages telling that local nonce is out of sync."""
+
+
+def is_nonce_error(error: BaseException) -> bool:
+    """Check whether sending failed because nonce is already used (or skipped)."""
+    message = str(error).lower()
+    return any(marker in message for marker in NONCE_ERROR_MARKERS)
+
+
+class NonceManager:
+    """Thread-safe source of nonces for addresses on one chain.
+
+    Next nonce of an address is fetched from the chain (``pending`` block)
+    on first :meth:`reserve`, then incremented locally.
+
+    Args:
+        client: Client of the chain.
+    """
+
+    def __init__(self, client: BaseWeb3Client) -> None:
+        self.client = client
+        self._lock = threading.Lock()
+        self._address_locks: dict[str, threading.Lock] = {}
+        self._next: dict[str, int] = {}
+        self._reserved: set[tuple[str, int]] = set()
+
+    def _get_address_lock(self, address: str) -> threading.Lock:
+        with self._lock:
+            return self._address_locks.setdefault(address, threading.Lock())
+
+    def reserve(self, address: HexAddress) -> int:
+        """Get next nonce of address and mark it as used.
+
+        Must be followed by :meth:`commit` (transaction was sent)
+        or :meth:`release` (it was not).
+        """
+        key = address.lower()
+        with self._get_address_lock(key):
+            nonce = self._next.get(key)
+            if nonce is None:
+                nonce = self.client.get_transaction_count(address, 'pending')
+            self._next[key] = nonce + 1
+            self._reserved.add((key, nonce))
+        return nonce
+
+    def is_reserved(self, address: HexAddress, nonce: int) -> bool:
+        """Check whether nonce was reserved and not committed or released yet."""
+        return (address.lower(), nonce) in self._reserved
+
+    def commit(self, address: HexAddress, nonce: int) -> None:
+        """Mark reserved nonce as used by a sent transaction."""
+        self._reserved.discard((address.lower(), nonce))
+
+    def release(
+        self, address: HexAddress, nonce: int, error: BaseException | None = None
+    ) -> None:
+        """Return reserved nonce that was not used (transaction was not sent).
+
+        If it is the last reserved nonce, it will be handed out again.
+        Otherwise there is a gap now: address is resynced with the chain
+        on next :meth:`reserve`. It is resynced as well if ``error``
+        (reason of failure) says that node does not accept this nonce
+        (see :func:`is_nonce_error`), so it is not handed out again.
+        """
+        key = address.lower()
+        with self._get_address_lock(key):
+            if (key, nonce) not in self._reserved:
+                return
+            self._reserved.discard((key, nonce))
+            if self._next.get(key) == nonce + 1 and not (
+                error is not None and is_nonce_error(error)
+            ):
+                self._next[key] = nonce
+            else:
+                self._next.pop(key, None)
+
+    def resync(self, address: HexAddress | None = None) -> None:
+        """Forget local nonce of address (or of all addresses).
+
+        It is fetched from the chain again on next :meth:`reserve`.
+        """
+        if address is None:
+            with self._lock:
+                self._next.clear()
+            return
+
+        key = address.lower()
+        with self._get_address_lock(key):
+            self._next.pop(key, None)
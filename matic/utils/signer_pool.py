@@ -0,0 +1,89 @@
+"""Spreading writes over several sender keys.
+
+Transactions of one sender are mined strictly in order of nonces, so one
+hot key caps throughput of exits and deposits at one nonce chain.
+:class:`SignerPool` holds several keys and gives each write to the key
+with the fewest transactions in flight (sent, but not mined yet), so
+independent writes from different keys can land in the same block.
+
+Enable it with ``signers`` key of parent or child config::
+
+    pos_client = POSClient({'parent': {..., 'signers': [key_1, key_2]}, ...})
+    # Signed with the least loaded key, not with default "from"
+    result = pos_client.erc_20(token, True).withdraw_exit(
+        burn_tx_hash, option={'use_signer_pool': True}
+    )
+
+It is used only by writes with ``use_signer_pool`` option: others
+(e.g. approve and deposit that follows it) are sent by the default sender.
+Nonces of pool keys are handed out by the nonce manager of the chain
+(see :mod:`matic.utils.nonce_manager`), it is enabled with the pool.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Callable, Sequence
+
+from eth_account import Account
+from eth_typing import HexAddress
+
+from matic.json_types import ITransactionWriteResult
+
+__all__ = ['SignerPool']
+
+
+class SignerPool:
+    """Thread-safe pool of sender keys, tracking in-flight transactions per key.
+
+    Args:
+        private_keys: Private keys of all senders.
+    """
+
+    def __init__(self, private_keys: Sequence[str]) -> None:
+        if not private_keys:
+            raise ValueError('Signer pool needs at least one private key.')
+        self._keys: dict[HexAddress, str] = {
+            Account.from_key(private_key).address: private_key
+            for private_key in private_keys
+        }
+        self._in_flight = dict.fromkeys(self._keys, 0)
+        self._lock = threading.Lock()
+
+    @property
+    def addresses(self) -> list[HexAddress]:
+        """Addresses of all senders."""
+        return list(self._keys)
+
+    def in_flight(self, address: HexAddress) -> int:
+        """Get number of transactions of sender being sent or not mined yet."""
+        return self._in_flight[address]
+
+    def write(
+        self, send: Callable[[HexAddress, str], ITransactionWriteResult]
+    ) -> ITransactionWriteResult:
+        """Send transaction from the least loaded sender.
+
+        Args:
+            send: Function sending transaction from given address,
+                signed with given private key.
+
+        Returns:
+            Result of ``send``. Sender is loaded until its receipt is known.
+        """
+        with self._lock:
+            # Ties go to the first key: low keys are reused while the load is low
+            address = min(self._in_flight, key=self._in_flight.__getitem__)
+            self._in_flight[address] += 1
+
+        try:
+            result = send(address, self._keys[address])
+        except BaseException:
+            self._done(address)
+            raise
+        result.add_done_callback(lambda _: self._done(address))
+        return result
+
+    def _done(self, address: HexAddress) -> None:
+        with self._lock:
+            self._in_flight[address] -= 1
@@ -0,0 +1,132 @@
+"""Consistent snapshots of token balances.
+
+A snapshot holds ERC-20 balances of several users for several tokens, read
+at one block of a chain with Multicall3 (see :mod:`matic.utils.multicall`).
+Balances are stored as a token × user matrix: one row per token,
+one column per user.
+
+Usually it is taken with
+:meth:`~matic.utils.bridge_client.BridgeClient.snapshot_balances`
+for both chains at once::
+
+    tokens = {'parent_tokens': [...], 'child_tokens': [...]}
+    before = pos_client.snapshot_balances(users, **tokens)
+    ...
+    after = pos_client.snapshot_balances(users, **tokens)
+    print(before.diff(after))
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Final, Sequence, cast
+
+from eth_typing import HexAddress
+
+from matic.utils.multicall import Multicall
+
+__all__ = ['ERC20_BALANCE_ABI', 'BalanceSnapshot', 'PortfolioSnapshot']
+
+ERC20_BALANCE_ABI: Final = [
+    {
+        'type': 'function',
+        'name': 'balanceOf',
+        'stateMutability': 'view',
+        'inputs': [{'name': 'account', 'type': 'address'}],
+        'outputs': [{'name': '', 'type': 'uint256'}],
+    }
+]
+"""ABI of ERC-20 ``balanceOf`` function."""
+
+
+@dataclass(frozen=True)
+class BalanceSnapshot:
+    """Balances of tokens (rows) for users (columns) at one block of a chain."""
+
+    block_number: int
+    """Block the balances were read at."""
+    tokens: tuple[HexAddress, ...]
+    """Token addresses (rows)."""
+    users: tuple[HexAddress, ...]
+    """User addresses (columns)."""
+    balances: tuple[tuple[int, ...], ...]
+    """Balance matrix: ``balances[i][j]`` is balance of user ``j`` in token ``i``."""
+
+    @classmethod
+    def read(
+        cls,
+        multicall: Multicall,
+        tokens: Sequence[HexAddress],
+        users: Sequence[HexAddress],
+    ) -> BalanceSnapshot:
+        """Read balances with multicall pinned to a block number."""
+        if not isinstance(multicall.block_identifier, int):
+            raise ValueError('Multicall must be pinned to a block number.')
+
+        client = multicall.client
+        for token in tokens:
+            contract = client.get_contract(token, ERC20_BALANCE_ABI)
+            for user in users:
+                multicall.add(contract.method('balanceOf', user))
+        values = cast('list[int]', multicall.results())
+
+        width = len(users)
+        return cls(
+            block_number=multicall.block_identifier,
+            tokens=tuple(tokens),
+            users=tuple(users),
+            balances=tuple(
+                tuple(values[row * width : (row + 1) * width])
+                for row in range(len(tokens))
+            ),
+        )
+
+    def get(self, token: HexAddress, user: HexAddress) -> int:
+        """Get balance of user in token."""
+        return self.balances[self.tokens.index(token)][self.users.index(user)]
+
+    def diff(self, other: BalanceSnapshot) -> dict[tuple[HexAddress, HexAddress], int]:
+        """Get changes from this snapshot to other one.
+
+        Returns:
+            Mapping ``(token, user) -> other balance - this balance``,
+                only for changed balances.
+
+        Raises:
+            ValueError: if snapshots have different tokens or users.
+        """
+        if self.tokens != other.tokens or self.users != other.users:
+            raise ValueError('Snapshots of different tokens or users.')
+
+        changes = {}
+        for token, old_row, new_row in zip(self.tokens, self.balances, other.balances):
+            if old_row == new_row:
+                continue
+            for user, old, new in zip(self.users, old_row, new_row):
+                if old != new:
+                    changes[token, user] = new - old
+        return changes
+
+
+@dataclass(frozen=True)
+class PortfolioSnapshot:
+    """Balances on both chains, each pinned to its own block."""
+
+    parent: BalanceSnapshot
+    """Balances on parent (root) chain."""
+    child: BalanceSnapshot
+    """Balances on child chain."""
+
+    def diff(
+        self, other: PortfolioSnapshot
+    ) -> dict[str, dict[tuple[HexAddress, HexAddress], int]]:
+        """Get changes from this snapshot to other one by chain.
+
+        Returns:
+            ``{'parent': changes, 'child': changes}``,
+                see :meth:`BalanceSnapshot.diff`.
+        """
+        return {
+            'parent': self.parent.diff(other.parent),
+            'child': self.child.diff(other.child),
+        }
@@ -1,14 +1,38 @@
 from __future__ import annotations
 
-from typing import Any, Generic, TypeVar
+import inspect
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import cached_property
+from typing import Any, Final, Generic, Iterator, Sequence, TypeVar, cast
+
+from eth_typing import HexAddress
+from hexbytes import HexBytes
+from web3.types import BlockIdentifier, RPCEndpoint
 
 import matic.utils
 from matic.abstracts import BaseWeb3Client
-from matic.json_types import IBaseClientConfig
+from matic.json_types import ConfigWithFrom, IBaseClientConfig, NeighbourClientConfig
 from matic.utils.abi_manager import ABIManager
+from matic.utils.accelerator import Accelerator
+from matic.utils.gas_estimator import GasEstimateCache
+from matic.utils.multicall import DEFAULT_CHUNK_SIZE, MULTICALL3_ADDRESS, Multicall
+from matic.utils.nonce_manager import NonceManager
+from matic.utils.signer_pool import SignerPool
+from matic.utils.snapshot import BalanceSnapshot
 
 _C = TypeVar('_C', bound=IBaseClientConfig)
 
+CLIENT_OPTIONS: Final = (
+    'direct_reads',
+    'read_cache_size',
+    'fee_speed',
+    'fee_refresh_interval',
+)
+"""Chain config keys passed to web3 client constructor (when set)."""
+
 
 class Web3SideChainClient(Generic[_C]):
     """Web3 client class for a side chain."""
@@ -24,17 +48,42 @@ class Web3SideChainClient(Generic[_C]):
         # config.parent.default_config = config.parent.default_config or {}
         # config.child.default_config = config.child.default_config or {}
         self.config = config
+        self._local = threading.local()
 
         web3_client_cls = matic.utils.Web3Client
         if not web3_client_cls:
             raise ValueError('web3_client_cls is not set')
 
-        self.parent = web3_client_cls(
-            (config.get('parent') or {}).get('provider')  # type: ignore
-        )
-        self.child = web3_client_cls(
-            (config.get('child') or {}).get('provider')  # type: ignore
-        )
+        self.parent = self._create_client(web3_client_cls, self._get_chain_config(True))
+        self.child = self._create_client(web3_client_cls, self._get_chain_config(False))
+        self._eip_1559_supported: dict[bool, bool] = {}
+        self._multicall_deployed: dict[bool, bool] = {}
+        # Writes from pool keys run concurrently: their nonces are managed
+        self._signer_pools = {
+            is_parent: SignerPool(self._get_chain_config(is_parent)['signers'])
+            for is_parent in (True, False)
+            if self._get_chain_config(is_parent).get('signers')
+        }
+        self._nonce_managers = {
+            is_parent: NonceManager(self.parent if is_parent else self.child)
+            for is_parent in (True, False)
+            if self._get_chain_config(is_parent).get('manage_nonces')
+            or is_parent in self._signer_pools
+        }
+        self._accelerators = {
+            is_parent: Accelerator(
+                self.parent if is_parent else self.child,
+                self._get_chain_config(is_parent)['accelerate_after_blocks'],
+                fee_cap=self._get_chain_config(is_parent).get('max_fee_cap'),
+            )
+            for is_parent in (True, False)
+            if self._get_chain_config(is_parent).get('accelerate_after_blocks')
+        }
+        self._gas_estimate_caches = {
+            is_parent: GasEstimateCache(self.executor)
+            for is_parent in (True, False)
+            if self._get_chain_config(is_parent).get('cache_gas_estimates')
+        }
 
         try:
             self.abi_manager = ABIManager(config['network'], config['version'])
@@ -43,6 +92,159 @@ class Web3SideChainClient(Generic[_C]):
                 f'network {config["network"]} - {config["version"]} is not supported'
             ) from e
 
+    def _get_chain_config(self, is_parent: bool) -> NeighbourClientConfig:
+        config = self.config.get('parent') if is_parent else self.config.get('child')
+        return cast(NeighbourClientConfig, config or {})
+
+    @staticmethod
+    def _create_client(
+        web3_client_cls: type[BaseWeb3Client], config: NeighbourClientConfig
+    ) -> BaseWeb3Client:
+        options: dict[str, Any] = {
+            name: config[name]  # type: ignore[literal-required]
+            for name in CLIENT_OPTIONS
+            if config.get(name)
+        }
+        # Custom client classes may not know about these options
+        params = inspect.signature(web3_client_cls).parameters.values()
+        if not any(p.kind is p.VAR_KEYWORD for p in params):
+            accepted = {p.name for p in params}
+            for name in options.keys() - accepted:
+                warnings.warn(
+                    f'{web3_client_cls.__name__} does not accept {name!r},'
+                    ' option ignored',
+                    stacklevel=3,
+                )
+                del options[name]
+        return web3_client_cls(config.get('provider'), **options)
+
+    @cached_property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool for concurrent requests (e.g. during transaction preparation)."""
+        return ThreadPoolExecutor(8, thread_name_prefix='matic')
+
+    def get_default_config(self, is_parent: bool) -> ConfigWithFrom:
+        """Get default transaction config of chain (do not modify it)."""
+        return self._get_chain_config(is_parent).get('default_config') or {}
+
+    def get_nonce_manager(self, is_parent: bool) -> NonceManager | None:
+        """Get nonce manager of chain (if enabled with ``manage_nonces`` config)."""
+        return self._nonce_managers.get(is_parent)
+
+    def get_signer_pool(self, is_parent: bool) -> SignerPool | None:
+        """Get pool of sender keys of chain (if configured with ``signers``)."""
+        return self._signer_pools.get(is_parent)
+
+    def get_accelerator(self, is_parent: bool) -> Accelerator | None:
+        """Get fee bumper of chain (if enabled with ``accelerate_after_blocks``)."""
+        return self._accelerators.get(is_parent)
+
+    def get_gas_estimate_cache(self, is_parent: bool) -> GasEstimateCache | None:
+        """Get gas estimate cache of chain (if enabled with ``cache_gas_estimates``)."""
+        return self._gas_estimate_caches.get(is_parent)
+
+    def _get_multicall_stack(self, is_parent: bool) -> list[Multicall]:
+        try:
+            stacks = self._local.multicalls
+        except AttributeError:
+            stacks = self._local.multicalls = {True: [], False: []}
+        return stacks[is_parent]
+
+    def get_active_multicall(self, is_parent: bool) -> Multicall | None:
+        """Get innermost multicall collecting reads in current thread, if any."""
+        stack = self._get_multicall_stack(is_parent)
+        return stack[-1] if stack else None
+
+    def _create_multicall(
+        self,
+        is_parent: bool,
+        chunk_size: int,
+        block_identifier: BlockIdentifier | None,
+    ) -> Multicall:
+        config = self._get_chain_config(is_parent)
+        sender = (config.get('default_config') or {}).get('from')
+        return Multicall(
+            self.parent if is_parent else self.child,
+            config.get('multicall_address', MULTICALL3_ADDRESS),
+            chunk_size,
+            {'from': sender} if sender else None,
+            block_identifier,
+        )
+
+    def has_multicall(self, is_parent: bool = False) -> bool:
+        """Whether Multicall3 is deployed on given chain (checked once)."""
+        deployed = self._multicall_deployed.get(is_parent)
+        if deployed is None:
+            address = self._get_chain_config(is_parent).get(
+                'multicall_address', MULTICALL3_ADDRESS
+            )
+            client = self.parent if is_parent else self.child
+            code = client.send_rpc_request(
+                RPCEndpoint('eth_getCode'), [address, 'latest']
+            ).get('result')
+            deployed = self._multicall_deployed[is_parent] = bool(
+                code and HexBytes(code)
+            )
+        return deployed
+
+    @contextmanager
+    def multicall(
+        self,
+        is_parent: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        block_identifier: BlockIdentifier | None = None,
+    ) -> Iterator[Multicall]:
+        """Aggregate reads of tokens on given chain with Multicall3.
+
+        Inside the ``with`` block all token reads (made with
+        :meth:`~matic.utils.base_token.BaseToken.process_read`) on this chain
+        from current thread return futures instead of values.
+        Queued reads are sent on exit. Transaction options of such reads
+        are ignored; reads pinned to another block are not queued.
+
+        Multicall3 address can be changed with ``multicall_address`` key
+        of parent or child config.
+
+        Args:
+            is_parent: Collect reads on parent (root) chain instead of child.
+            chunk_size: Max number of reads in one ``eth_call``.
+            block_identifier: Block to read state at (default block if missing).
+        """
+        collector = self._create_multicall(is_parent, chunk_size, block_identifier)
+        stack = self._get_multicall_stack(is_parent)
+        with collector:
+            stack.append(collector)
+            try:
+                yield collector
+            finally:
+                stack.pop()
+
+    def get_block_number(self, is_parent: bool = False) -> int:
+        """Get number of the latest block on given chain."""
+        return (self.parent if is_parent else self.child).get_block_number()
+
+    def snapshot_balances(
+        self,
+        tokens: Sequence[HexAddress],
+        users: Sequence[HexAddress],
+        is_parent: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        block_number: int | None = None,
+    ) -> BalanceSnapshot:
+        """Read ERC-20 balances of users at one block (see :mod:`matic.utils.snapshot`).
+
+        Args:
+            tokens: Token addresses.
+            users: User addresses.
+            is_parent: Read on parent (root) chain instead of child.
+            chunk_size: Max number of balances in one ``eth_call``.
+            block_number: Block to read at (the latest one by default).
+        """
+        if block_number is None:
+            block_number = self.get_block_number(is_parent)
+        multicall = self._create_multicall(is_parent, chunk_size, block_number)
+        return BalanceSnapshot.read(multicall, tokens, users)
+
     def get_abi(self, name: str, type_: str | None = None) -> dict[str, Any]:
         """Get ABI dictionary for given name and type."""
         return self.abi_manager.get_abi(name, type_)
@@ -62,8 +264,12 @@ class Web3SideChainClient(Generic[_C]):
         return self.get_config('Main.POSContracts')
 
     def is_eip_1559_supported(self, is_parent: bool) -> bool:
-        """Check if EIP-1559 (improved fee specification) is available for chain."""
-        if is_parent:
-            return self.get_config('Main.SupportsEIP1559')
-        else:
-            return self.get_config('Matic.SupportsEIP1559')
+        """Check if EIP-1559 (improved fee specification) is available for chain.
+
+        It is known from network config, no requests are made.
+        """
+        supported = self._eip_1559_supported.get(is_parent)
+        if supported is None:
+            path = 'Main.SupportsEIP1559' if is_parent else 'Matic.SupportsEIP1559'
+            supported = self._eip_1559_supported[is_parent] = self.get_config(path)
+        return supported
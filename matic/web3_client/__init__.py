@@ -1,36 +1,78 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import threading
 import warnings
-from typing import Any, Iterable, Sequence, cast
+from collections import OrderedDict
+from concurrent import futures
+from concurrent.futures import Future
+from functools import cached_property
+from typing import Any, Callable, Final, Iterable, Sequence, cast
 
 from eth_abi import decode_abi, encode_abi
-from eth_typing import HexAddress
+from eth_abi.exceptions import DecodingError
+from eth_typing import ChecksumAddress, HexAddress, HexStr
 from hexbytes.main import HexBytes
 from web3 import Web3
-from web3.contract import Contract
-from web3.method import Method
+from web3._utils.empty import empty
+from web3._utils.ens import is_ens_name
+from web3._utils.method_formatters import raise_solidity_error_on_revert
+from web3._utils.normalizers import normalize_address
+from web3._utils.validation import validate_address
+from web3.contract import Contract, ContractFunction
+from web3.exceptions import BadFunctionCallOutput, TimeExhausted
 from web3.providers.base import BaseProvider
 from web3.types import BlockIdentifier, RPCEndpoint, RPCResponse
 
 import matic
 from matic.abstracts import BaseContract, BaseContractMethod, BaseWeb3Client
 from matic.json_types import (
+    FeeSpeed,
     IBlock,
     IBlockWithTransaction,
+    IFeeSuggestion,
     ITransactionData,
     ITransactionReceipt,
     ITransactionRequestConfig,
     ITransactionWriteResult,
 )
-from matic.utils.polyfill import removeprefix
+from matic.web3_client.batching import BatchingHTTPProvider
+from matic.web3_client.dispatch import CompiledFunction, DispatchTable
+from matic.web3_client.fee_oracle import DEFAULT_FEE_REFRESH_INTERVAL, FeeOracle
+from matic.web3_client.read_cache import ReadCache
+from matic.web3_client.receipt_waiter import ReceiptWaiter
 from matic.web3_client.utils import (
     matic_tx_request_config_to_web3,
-    web3_receipt_to_matic_receipt,
     web3_tx_request_config_to_matic,
     web3_tx_to_matic_tx,
 )
 
-__all__ = ['TransactionWriteResult', 'EthMethod', 'Web3Contract', 'Web3Client']
+__all__ = [
+    'ABI_FINGERPRINT_CACHE_SIZE',
+    'TransactionWriteResult',
+    'EthMethod',
+    'Web3Contract',
+    'Web3Client',
+]
+
+ABI_FINGERPRINT_CACHE_SIZE: Final = 256
+"""Max number of ABI objects fingerprints of which are remembered per client."""
+
+
+def _chain(source: Future[Any], target: Future[Any]) -> None:
+    """Resolve (or cancel) target future like source one once it is done."""
+
+    def copy(done: Future[Any]) -> None:
+        if done.cancelled():
+            target.cancel()
+        elif target.set_running_or_notify_cancel():
+            try:
+                target.set_result(done.result())
+            except Exception as e:  # noqa: PIE786
+                target.set_exception(e)
+
+    source.add_done_callback(copy)
 
 
 class TransactionWriteResult(ITransactionWriteResult):
@@ -45,8 +87,74 @@ class TransactionWriteResult(ITransactionWriteResult):
         self.tx_hash = tx_hash
         self.tx_params = tx_params
         self.client = client
+        self._lock = threading.Lock()
+        self._watched: list[Future[ITransactionReceipt]] = []
+        self._mined = False
+
+    @cached_property
+    def future(self) -> Future[ITransactionReceipt]:
+        """Future of transaction receipt (see :mod:`~matic.web3_client.receipt_waiter`).
+
+        With replacements (see :meth:`add_replacement`) it is resolved
+        by the first mined one.
+
+        Raises:
+            AttributeError: if called on transaction that was not performed.
+        """
+        future: Future[ITransactionReceipt] = Future()
+        self._watch(future, self.transaction_hash, self.tx_params)
+        return future
+
+    def _watch(
+        self,
+        future: Future[ITransactionReceipt],
+        tx_hash: bytes,
+        tx_params: ITransactionRequestConfig,
+    ) -> None:
+        # Own copy of the waiter future: it can be cancelled, the shared one not
+        watched: Future[ITransactionReceipt] = Future()
+
+        def resolve(done: Future[ITransactionReceipt]) -> None:
+            with self._lock:
+                if done.cancelled() or self._mined or future.cancelled():
+                    return
+                # Expired replaced transaction: others may still be mined
+                if done.exception() is not None and not all(
+                    other.done() for other in self._watched
+                ):
+                    return
+                self._mined = True
+                self.tx_hash, self.tx_params = tx_hash, tx_params
+                losers = [other for other in self._watched if other is not done]
+            # Same nonce is used by the winner: others will never be mined
+            for other in losers:
+                other.cancel()
+            try:
+                future.set_result(done.result())
+            except Exception as e:  # noqa: PIE786
+                future.set_exception(e)
+
+        with self._lock:
+            self._watched.append(watched)
+        watched.add_done_callback(resolve)
+        _chain(self.client.receipt_waiter.watch(tx_hash), watched)
+
+    def add_replacement(
+        self, tx_hash: bytes, tx_params: ITransactionRequestConfig
+    ) -> None:
+        """Track transaction replacing this one (with the same nonce).
 
-    def get_receipt(self, timeout: int = 120) -> ITransactionReceipt:
+        Hash and parameters of the result are those of the latest replacement
+        until one of transactions is mined, then those of the mined one.
+        """
+        future = self.future
+        with self._lock:
+            if self._mined:
+                return
+            self.tx_hash, self.tx_params = tx_hash, tx_params
+        self._watch(future, tx_hash, tx_params)
+
+    def get_receipt(self, timeout: float = 120) -> ITransactionReceipt:
         """Get transaction receipt.
 
         Args:
@@ -54,13 +162,23 @@ class TransactionWriteResult(ITransactionWriteResult):
 
         Raises:
             AttributeError: if called on transaction that was not performed.
+            TimeExhausted: if transaction is not mined in ``timeout`` seconds.
         """
-        if not self.tx_hash:
-            raise AttributeError('This transaction was not executed.')
-        receipt = self.client._web3.eth.wait_for_transaction_receipt(
-            HexBytes(self.tx_hash), timeout=timeout
-        )
-        return web3_receipt_to_matic_receipt(receipt)
+        try:
+            return self.future.result(timeout)
+        except futures.TimeoutError:
+            raise TimeExhausted(
+                f'Transaction {HexBytes(self.transaction_hash).hex()} is not in the'
+                f' chain after {timeout} seconds'
+            ) from None
+
+    def done(self) -> bool:
+        """Check whether receipt is known (or waiting for it has failed)."""
+        return self.future.done()
+
+    def add_done_callback(self, fn: Callable[[ITransactionWriteResult], Any]) -> None:
+        """Call ``fn(self)`` (in waiter thread) once receipt is known."""
+        self.future.add_done_callback(lambda _: fn(self))
 
     @property
     def transaction_hash(self) -> bytes:
@@ -80,24 +198,46 @@ class TransactionWriteResult(ITransactionWriteResult):
 
 
 class EthMethod(BaseContractMethod):
-    """Wrapper around web3 contract method (:class:`web3.method.Method`)."""
+    """Wrapper around web3 contract method (:class:`web3.contract.ContractFunction`).
+
+    ``function`` (precompiled from ABI) is used for encoding, decoding
+    and direct reads (see :meth:`read`). It is compiled here if not given.
+    """
 
     def __init__(
-        self, address: HexAddress, method: Method[Any], client: Web3Client
+        self,
+        address: HexAddress,
+        method: ContractFunction,
+        client: Web3Client,
+        function: CompiledFunction | None = None,
     ) -> None:
         super().__init__(address, method)
         self.method = method
         self.address = address
         self.client = client
+        self.function = function or CompiledFunction.from_abi(method.abi, method)
 
     def read(
         self,
         tx: ITransactionRequestConfig | None = None,
         return_transaction: bool = False,
+        block_identifier: BlockIdentifier | None = None,
+        direct: bool | None = None,
     ) -> Any:
         """Perform a read operation.
 
         This does not sign a transaction and does not affect the chain.
+
+        Args:
+            tx: Transaction parameters.
+            return_transaction: Return prepared transaction instead of calling.
+            block_identifier: Block to read state at (default block of web3
+                if missing). Reads at finalized blocks are cached
+                if client has ``read_cache``.
+            direct: Send bare ``eth_call`` to provider, bypassing web3 formatters
+                and middlewares, including provider ones
+                (defaults to :attr:`Web3Client.direct_reads`).
+                Result is decoded the same way.
         """
         matic.logger.debug('sending tx with config %s', tx)
 
@@ -107,8 +247,71 @@ class EthMethod(BaseContractMethod):
             tx['to'] = self.address
             return tx
 
+        is_direct = self.client.direct_reads if direct is None else direct
+        cache = self.client.read_cache
+        if cache is None or block_identifier is None:
+            return self._read(tx, is_direct, block_identifier)
+
+        return cache.get_or_read(
+            self.method.address,
+            self.encode_abi(),
+            (tx or {}).get('from'),
+            block_identifier,
+            lambda: self._read(tx, is_direct, block_identifier),
+        )
+
+    def _read(
+        self,
+        tx: ITransactionRequestConfig | None,
+        direct: bool,
+        block_identifier: BlockIdentifier | None,
+    ) -> Any:
+        if direct:
+            return self._read_direct(tx, block_identifier)
+
         web3_tx = matic_tx_request_config_to_web3(tx)
-        return self.method.call(web3_tx)
+        if block_identifier is None:
+            return self.method.call(web3_tx)
+        return self.method.call(web3_tx, block_identifier)
+
+    def _read_direct(
+        self,
+        tx: ITransactionRequestConfig | None,
+        block_identifier: BlockIdentifier | None = None,
+    ) -> Any:
+        params: dict[str, Any] = {
+            k: hex(v) if isinstance(v, int) else v
+            for k, v in matic_tx_request_config_to_web3(tx).items()
+            if k != 'chainId'
+        }
+        params['to'] = self.method.address
+        params['data'] = '0x' + self.function.encode_input(self.method.args).hex()
+
+        web3 = self.client._web3
+        if web3.eth.default_account is not empty:
+            params.setdefault('from', web3.eth.default_account)
+        if block_identifier is None:
+            block_identifier = web3.eth.default_block
+        if isinstance(block_identifier, int):
+            block_identifier = HexStr(hex(block_identifier))
+        elif isinstance(block_identifier, bytes):
+            block_identifier = HexStr('0x' + bytes(block_identifier).hex())
+        response = web3.provider.make_request(
+            RPCEndpoint('eth_call'), [params, block_identifier]
+        )
+        if 'error' in response:
+            raise_solidity_error_on_revert(response)
+            raise ValueError(response['error'])
+
+        data = HexBytes(response['result'])
+        try:
+            return self.decode_result(data)
+        except DecodingError as e:
+            raise BadFunctionCallOutput(
+                f'Could not decode contract function call to {self.function.name}'
+                f' with return data: {data!r},'
+                f' output_types: {self.function.output_types}'
+            ) from e
 
     def write(
         self,
@@ -140,6 +343,15 @@ class EthMethod(BaseContractMethod):
             res, web3_tx_request_config_to_matic(tx_prep), self.client
         )
 
+    def build_transaction(
+        self, tx: ITransactionRequestConfig
+    ) -> ITransactionRequestConfig:
+        """Add contract address and call data to transaction (no network calls)."""
+        built = tx.copy()
+        built['to'] = self.address
+        built['data'] = self.encode_abi()
+        return built
+
     def estimate_gas(self, tx: ITransactionRequestConfig) -> int:
         """Estimate gas for given transaction.
 
@@ -150,61 +362,104 @@ class EthMethod(BaseContractMethod):
 
     def encode_abi(self) -> bytes:
         """Encode args according to method ABI and prepend the selector."""
-        abi = [e['type'] for e in self.method.abi['inputs']]
-        return bytes.fromhex(removeprefix(self.method.selector, '0x')) + encode_abi(
-            abi, self.method.args
-        )
+        return self.function.encode_input(self.method.args)
+
+    def decode_result(self, data: bytes) -> Any:
+        """Decode raw data returned by this method call (as web3 does)."""
+        return self.function.decode_result(data)
 
 
 class Web3Contract(BaseContract):
-    """A wrapper around web3 contract (:class:`web3.contract.Contract`)."""
+    """A wrapper around web3 contract (:class:`web3.contract.Contract`).
 
-    def __init__(self, address: HexAddress, contract: Contract, client: Web3Client):
+    Contract class (factory) and its dispatch table are shared by all contracts
+    with the same ABI, only the address is bound per instance.
+    """
+
+    def __init__(
+        self, address: HexAddress, factory: type[Contract], client: Web3Client
+    ):
         super().__init__(address)
-        self.contract = contract
+        self.factory = factory
         self.client = client
+        self.dispatch = client.get_dispatch_table(factory)
+
+        # Bare instance: enough to look up functions bound to our address,
+        # but skips building per-instance function/event tables in __init__.
+        self._bound = object.__new__(factory)
+        if is_ens_name(address):
+            # Web3.ens builds a new ENS instance on every access, avoid otherwise.
+            self._bound.address = normalize_address(
+                client._web3.ens, ChecksumAddress(address)
+            )
+        else:
+            validate_address(address)
+            self._bound.address = ChecksumAddress(address)
+
+    @cached_property
+    def contract(self) -> Contract:
+        """Full web3 contract instance."""
+        return self.factory(address=self._bound.address)
 
     def _get_function_by_name_and_args(
         self, method_name: str, args: Sequence[Any]
-    ) -> Any:
-        by_name = self.contract.find_functions_by_name(method_name)
-        if not by_name:
-            raise ValueError('No function with matching name.')
-        elif len(by_name) == 1:
-            return by_name.pop()
-        else:
-            by_args = self.contract.find_functions_by_args(*args)
-            # No __eq__, so this weird thing instead of set() & set()
-            both = [fn for fn in by_args if fn.fn_name == method_name]
-
-            if not both:
-                raise ValueError('No function with matching name and args.')
-            elif len(both) == 1:
-                return both.pop()
-            else:
-                raise ValueError('Cannot resolve function by name and args.')
+    ) -> CompiledFunction:
+        return self.dispatch.resolve(method_name, args)
 
     def method(self, method_name: str, *args: Any) -> EthMethod:
         """Obtain a method object by name and call arguments."""
         matic.logger.debug('method_name %s; args method %s', method_name, args)
+        function = self._get_function_by_name_and_args(method_name, args)
         return EthMethod(
             self.address,
-            self._get_function_by_name_and_args(method_name, args)(*args),
+            function.bind(self._bound.address, args),
             self.client,
+            function,
         )
 
 
 class Web3Client(BaseWeb3Client):
-    """Implementation of web3 client."""
+    """Implementation of web3 client.
+
+    Args:
+        provider: web3 provider.
+        direct_reads: Perform contract reads with bare ``eth_call``
+            (see :meth:`EthMethod.read`). Middlewares are not applied to them.
+        read_cache_size: Max number of cached reads at finalized blocks
+            (see :mod:`matic.web3_client.read_cache`), no caching if 0.
+        fee_speed: Default speed of :meth:`get_fee_suggestion`
+            (``'slow'``, ``'normal'`` or ``'fast'``).
+        fee_refresh_interval: Min time (in seconds) between fee samples
+            (see :mod:`matic.web3_client.fee_oracle`).
+    """
 
     _web3: Web3
 
-    def __init__(self, provider: BaseProvider):
+    def __init__(
+        self,
+        provider: BaseProvider,
+        *,
+        direct_reads: bool = False,
+        read_cache_size: int = 0,
+        fee_speed: FeeSpeed = 'normal',
+        fee_refresh_interval: float = DEFAULT_FEE_REFRESH_INTERVAL,
+    ):
         from web3.middleware import geth_poa_middleware
 
         super().__init__(provider)
+        self.direct_reads = direct_reads
+        self.read_cache = ReadCache(self, read_cache_size) if read_cache_size else None
+        self.fee_speed: FeeSpeed = fee_speed
+        self.fee_oracle = FeeOracle(self, refresh_interval=fee_refresh_interval)
+        self._chain_id: int | None = None
         self._web3 = Web3(provider)
         self._web3.middleware_onion.inject(geth_poa_middleware, layer=0)
+        self._contract_factories: dict[str, type[Contract]] = {}
+        self._dispatch_tables: dict[type[Contract], DispatchTable] = {}
+        # id(abi) -> (abi, fingerprint) of recent ABIs, least recent first;
+        # ABI is kept alive so id is not reused while it is cached
+        self._abi_fingerprints: OrderedDict[int, tuple[Any, str]] = OrderedDict()
+        self._abi_lock = threading.Lock()
 
     def read(
         self, config: ITransactionRequestConfig, return_transaction: bool = False
@@ -238,15 +493,110 @@ class Web3Client(BaseWeb3Client):
 
         return TransactionWriteResult(tx_result, config, self)
 
-    def get_contract(self, address: HexAddress, abi: dict[str, Any]) -> Web3Contract:
+    def _get_abi_fingerprint(self, abi: Any) -> str:
+        # Contracts are created from executor, bulk sender and waiter threads
+        with self._abi_lock:
+            cached = self._abi_fingerprints.get(id(abi))
+            if cached is not None and cached[0] is abi:
+                self._abi_fingerprints.move_to_end(id(abi))
+                return cached[1]
+
+        encoded = json.dumps(abi, sort_keys=True, separators=(',', ':'))
+        fingerprint = hashlib.sha256(encoded.encode()).hexdigest()
+        with self._abi_lock:
+            self._abi_fingerprints[id(abi)] = (abi, fingerprint)
+            self._abi_fingerprints.move_to_end(id(abi))
+            if len(self._abi_fingerprints) > ABI_FINGERPRINT_CACHE_SIZE:
+                self._abi_fingerprints.popitem(last=False)
+        return fingerprint
+
+    def get_contract_factory(self, abi: Any) -> type[Contract]:
+        """Get contract class for ABI, reusing it for identical ABIs."""
+        fingerprint = self._get_abi_fingerprint(abi)
+        factory = self._contract_factories.get(fingerprint)
+        if factory is None:
+            # Concurrent callers keep the first one stored
+            factory = self._contract_factories.setdefault(
+                fingerprint, self._web3.eth.contract(abi=abi)
+            )
+        return factory
+
+    def get_dispatch_table(self, factory: type[Contract]) -> DispatchTable:
+        """Get (shared) precompiled dispatch table of contract class."""
+        table = self._dispatch_tables.get(factory)
+        if table is None:
+            table = self._dispatch_tables.setdefault(factory, DispatchTable(factory))
+        return table
+
+    def get_contract(self, address: HexAddress, abi: Any) -> Web3Contract:
         """Obtain a contract from deployment address and ABI dictionary."""
-        cont = self._web3.eth.contract(abi=abi, address=cast(Any, address))
-        return Web3Contract(address, cont, self)
+        return Web3Contract(address, self.get_contract_factory(abi), self)
+
+    def sign_transaction(
+        self, config: ITransactionRequestConfig, private_key: str
+    ) -> bytes:
+        """Sign complete transaction locally (no network calls), return raw bytes."""
+        web3_tx = dict(matic_tx_request_config_to_web3(config))
+        web3_tx.pop('hardfork', None)
+        signed = self._web3.eth.account.sign_transaction(web3_tx, private_key)
+        return bytes(signed.rawTransaction)
+
+    def send_raw_transaction(
+        self,
+        raw_transaction: bytes,
+        config: ITransactionRequestConfig | None = None,
+    ) -> TransactionWriteResult:
+        """Send transaction signed locally (config it was built from is optional)."""
+        tx_hash = self._web3.eth.send_raw_transaction(raw_transaction)
+        return TransactionWriteResult(tx_hash, config or {}, self)
+
+    def send_raw_transactions(
+        self, transactions: Sequence[tuple[bytes, ITransactionRequestConfig]]
+    ) -> list[ITransactionWriteResult | Exception]:
+        """Send transactions signed locally (with their configs) in order.
+
+        They are sent as one JSON-RPC batch if provider supports it
+        (see :class:`~matic.web3_client.batching.BatchingHTTPProvider`).
+        Otherwise they are sent one by one, stopping at the first failure.
+
+        Returns:
+            Result or error of every transaction.
+        """
+        provider = self._web3.provider
+        if not isinstance(provider, BatchingHTTPProvider):
+            return super().send_raw_transactions(transactions)
+
+        method = RPCEndpoint('eth_sendRawTransaction')
+        try:
+            responses = provider.make_batch_request(
+                [(method, [HexBytes(raw).hex()]) for raw, _ in transactions]
+            )
+        except Exception as e:  # noqa: PIE786
+            return [e] * len(transactions)
+        return [
+            TransactionWriteResult(HexBytes(response['result']), config, self)
+            if 'result' in response
+            else ValueError(response.get('error'))
+            for response, (_, config) in zip(responses, transactions)
+        ]
 
     @property
     def gas_price(self) -> int:
-        """Current gas price."""
-        return self._web3.eth.gas_price
+        """Current gas price (shared by callers within fee refresh interval)."""
+        return self.fee_oracle.gas_price
+
+    def get_fee_suggestion(
+        self, speed: FeeSpeed | None = None
+    ) -> IFeeSuggestion | None:
+        """Get EIP-1559 fees for transaction from :attr:`fee_oracle`.
+
+        Returns None if node cannot provide fee history.
+        """
+        try:
+            return self.fee_oracle.suggest(speed or self.fee_speed)
+        except Exception as e:  # noqa: PIE786
+            matic.logger.warning('Fee history is not available: %r', e)
+            return None
 
     def estimate_gas(self, transaction: ITransactionRequestConfig) -> int:
         """Estimate gas amount for transaction."""
@@ -258,8 +608,10 @@ class Web3Client(BaseWeb3Client):
 
     @property
     def chain_id(self) -> int:
-        """Current chain id."""
-        return self._web3.eth.chain_id
+        """Chain id (fetched once: it never changes for a node)."""
+        if self._chain_id is None:
+            self._chain_id = self._web3.eth.chain_id
+        return self._chain_id
 
     def _ensure_transaction_not_null(self, data: object) -> None:
         if not data:
@@ -275,14 +627,20 @@ class Web3Client(BaseWeb3Client):
         return web3_tx_to_matic_tx(data)
 
     def get_transaction_receipt(
-        self, transaction_hash: bytes, timeout: int = 120
+        self, transaction_hash: bytes, timeout: float = 120
     ) -> ITransactionReceipt:
-        """Get receipt for transaction."""
-        data = self._web3.eth.wait_for_transaction_receipt(
-            HexBytes(transaction_hash), timeout
-        )
-        self._ensure_transaction_not_null(data)
-        return web3_receipt_to_matic_receipt(data)
+        """Get receipt for transaction (wait max ``timeout`` seconds)."""
+        result = TransactionWriteResult(transaction_hash, {}, self)
+        return result.get_receipt(timeout)
+
+    @cached_property
+    def receipt_waiter(self) -> ReceiptWaiter:
+        """Shared waiter for transaction receipts."""
+        return ReceiptWaiter(self)
+
+    def get_block_number(self) -> int:
+        """Get number of the latest block."""
+        return self._web3.eth.block_number
 
     def get_block(self, block_hash_or_block_number: BlockIdentifier) -> IBlock:
         """Get block (with raw transaction data) by hash or number."""
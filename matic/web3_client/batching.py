@@ -0,0 +1,221 @@
+"""HTTP provider sending concurrent requests as JSON-RPC batches.
+
+Every request to a node is a separate HTTP round trip. When several threads
+read at the same time (e.g. proof building or transaction preparation),
+:class:`BatchingHTTPProvider` sends their requests together as one
+`JSON-RPC batch <https://www.jsonrpc.org/specification#batch>`_ and hands
+every caller its own response. No call site has to change::
+
+    provider = BatchingHTTPProvider('https://rpc-mumbai.maticvigil.com')
+    pos_client = POSClient({'child': {'provider': provider, ...}, ...})
+
+Requests are batched only when they overlap: if nothing else is in flight,
+request is sent right away, so sequential code gets no extra latency.
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+from concurrent.futures import Future
+from typing import Any, Final, Sequence, cast
+
+import requests
+from eth_typing import URI
+from eth_utils import to_bytes, to_text
+from web3._utils.encoding import FriendlyJsonSerde
+from web3._utils.request import make_post_request
+from web3.providers import HTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+__all__ = ['DEFAULT_BATCH_WINDOW', 'DEFAULT_MAX_BATCH_SIZE', 'BatchingHTTPProvider']
+
+DEFAULT_BATCH_WINDOW: Final = 0.002
+"""Time (in seconds) to wait for other requests to join a batch."""
+
+DEFAULT_MAX_BATCH_SIZE: Final = 50
+"""Max number of requests in one batch."""
+
+
+def _is_rejection(error: requests.HTTPError) -> bool:
+    """Whether node refused batch itself (4xx other than rate limiting)."""
+    if error.response is None:
+        return False
+    status = error.response.status_code
+    return 400 <= status < 500 and status != 429
+
+
+class _Batch:
+    """Requests collected to be sent together."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[RPCEndpoint, Any, Future[RPCResponse]]] = []
+        self.full = threading.Event()
+
+
+class BatchingHTTPProvider(HTTPProvider):
+    """HTTP provider combining concurrent requests into JSON-RPC batches.
+
+    The first request of a batch waits up to ``window`` seconds for requests
+    from other threads (but only if some other request is already in flight).
+    Batch is sent earlier once it has ``max_batch_size`` requests.
+
+    If node rejects a batch (answers with a client error or not with a list
+    of responses), provider falls back to one request per call from then on.
+    On other failures (e.g. server errors) only requests of that batch
+    are resent one by one.
+
+    Args:
+        endpoint_uri: Node URL.
+        request_kwargs: Extra arguments for :func:`requests.post`.
+        session: :class:`requests.Session` to use.
+        window: Time (in seconds) to collect a batch.
+        max_batch_size: Max number of requests in one batch.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: URI | str | None = None,
+        request_kwargs: Any | None = None,
+        session: Any | None = None,
+        *,
+        window: float = DEFAULT_BATCH_WINDOW,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError('max_batch_size must be positive.')
+        super().__init__(endpoint_uri, request_kwargs, session)
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.batching_supported = True
+        """Whether node accepts batches (reset to False on first rejection)."""
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._pending: _Batch | None = None
+        self._in_flight = 0
+
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        """Send request, possibly in one batch with concurrent ones."""
+        if not self.batching_supported:
+            return super().make_request(method, params)
+
+        future: Future[RPCResponse] = Future()
+        with self._lock:
+            batch = self._pending
+            is_leader = batch is None
+            should_wait = self._in_flight > 0
+            if batch is None:
+                batch = self._pending = _Batch()
+            batch.requests.append((method, params, future))
+            if len(batch.requests) >= self.max_batch_size:
+                self._pending = None
+                batch.full.set()
+            self._in_flight += 1
+
+        try:
+            if is_leader:
+                if should_wait:
+                    batch.full.wait(self.window)
+                with self._lock:
+                    if self._pending is batch:
+                        self._pending = None
+                self._send(batch.requests)
+            return future.result()
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def make_batch_request(
+        self, calls: Sequence[tuple[RPCEndpoint, Any]]
+    ) -> list[RPCResponse]:
+        """Send requests together, in order (see :meth:`make_request`).
+
+        Requests are split into batches of ``max_batch_size``; they are sent
+        one by one if node does not accept batches.
+
+        Returns:
+            Responses in order of requests.
+        """
+        batch: list[tuple[RPCEndpoint, Any, Future[RPCResponse]]] = [
+            (method, params, Future()) for method, params in calls
+        ]
+        for start in range(0, len(batch), self.max_batch_size):
+            self._send(batch[start : start + self.max_batch_size])
+        return [future.result() for _, _, future in batch]
+
+    def _send(self, batch: list[tuple[RPCEndpoint, Any, Future[RPCResponse]]]) -> None:
+        if len(batch) == 1 or not self.batching_supported:
+            for method, params, future in batch:
+                self._send_one(method, params, future)
+            return
+
+        payload: dict[int, dict[str, Any]] = {
+            next(self._ids): {
+                'jsonrpc': '2.0',
+                'method': method,
+                'params': params or [],
+            }
+            for method, params, _ in batch
+        }
+        try:
+            responses = self._post(
+                [{**request, 'id': id_} for id_, request in payload.items()]
+            )
+        except Exception as e:  # noqa: PIE786
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        by_id = {
+            response.get('id'): response
+            for response in responses
+            if isinstance(response, dict)
+        }
+        for id_, (method, params, future) in zip(payload, batch):
+            response = by_id.get(id_)
+            if response is None:
+                self._send_one(method, params, future)
+            else:
+                future.set_result(cast(RPCResponse, response))
+
+    def _post(self, requests_data: list[dict[str, Any]]) -> list[Any]:
+        """Send batch, get responses (empty list if batch was not answered)."""
+        request_data = to_bytes(
+            text=FriendlyJsonSerde().json_encode(cast(Any, requests_data))
+        )
+        self.logger.debug(
+            'Making batch request HTTP. URI: %s, Size: %d',
+            self.endpoint_uri,
+            len(requests_data),
+        )
+        try:
+            raw_response = make_post_request(
+                cast(URI, self.endpoint_uri), request_data, **self.get_request_kwargs()
+            )
+        except requests.HTTPError as e:
+            if _is_rejection(e):
+                self._disable_batching()
+            else:
+                self.logger.warning(
+                    'Batch request failed (%s), resending one by one.', e
+                )
+            return []
+
+        # json_decode is annotated to return dict, but batch answer is a list
+        responses: Any = FriendlyJsonSerde().json_decode(to_text(raw_response))
+        if not isinstance(responses, list):
+            self._disable_batching()
+            return []
+        return responses
+
+    def _disable_batching(self) -> None:
+        self.logger.warning('Batch request rejected, batching disabled.')
+        self.batching_supported = False
+
+    def _send_one(
+        self, method: RPCEndpoint, params: Any, future: Future[RPCResponse]
+    ) -> None:
+        try:
+            future.set_result(super().make_request(method, params))
+        except Exception as e:  # noqa: PIE786
+            future.set_exception(e)
@@ -0,0 +1,184 @@
+"""Precompiled function dispatch for contract ABIs.
+
+Looking a function up with web3 scans the whole ABI, creates a new function
+class and hashes the signature again on every call. Encoding rebuilds
+the type list and the tuple encoder each time as well.
+:class:`DispatchTable` does all of this once per ABI.
+"""
+
+from __future__ import annotations
+
+import copy
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Sequence, cast
+
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.encoding import TupleEncoder
+from eth_abi.registry import registry
+from eth_typing import ChecksumAddress, HexStr
+from eth_utils import function_abi_to_4byte_selector
+from web3._utils.abi import (
+    check_if_arguments_can_be_encoded,
+    filter_by_type,
+    get_abi_input_types,
+    get_abi_output_types,
+    map_abi_data,
+)
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract import Contract, ContractFunction
+from web3.types import ABIFunction
+
+__all__ = ['CompiledFunction', 'DispatchTable', 'get_decoder', 'get_encoder']
+
+
+@lru_cache(maxsize=None)
+def get_encoder(types: tuple[str, ...]) -> TupleEncoder:
+    """Get (cached) encoder of values tuple."""
+    return TupleEncoder(encoders=[registry.get_encoder(t) for t in types])
+
+
+@lru_cache(maxsize=None)
+def get_decoder(types: tuple[str, ...]) -> TupleDecoder:
+    """Get (cached) decoder of values tuple."""
+    return TupleDecoder(decoders=[registry.get_decoder(t) for t in types])
+
+
+@dataclass(frozen=True)
+class CompiledFunction:
+    """Contract function with selector and codecs computed in advance."""
+
+    abi: ABIFunction
+    """Function ABI."""
+    selector: bytes
+    """4-byte function selector."""
+    input_types: tuple[str, ...]
+    """ABI types of arguments."""
+    output_types: tuple[str, ...]
+    """ABI types of return values."""
+    template: ContractFunction
+    """web3 function of contract factory (not bound to address and args)."""
+    checksum_output: bool = False
+    """Whether return values contain addresses (to be checksummed)."""
+
+    @classmethod
+    def from_abi(cls, abi: ABIFunction, template: ContractFunction) -> CompiledFunction:
+        """Compute selector and codecs of function."""
+        output_types = tuple(get_abi_output_types(abi))
+        return cls(
+            abi=abi,
+            selector=function_abi_to_4byte_selector(cast('dict[str, Any]', abi)),
+            input_types=tuple(get_abi_input_types(abi)),
+            output_types=output_types,
+            template=template,
+            checksum_output=any('address' in t for t in output_types),
+        )
+
+    @property
+    def name(self) -> str:
+        """Function name."""
+        return self.abi['name']
+
+    def encode_input(self, args: Sequence[Any]) -> bytes:
+        """Encode call data: selector followed by encoded arguments."""
+        return self.selector + get_encoder(self.input_types)(args)
+
+    def decode_output(self, data: bytes) -> tuple[Any, ...]:
+        """Decode return data to tuple of values."""
+        return get_decoder(self.output_types)(ContextFramesBytesIO(data))
+
+    def decode_result(self, data: bytes) -> Any:
+        """Decode return data the same way web3 contract call does.
+
+        Addresses are checksummed; single value is unwrapped,
+        multiple values are returned as a list.
+        """
+        values = self.decode_output(data)
+        if self.checksum_output:
+            result = map_abi_data(BASE_RETURN_NORMALIZERS, self.output_types, values)
+        else:
+            result = list(values)
+        return result[0] if len(result) == 1 else result
+
+    def bind(self, address: ChecksumAddress, args: Sequence[Any]) -> ContractFunction:
+        """Get web3 function call for given address and args (no ABI lookup)."""
+        fn = copy.copy(self.template)
+        fn.abi = self.abi
+        fn.address = address
+        fn.args = fn.arguments = tuple(args)
+        fn.kwargs = {}
+        fn.selector = HexStr('0x' + self.selector.hex())
+        return fn
+
+
+class DispatchTable:
+    """Functions of contract ABI grouped by name.
+
+    Functions are compiled on first access. If arity alone tells overloads
+    apart, resolution result is cached by ``(name, number of args)``.
+    Otherwise arguments are checked against every overload on each call
+    (same values of different size, like ``uint8`` and ``uint256``,
+    may resolve differently).
+
+    Args:
+        factory: web3 contract class.
+    """
+
+    def __init__(self, factory: type[Contract]) -> None:
+        self.factory = factory
+        self._abis: dict[str, list[ABIFunction]] = {}
+        for fn_abi in filter_by_type('function', factory.abi):
+            self._abis.setdefault(fn_abi['name'], []).append(cast(ABIFunction, fn_abi))
+        self._compiled: dict[str, tuple[CompiledFunction, ...]] = {}
+        self._resolved: dict[tuple[str, int], CompiledFunction] = {}
+
+    def overloads(self, name: str) -> tuple[CompiledFunction, ...]:
+        """Get all functions with given name."""
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            abis = self._abis.get(name, [])
+            compiled = self._compiled[name] = tuple(
+                CompiledFunction.from_abi(fn_abi, getattr(self.factory.functions, name))
+                for fn_abi in abis
+            )
+        return compiled
+
+    def resolve(self, name: str, args: Sequence[Any]) -> CompiledFunction:
+        """Find function by name and call arguments.
+
+        Raises:
+            ValueError: if there is no matching function or match is ambiguous.
+        """
+        key = (name, len(args))
+        cached = self._resolved.get(key)
+        if cached is not None:
+            return cached
+
+        overloads = self.overloads(name)
+        if not overloads:
+            raise ValueError('No function with matching name.')
+        elif len(overloads) == 1:
+            expected = len(overloads[0].input_types)
+            if expected != len(args):
+                raise ValueError(
+                    f'Function {name} takes {expected} arguments, {len(args)} given.'
+                )
+            self._resolved[key] = overloads[0]
+            return overloads[0]
+
+        same_arity = [fn for fn in overloads if len(fn.input_types) == len(args)]
+        matching = [
+            fn
+            for fn in same_arity
+            if check_if_arguments_can_be_encoded(
+                fn.abi, self.factory.web3.codec, args, {}
+            )
+        ]
+        if not matching:
+            raise ValueError('No function with matching name and args.')
+        elif len(matching) > 1:
+            raise ValueError('Cannot resolve function by name and args.')
+
+        if len(same_arity) == 1:
+            self._resolved[key] = matching[0]
+        return matching[0]
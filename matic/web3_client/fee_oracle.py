@@ -0,0 +1,142 @@
+"""Shared source of transaction fee suggestions.
+
+Asking the node for fees on every write costs one or two round trips
+(``eth_gasPrice``, or ``eth_maxPriorityFeePerGas`` and the latest block),
+while fees change at most once per block. :class:`FeeOracle` samples
+``eth_feeHistory`` of recent blocks at most once per ``refresh_interval``
+(set it to block time of the chain) and serves suggestions to all
+concurrent writers from memory.
+
+Each :class:`~matic.web3_client.Web3Client` has its own oracle
+(:attr:`~matic.web3_client.Web3Client.fee_oracle`). Missing EIP-1559 fees of
+transactions on chains supporting it are filled with suggestion of
+``fee_speed`` (parent or child config key, ``'normal'`` by default)::
+
+    pos_client = POSClient({'parent': {..., 'fee_speed': 'fast'}, ...})
+"""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+from typing import TYPE_CHECKING, Final
+
+import matic
+from matic.json_types import FeeSpeed, IFeeSuggestion
+
+if TYPE_CHECKING:
+    from matic.web3_client import Web3Client
+
+__all__ = [
+    'DEFAULT_FEE_HISTORY_BLOCKS',
+    'DEFAULT_FEE_REFRESH_INTERVAL',
+    'FEE_SPEED_PERCENTILES',
+    'FeeOracle',
+]
+
+FEE_SPEED_PERCENTILES: Final[dict[FeeSpeed, int]] = {
+    'slow': 10,
+    'normal': 50,
+    'fast': 90,
+}
+"""Percentile of priority fees paid in recent blocks suggested for each speed."""
+
+DEFAULT_FEE_HISTORY_BLOCKS: Final = 20
+"""Number of recent blocks priority fees are sampled from."""
+
+DEFAULT_FEE_REFRESH_INTERVAL: Final = 2.0
+"""Min time (in seconds) between samples: block time of Polygon PoS chain."""
+
+
+class FeeOracle:
+    """Thread-safe cache of fee suggestions for one chain.
+
+    Priority fee of a speed is median (over recent non-empty blocks) of its
+    percentile (:data:`FEE_SPEED_PERCENTILES`) of priority fees paid
+    in a block. Max fee allows base fee to double before transaction
+    is included: ``2 * next base fee + priority fee``.
+
+    Args:
+        client: Client of the chain.
+        block_count: Number of recent blocks to sample.
+        refresh_interval: Min time (in seconds) between samples.
+    """
+
+    def __init__(
+        self,
+        client: Web3Client,
+        block_count: int = DEFAULT_FEE_HISTORY_BLOCKS,
+        refresh_interval: float = DEFAULT_FEE_REFRESH_INTERVAL,
+    ) -> None:
+        self.client = client
+        self.block_count = block_count
+        self.refresh_interval = refresh_interval
+        self._suggestions: dict[FeeSpeed, IFeeSuggestion] = {}
+        self._error: Exception | None = None
+        self._suggested_at = float('-inf')
+        self._gas_price = 0
+        self._gas_price_at = float('-inf')
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Forget sampled fees: they are requested again on next access."""
+        with self._lock:
+            self._suggested_at = self._gas_price_at = float('-inf')
+
+    @property
+    def gas_price(self) -> int:
+        """Legacy gas price (``eth_gasPrice``), requested at most once per interval."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._gas_price_at >= self.refresh_interval:
+                self._gas_price = self.client._web3.eth.gas_price
+                self._gas_price_at = now
+            return self._gas_price
+
+    def suggest(self, speed: FeeSpeed = 'normal') -> IFeeSuggestion:
+        """Get EIP-1559 fees for transaction to be included with given speed.
+
+        Failure is cached as well: node is not asked again until
+        ``refresh_interval`` passes.
+
+        Raises:
+            ValueError: if node failed to return fee history.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._suggested_at >= self.refresh_interval:
+                try:
+                    self._suggestions, self._error = self._sample(), None
+                except Exception as e:  # noqa: PIE786
+                    self._suggestions, self._error = {}, e
+                self._suggested_at = now
+            if self._error is not None:
+                raise ValueError(
+                    f'Fee history sampling failed: {self._error!r}'
+                ) from self._error
+            return self._suggestions[speed].copy()
+
+    def _sample(self) -> dict[FeeSpeed, IFeeSuggestion]:
+        history = self.client._web3.eth.fee_history(
+            self.block_count, 'latest', list(FEE_SPEED_PERCENTILES.values())
+        )
+        # Base fee of the next block is included as the last item
+        base_fee = history['baseFeePerGas'][-1]
+        rewards = [
+            reward
+            for reward, ratio in zip(history.get('reward', []), history['gasUsedRatio'])
+            if ratio > 0
+        ] or history.get('reward', [])
+        if not rewards:
+            raise ValueError('Node returned empty fee history.')
+
+        matic.logger.debug('Sampled fee history: %s', history)
+        suggestions: dict[FeeSpeed, IFeeSuggestion] = {}
+        for column, speed in enumerate(FEE_SPEED_PERCENTILES):
+            priority_fee = int(statistics.median(reward[column] for reward in rewards))
+            suggestions[speed] = {
+                'max_fee_per_gas': 2 * base_fee + priority_fee,
+                'max_priority_fee_per_gas': priority_fee,
+            }
+        return suggestions
@@ -0,0 +1,159 @@
+"""Cache of contract reads at finalized blocks.
+
+State at a finalized block never changes, so a read pinned to such block
+(``block_identifier`` option of reads) always returns the same result.
+:class:`ReadCache` keeps these results; reads at ``latest`` and other moving
+tags, or at blocks that are not finalized yet, always go to the node.
+
+Enable it with ``read_cache_size`` key of parent or child config
+(or argument of :class:`~matic.web3_client.Web3Client`)::
+
+    pos_client = POSClient({'child': {'provider': ..., 'read_cache_size': 4096}, ...})
+    token = pos_client.erc_20(token_address)
+    token.get_balance(user, {'block_identifier': 30_000_000})  # node is called
+    token.get_balance(user, {'block_identifier': 30_000_000})  # from cache
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Final, Hashable
+
+from web3.types import BlockIdentifier, RPCEndpoint
+
+if TYPE_CHECKING:
+    from matic.web3_client import Web3Client
+
+__all__ = ['FALLBACK_CONFIRMATIONS', 'ReadCache']
+
+FALLBACK_CONFIRMATIONS: Final = 256
+"""Blocks considered final if node does not support ``finalized`` block tag."""
+
+_MISSING: Final = object()
+
+_INVALID_PARAMS: Final = -32602
+# Parts of messages of nodes that do not know ``finalized`` tag
+_UNSUPPORTED_TAG_MARKERS: Final = (
+    'finalized',
+    'block tag',
+    'invalid argument',
+    'hex string',
+)
+
+
+def _normalize_block(block: BlockIdentifier) -> int | str | None:
+    """Get block number or lowercase hash; None for tags like ``latest``."""
+    if isinstance(block, bytes):
+        return '0x' + bytes(block).hex() if len(block) == 32 else None
+    if isinstance(block, int):
+        return block
+    if isinstance(block, str) and block.startswith('0x'):
+        return block.lower() if len(block) == 66 else int(block, 16)
+    return None
+
+
+def _is_unsupported_tag_error(error: Any) -> bool:
+    """Whether node rejected ``finalized`` block tag (error or its RPC payload)."""
+    if isinstance(error, dict):
+        if error.get('code') == _INVALID_PARAMS:
+            return True
+        error = error.get('message', '')
+    message = str(error).lower()
+    return any(marker in message for marker in _UNSUPPORTED_TAG_MARKERS)
+
+
+class ReadCache:
+    """Thread-safe LRU cache of reads pinned to finalized blocks.
+
+    Key is ``(address, calldata, sender, block)``: chain is fixed by client.
+    Reads at block hash are always cached (hash identifies the state exactly).
+    Reads at block number are cached once the block is finalized;
+    last finalized block is refreshed at most every ``refresh_interval``
+    seconds.
+
+    Args:
+        client: Client of the chain.
+        maxsize: Max number of cached results.
+        refresh_interval: Min time (in seconds) between finalized block lookups.
+    """
+
+    def __init__(
+        self, client: Web3Client, maxsize: int, refresh_interval: float = 1.0
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError('maxsize must be positive.')
+        self.client = client
+        self.maxsize = maxsize
+        self.refresh_interval = refresh_interval
+        self.finalized_block = -1
+        """Number of last known finalized block."""
+        self._refreshed_at = float('-inf')
+        self._finalized_tag_supported = True
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_or_read(
+        self,
+        address: str,
+        calldata: bytes,
+        sender: str | None,
+        block: BlockIdentifier,
+        read: Callable[[], Any],
+    ) -> Any:
+        """Get cached result of read or perform it (caching if possible)."""
+        normalized = _normalize_block(block)
+        if normalized is None:
+            return read()
+
+        key = (address.lower(), calldata, sender and sender.lower(), normalized)
+        with self._lock:
+            value = self._entries.get(key, _MISSING)
+            if value is not _MISSING:
+                self._entries.move_to_end(key)
+                return copy.deepcopy(value)
+
+        value = read()
+        if isinstance(normalized, str) or self._is_finalized(normalized):
+            with self._lock:
+                self._entries[key] = copy.deepcopy(value)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return value
+
+    def _is_finalized(self, block_number: int) -> bool:
+        if block_number <= self.finalized_block:
+            return True
+        now = time.monotonic()
+        if now - self._refreshed_at >= self.refresh_interval:
+            self._refreshed_at = now
+            self.finalized_block = max(self.finalized_block, self._get_finalized())
+        return block_number <= self.finalized_block
+
+    def _get_finalized(self) -> int:
+        if self._finalized_tag_supported:
+            error: Any = None
+            try:
+                response = self.client.send_rpc_request(
+                    RPCEndpoint('eth_getBlockByNumber'), ['finalized', False]
+                )
+                error = response.get('error')
+            except Exception as e:  # noqa: PIE786
+                response, error = {}, e
+            if response.get('result'):
+                return int(response['result']['number'], 16)
+            if error is not None and not _is_unsupported_tag_error(error):
+                # Failed for other reason (e.g. network): try again later
+                return self.finalized_block
+            self._finalized_tag_supported = False
+        return self.client._web3.eth.block_number - FALLBACK_CONFIRMATIONS
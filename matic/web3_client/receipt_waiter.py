@@ -0,0 +1,227 @@
+"""Shared waiting for receipts of many transactions.
+
+Waiting for a receipt with web3 polls the node for this one transaction
+in a loop, so hundreds of pending transactions mean hundreds of pollers.
+:class:`ReceiptWaiter` (one per client, see
+:attr:`~matic.web3_client.Web3Client.receipt_waiter`) watches new blocks
+with one background thread instead: receipts are requested only for watched
+transactions included in new blocks, all at once (as one JSON-RPC batch with
+:class:`~matic.web3_client.batching.BatchingHTTPProvider`).
+
+:class:`~matic.web3_client.TransactionWriteResult` uses it, so results
+behave like futures::
+
+    results = [token.transfer(to, amount) for to in recipients]
+    for result in as_completed(results, timeout=600):
+        print(result.get_receipt().status)
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent import futures
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Final, Iterable, Iterator, cast
+
+from hexbytes.main import HexBytes
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+import matic
+from matic.json_types import ITransactionReceipt
+from matic.web3_client.utils import web3_receipt_to_matic_receipt
+
+if TYPE_CHECKING:
+    from web3.types import TxReceipt
+
+    from matic.web3_client import TransactionWriteResult, Web3Client
+
+__all__ = [
+    'DEFAULT_MAX_PENDING_BLOCKS',
+    'DEFAULT_POLL_INTERVAL',
+    'MAX_SCANNED_BLOCKS',
+    'ReceiptWaiter',
+    'as_completed',
+]
+
+DEFAULT_POLL_INTERVAL: Final = 0.2
+"""Time (in seconds) between checks for new blocks."""
+
+DEFAULT_MAX_PENDING_BLOCKS: Final = 500
+"""Number of blocks after which a transaction not mined is not watched anymore."""
+
+MAX_SCANNED_BLOCKS: Final = 64
+"""Max number of new blocks scanned for watched transactions in one check.
+
+If more blocks were produced since last check, receipts of all watched
+transactions are requested instead.
+"""
+
+
+class ReceiptWaiter:
+    """Thread-safe waiter resolving receipt futures of transactions.
+
+    Background thread runs only while there are watched transactions
+    (cancel the future to stop watching). Transactions not mined in
+    ``max_pending_blocks`` blocks (dropped or replaced ones) are not watched
+    anymore: their futures fail with :class:`~web3.exceptions.TimeExhausted`.
+    Each check requests receipts of transactions added since last check
+    (they may be mined already), then scans blocks produced since last check
+    for other watched transactions and requests their receipts.
+
+    Args:
+        client: Client of the chain.
+        poll_interval: Time (in seconds) between checks for new blocks.
+        max_workers: Max number of concurrent requests of blocks and receipts.
+        max_pending_blocks: Number of blocks to wait for a transaction for.
+    """
+
+    def __init__(
+        self,
+        client: Web3Client,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_workers: int = 8,
+        max_pending_blocks: int = DEFAULT_MAX_PENDING_BLOCKS,
+    ) -> None:
+        self.client = client
+        self.poll_interval = poll_interval
+        self.max_pending_blocks = max_pending_blocks
+        self._executor = ThreadPoolExecutor(
+            max_workers, thread_name_prefix='matic-receipts'
+        )
+        self._pending: dict[bytes, Future[ITransactionReceipt]] = {}
+        self._unchecked: set[bytes] = set()
+        self._first_checked: dict[bytes, int] = {}
+        self._last_block: int | None = None
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def watch(self, tx_hash: bytes) -> Future[ITransactionReceipt]:
+        """Get future of transaction receipt (shared by all watchers of hash)."""
+        key = bytes(tx_hash)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = Future()
+                self._unchecked.add(key)
+                self._wakeup.set()
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name='matic-receipt-waiter', daemon=True
+                    )
+                    self._thread.start()
+        return future
+
+    def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            try:
+                self._check()
+            except Exception as e:  # noqa: PIE786
+                matic.logger.warning('Failed to check for receipts: %r', e)
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    self._last_block = None
+                    return
+            self._wakeup.wait(self.poll_interval)
+
+    def _check(self) -> None:
+        with self._lock:
+            candidates = self._unchecked.copy()
+            self._unchecked.clear()
+            # Cancelled futures are not watched anymore
+            for key, future in list(self._pending.items()):
+                if future.cancelled():
+                    del self._pending[key]
+                    self._first_checked.pop(key, None)
+            pending = set(self._pending)
+
+        try:
+            block_number = self._collect(candidates, pending)
+            keys = list(candidates)
+            receipts = self._executor.map(self._get_receipt, keys)
+            for key, receipt in zip(keys, receipts):
+                if receipt is not None:
+                    self._resolve(key, receipt)
+        except Exception:
+            # Blocks they are in may be scanned already: check them again
+            with self._lock:
+                self._unchecked.update(candidates.intersection(self._pending))
+            raise
+        self._expire(block_number)
+
+    def _collect(self, candidates: set[bytes], pending: set[bytes]) -> int:
+        """Add watched transactions included in new blocks to candidates."""
+        web3 = self.client._web3
+        block_number = web3.eth.block_number
+        first_block = (
+            block_number + 1 if self._last_block is None else self._last_block + 1
+        )
+        if block_number - first_block >= MAX_SCANNED_BLOCKS:
+            candidates.update(pending)
+        elif first_block <= block_number:
+            blocks = self._executor.map(
+                web3.eth.get_block, range(first_block, block_number + 1)
+            )
+            # Blocks are requested without full transactions: hashes only
+            included = {
+                bytes(cast(HexBytes, tx))
+                for block in blocks
+                for tx in block['transactions']
+            }
+            candidates.update(included.intersection(pending))
+        self._last_block = block_number
+        return block_number
+
+    def _expire(self, block_number: int) -> None:
+        with self._lock:
+            expired = []
+            for key in self._pending:
+                first_checked = self._first_checked.setdefault(key, block_number)
+                if block_number - first_checked >= self.max_pending_blocks:
+                    expired.append((key, self._pending[key]))
+            for key, _ in expired:
+                del self._pending[key]
+                del self._first_checked[key]
+        for key, future in expired:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(
+                    TimeExhausted(
+                        f'Transaction {HexBytes(key).hex()} is not in the chain'
+                        f' after {self.max_pending_blocks} blocks'
+                    )
+                )
+
+    def _get_receipt(self, key: bytes) -> TxReceipt | None:
+        try:
+            return self.client._web3.eth.get_transaction_receipt(HexBytes(key))
+        except TransactionNotFound:
+            return None
+
+    def _resolve(self, key: bytes, receipt: TxReceipt) -> None:
+        with self._lock:
+            future = self._pending.pop(key, None)
+            self._first_checked.pop(key, None)
+        if future is None or not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(web3_receipt_to_matic_receipt(receipt))
+        except Exception as e:  # noqa: PIE786
+            future.set_exception(e)
+
+
+def as_completed(
+    results: Iterable[TransactionWriteResult], timeout: float | None = None
+) -> Iterator[TransactionWriteResult]:
+    """Iterate over results of transactions as their receipts arrive.
+
+    Raises:
+        concurrent.futures.TimeoutError: if not all receipts arrived in time.
+    """
+    by_future = {result.future: result for result in results}
+    for future in futures.as_completed(by_future, timeout):
+        yield by_future[future]
@@ -0,0 +1,89 @@
+"""Parallel signing of transactions in worker processes.
+
+Signing is pure CPU work holding the GIL (about a millisecond per
+transaction), so threads do not help: one process signs roughly a thousand
+transactions per second. :class:`SigningPool` spreads signing over worker
+processes. Private keys are sent to every worker once, on start.
+
+Pass it to :meth:`~matic.utils.base_token.BaseToken.process_write_many`::
+
+    with SigningPool([private_key]) as pool:
+        token.process_write_many(methods, private_key, signing_pool=pool)
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Sequence
+
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+
+from matic.json_types import ITransactionRequestConfig
+from matic.web3_client.utils import matic_tx_request_config_to_web3
+
+__all__ = ['SigningPool']
+
+_accounts: dict[str, LocalAccount] = {}
+"""Accounts of worker process by lowercase address."""
+
+
+def _load_keys(private_keys: Sequence[str]) -> None:
+    for private_key in private_keys:
+        account = Account.from_key(private_key)
+        _accounts[account.address.lower()] = account
+
+
+def _sign(transaction: dict[str, Any]) -> bytes | Exception:
+    account = _accounts.get(str(transaction.get('from')).lower())
+    if account is None:
+        return ValueError(f'No private key for sender {transaction.get("from")}.')
+    try:
+        return bytes(account.sign_transaction(transaction).rawTransaction)
+    except Exception as e:  # noqa: PIE786
+        return e
+
+
+class SigningPool:
+    """Pool of processes signing transactions of given senders.
+
+    Args:
+        private_keys: Private keys of all senders.
+        processes: Number of worker processes (number of CPUs by default).
+    """
+
+    def __init__(
+        self, private_keys: Sequence[str], processes: int | None = None
+    ) -> None:
+        self.processes = processes or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            self.processes, initializer=_load_keys, initargs=(tuple(private_keys),)
+        )
+
+    def __enter__(self) -> SigningPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop worker processes."""
+        self._executor.shutdown()
+
+    def sign_transactions(
+        self, configs: Sequence[ITransactionRequestConfig]
+    ) -> list[bytes | Exception]:
+        """Sign complete transactions (``from`` is required) in parallel.
+
+        Returns:
+            Raw signed transaction or error for every config, in order of input.
+        """
+        transactions = []
+        for config in configs:
+            transaction = dict(matic_tx_request_config_to_web3(config))
+            transaction.pop('hardfork', None)
+            transactions.append(transaction)
+        # Few big chunks per process: pickling dominates for small ones
+        chunksize = max(1, len(transactions) // (self.processes * 4))
+        return list(self._executor.map(_sign, transactions, chunksize=chunksize))
@@ -1,11 +1,20 @@
+from __future__ import annotations
+
 import os
+from typing import Any, Callable
 
 import pytest
 from dotenv import load_dotenv
-from web3 import Web3
+from eth_typing import ChecksumAddress, HexAddress
+from web3 import EthereumTesterProvider, Web3
+from web3._utils.module_testing.math_contract import MATH_ABI, MATH_BYTECODE
 
 from matic import services
-from matic.utils.abi_manager import ABIManager
+from matic.json_types import IBaseClientConfig, NeighbourClientConfig
+from matic.utils.abi_manager import CACHE, ABIManager
+from matic.utils.base_token import BaseToken
+from matic.utils.web3_side_chain_client import Web3SideChainClient
+from matic.web3_client import Web3Client
 
 load_dotenv()
 
@@ -13,6 +22,21 @@ DEFAULT_PROOF_API_URL = os.getenv('PROOF_API', 'https://apis.matic.network/api/v
 services.DEFAULT_PROOF_API_URL = DEFAULT_PROOF_API_URL
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        '--benchmark', action='store_true', help='Run tests marked as benchmark.'
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption('--benchmark'):
+        return
+    skip = pytest.mark.skip(reason='benchmark, use --benchmark to run')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture()
 def rpc():
     return {
@@ -72,3 +96,112 @@ def parent_provider(rpc):
 @pytest.fixture()
 def abi_manager():
     return ABIManager('testnet', 'mumbai')
+
+
+class CountingProvider(EthereumTesterProvider):
+    """Local chain provider recording names of called methods.
+
+    Methods listed in ``results`` are answered with given result.
+    Adds receipt fields eth-tester misses.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[str] = []
+        self.results: dict[str, Any] = {}
+
+    def make_request(self, method, params):
+        self.calls.append(method)
+        if method in self.results:
+            return {'jsonrpc': '2.0', 'id': 1, 'result': self.results[method]}
+        response = super().make_request(method, params)
+        if method == 'eth_getTransactionReceipt' and response.get('result'):
+            response['result'].setdefault('logsBloom', '0x' + '00' * 256)
+            for log in response['result']['logs']:
+                log.setdefault('removed', False)
+        return response
+
+
+@pytest.fixture()
+def provider():
+    return CountingProvider()
+
+
+@pytest.fixture()
+def client(provider):
+    return Web3Client(provider)
+
+
+@pytest.fixture()
+def deploy(client) -> Callable[[Any, str], ChecksumAddress]:
+    """Deploy contract to local chain (from the first account), get its address."""
+    web3 = client._web3
+
+    def deploy(abi: Any, bytecode: str) -> ChecksumAddress:
+        factory = web3.eth.contract(abi=abi, bytecode=bytecode)
+        tx_hash = factory.constructor().transact({'from': web3.eth.accounts[0]})
+        address = web3.eth.wait_for_transaction_receipt(tx_hash)['contractAddress']
+        assert address is not None
+        return address
+
+    return deploy
+
+
+@pytest.fixture()
+def fund(client) -> Callable[[str], None]:
+    """Send 100 ether from the first account of local chain."""
+    web3 = client._web3
+
+    def fund(address: str) -> None:
+        web3.eth.send_transaction(
+            {'from': web3.eth.accounts[0], 'to': address, 'value': 10**20}
+        )
+
+    return fund
+
+
+@pytest.fixture()
+def make_token(provider, client, deploy, monkeypatch) -> Callable[..., BaseToken]:
+    """Deploy Math contract and wrap it as token of local side chain client.
+
+    Extra keyword arguments are put into config of the token chain.
+    ``sender`` (the first account by default) is default sender on both chains.
+    """
+    monkeypatch.setitem(
+        CACHE,
+        ('localnet', 'test'),
+        {
+            'address': {
+                'Main': {'SupportsEIP1559': False},
+                'Matic': {'SupportsEIP1559': False},
+            },
+            'abi': {'test': {'Math': MATH_ABI}},
+        },
+    )
+
+    def make_token(
+        is_parent: bool = False,
+        supports_eip_1559: bool = False,
+        sender: HexAddress | None = None,
+        **options: Any,
+    ) -> BaseToken:
+        chain = 'Main' if is_parent else 'Matic'
+        CACHE[('localnet', 'test')]['address'][chain][
+            'SupportsEIP1559'
+        ] = supports_eip_1559
+        plain_config: NeighbourClientConfig = {
+            'provider': provider,
+            'default_config': {'from': sender or client._web3.eth.accounts[0]},
+        }
+        chain_config: Any = {**plain_config, **options}
+        config: IBaseClientConfig = {
+            'network': 'localnet',
+            'version': 'test',
+            'parent': chain_config if is_parent else plain_config,
+            'child': plain_config if is_parent else chain_config,
+        }
+        side_chain_client = Web3SideChainClient(config)
+        address = deploy(MATH_ABI, MATH_BYTECODE)
+        return BaseToken(address, is_parent, 'Math', side_chain_client, 'test')
+
+    return make_token
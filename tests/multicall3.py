@@ -0,0 +1,109 @@
+"""Minimal Multicall3-compatible contract for local (eth-tester) chain.
+
+There is no solidity compiler in test environment, so runtime code is
+assembled from the listing below. Any call is treated as
+``aggregate3((address,bool,bytes)[])``: calls are executed in order, results
+are returned as ``(bool,bytes)[]``, failure of a call with
+``allowFailure=false`` reverts everything (as Multicall3 does).
+
+Memory: 0x00 - i, 0x20 - n, 0x40 - p (write pointer), 0x60 - t (current call),
+result is built from 0x80.
+"""
+
+from __future__ import annotations
+
+OPCODES = {
+    'ADD': 0x01,
+    'MUL': 0x02,
+    'SUB': 0x03,
+    'LT': 0x10,
+    'ISZERO': 0x15,
+    'AND': 0x16,
+    'OR': 0x17,
+    'NOT': 0x19,
+    'CALLDATALOAD': 0x35,
+    'CALLDATACOPY': 0x37,
+    'CODECOPY': 0x39,
+    'RETURNDATASIZE': 0x3D,
+    'RETURNDATACOPY': 0x3E,
+    'NUMBER': 0x43,
+    'POP': 0x50,
+    'MLOAD': 0x51,
+    'MSTORE': 0x52,
+    'JUMP': 0x56,
+    'JUMPI': 0x57,
+    'GAS': 0x5A,
+    'JUMPDEST': 0x5B,
+    'DUP1': 0x80,
+    'DUP2': 0x81,
+    'DUP3': 0x82,
+    'SWAP1': 0x90,
+    'CALL': 0xF1,
+    'RETURN': 0xF3,
+    'REVERT': 0xFD,
+}
+
+AGGREGATE3 = """
+    4 CALLDATALOAD 4 ADD CALLDATALOAD       ; n
+    DUP1 0x20 MSTORE 0xa0 MSTORE            ; N = n, result length = n
+    0x20 0x80 MSTORE                        ; result offset
+    0x20 MLOAD 0x20 MUL 0xc0 ADD 0x40 MSTORE   ; P = after heads
+loop:
+    0x20 MLOAD 0x00 MLOAD LT ISZERO @end JUMPI
+    4 CALLDATALOAD 36 ADD                   ; calls array body
+    DUP1 0x00 MLOAD 0x20 MUL ADD CALLDATALOAD ADD 0x60 MSTORE
+    0xc0 0x40 MLOAD SUB                     ; head[i] = P - 0xc0
+    0x00 MLOAD 0x20 MUL 0xc0 ADD MSTORE
+    0x60 MLOAD 0x40 ADD CALLDATALOAD 0x60 MLOAD ADD     ; callData position
+    DUP1 CALLDATALOAD                       ; callData length
+    SWAP1 0x20 ADD DUP2 SWAP1 0x40 MLOAD 0x60 ADD CALLDATACOPY
+    0 0 DUP3 0x40 MLOAD 0x60 ADD 0 0x60 MLOAD CALLDATALOAD GAS CALL
+    SWAP1 POP 0x40 MLOAD MSTORE             ; success
+    RETURNDATASIZE 0 0x40 MLOAD 0x60 ADD RETURNDATACOPY
+    0 RETURNDATASIZE 0x40 MLOAD 0x60 ADD ADD MSTORE     ; zero padding
+    0x40 0x40 MLOAD 0x20 ADD MSTORE
+    RETURNDATASIZE 0x40 MLOAD 0x40 ADD MSTORE
+    0x40 MLOAD MLOAD 0x60 MLOAD 0x20 ADD CALLDATALOAD OR @ok JUMPI
+    0 0 REVERT
+ok:
+    RETURNDATASIZE 0x1f ADD 0x1f NOT AND 0x60 ADD 0x40 MLOAD ADD 0x40 MSTORE
+    0x00 MLOAD 1 ADD 0x00 MSTORE
+    @loop JUMP
+end:
+    0x80 0x40 MLOAD SUB 0x80 RETURN
+"""
+
+
+def assemble(listing: str) -> bytes:
+    """Assemble listing: opcodes, numbers (PUSH1), ``label:`` and ``@label``."""
+    code = bytearray()
+    labels: dict[str, int] = {}
+    jumps: dict[int, str] = {}
+    for line in listing.splitlines():
+        for token in line.split(';')[0].split():
+            if token.endswith(':'):
+                labels[token[:-1]] = len(code)
+                code.append(OPCODES['JUMPDEST'])
+            elif token.startswith('@'):
+                jumps[len(code) + 1] = token[1:]
+                code += b'\x61\x00\x00'  # PUSH2, patched below
+            elif token in OPCODES:
+                code.append(OPCODES[token])
+            else:
+                code += bytes([0x60, int(token, 0)])
+    for position, label in jumps.items():
+        code[position : position + 2] = labels[label].to_bytes(2, 'big')
+    return bytes(code)
+
+
+def deploy_code(runtime: bytes) -> bytes:
+    """Build creation code returning given runtime code."""
+    return (
+        b'\x61'
+        + len(runtime).to_bytes(2, 'big')
+        + bytes.fromhex('80600c6000396000f3')
+        + runtime
+    )
+
+
+MULTICALL3_BYTECODE = deploy_code(assemble(AGGREGATE3))
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+
+from matic import services
+from matic.utils import abi_manager, abi_snapshot
+from matic.utils.abi_manager import ABIManager
+
+ADDRESSES = {'Main': {'POSContracts': {'RootChainManagerProxy': '0x01'}}}
+ABI = [{'type': 'function', 'name': 'exit', 'inputs': [], 'outputs': []}]
+
+
+@pytest.fixture()
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(abi_snapshot, 'SNAPSHOT_DIR', tmp_path)
+    monkeypatch.setattr(abi_manager, 'CACHE', {})
+    return tmp_path
+
+
+@pytest.fixture()
+def fake_store(mocker):
+    return (
+        mocker.patch.object(services, 'get_address', return_value=ADDRESSES),
+        mocker.patch.object(services, 'get_abi', return_value=ABI),
+    )
+
+
+def test_snapshot_roundtrip(snapshot_dir, fake_store):
+    get_address, get_abi = fake_store
+    abi_snapshot.write_snapshot(
+        'testnet', 'mumbai', contracts=[('pos', 'RootChainManager')]
+    )
+    get_address.reset_mock()
+    get_abi.reset_mock()
+
+    manager = ABIManager('testnet', 'mumbai')
+    assert manager.get_config('Main.POSContracts.RootChainManagerProxy') == '0x01'
+    assert manager.get_abi('RootChainManager', 'pos') == ABI
+    get_address.assert_not_called()
+    get_abi.assert_not_called()
+
+    # Unknown contract is still fetched
+    manager.get_abi('ChildERC20', 'pos')
+    get_abi.assert_called_once_with('testnet', 'mumbai', 'pos', 'ChildERC20')
+
+
+def test_check_snapshot(snapshot_dir, fake_store):
+    contracts = [('pos', 'RootChainManager')]
+    with pytest.raises(ValueError, match='No usable snapshot'):
+        abi_snapshot.check_snapshot('testnet', 'mumbai', contracts=contracts)
+
+    abi_snapshot.write_snapshot('testnet', 'mumbai', contracts=contracts)
+    abi_snapshot.check_snapshot('testnet', 'mumbai', contracts=contracts)
+
+    _, get_abi = fake_store
+    get_abi.return_value = []
+    abi_snapshot.write_snapshot('testnet', 'mumbai', contracts=contracts)
+    with pytest.raises(ValueError, match='misses ABIs'):
+        abi_snapshot.check_snapshot('testnet', 'mumbai', contracts=contracts)
+
+
+def test_snapshot_from_other_store_ignored(snapshot_dir, fake_store, monkeypatch):
+    abi_snapshot.write_snapshot('testnet', 'mumbai', contracts=[])
+    monkeypatch.setattr(services, 'DEFAULT_ABI_STORE_URL', 'https://example.com')
+    assert abi_snapshot.load_snapshot('testnet', 'mumbai') is None
+
+
+def test_cached_network_not_refetched(snapshot_dir, fake_store):
+    get_address, _ = fake_store
+    ABIManager('testnet', 'mumbai')
+    ABIManager('testnet', 'mumbai')
+    get_address.assert_called_once_with('testnet', 'mumbai')
+
+    ABIManager('testnet', 'mumbai', refresh=True)
+    assert get_address.call_count == 2
+
+
+def test_prefetch_is_concurrent_and_single_flight(snapshot_dir, mocker):
+    import threading
+
+    mocker.patch.object(services, 'get_address', return_value=ADDRESSES)
+    barrier = threading.Barrier(3, timeout=5)
+
+    def get_abi(network, version, bridge_type, name):
+        barrier.wait()  # Deadlocks unless all three are fetched in parallel
+        return [{'name': name}]
+
+    get_abi_mock = mocker.patch.object(services, 'get_abi', side_effect=get_abi)
+    manager = ABIManager('testnet', 'mumbai')
+    contracts = [('pos', 'A'), ('pos', 'B'), (None, 'C'), ('pos', 'A')]
+
+    futures = manager.prefetch(contracts)
+    assert len(futures) == 3
+    assert manager.get_abi('C') == [{'name': 'C'}]
+    assert [f.result() for f in futures] == [[{'name': n}] for n in 'ABC']
+    assert get_abi_mock.call_count == 3
+    assert manager.prefetch(contracts) == []
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import itertools
+import time
+
+import pytest
+
+from matic.utils.accelerator import Accelerator
+
+
+@pytest.fixture()
+def token(make_token):
+    return make_token(accelerate_after_blocks=1)
+
+
+def test_bump_fees(client):
+    accelerator = Accelerator(client, 1)
+    gas_price = 10 * client.gas_price
+
+    config = accelerator.bump_fees({'nonce': 1, 'gas_price': gas_price})
+    assert config == {'nonce': 1, 'gas_price': gas_price * 115 // 100}
+
+    config = accelerator.bump_fees(
+        {'max_fee_per_gas': 200, 'max_priority_fee_per_gas': 100}
+    )
+    assert config == {'max_fee_per_gas': 230, 'max_priority_fee_per_gas': 115}
+
+    accelerator.fee_cap = gas_price * 105 // 100
+    assert accelerator.bump_fees({'gas_price': gas_price}) is None
+
+
+def test_stuck_transaction_replaced(token, provider, monkeypatch):
+    accelerator = token.client.get_accelerator(False)
+    accelerator.poll_interval = 0.01
+    accelerator.max_bumps = 1
+    # Every check sees a new block, while nothing is mined
+    blocks = itertools.count()
+    monkeypatch.setattr(accelerator.client, 'get_block_number', lambda: next(blocks))
+    provider.ethereum_tester.disable_auto_mine_transactions()
+
+    method = token.contract.method('increment')
+    result = token.process_write(method, {'gas_price': 10**9, 'gas_limit': 10**5})
+    first_hash = result.transaction_hash
+
+    # Replaced once, then not tracked anymore
+    deadline = time.monotonic() + 5
+    while len(accelerator) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert result.transaction_hash != first_hash
+    assert result.transaction_config['gas_price'] == 115 * 10**7
+
+    provider.ethereum_tester.mine_blocks()
+    receipt = result.get_receipt(timeout=5)
+
+    assert receipt.transaction_hash == result.transaction_hash
+    assert token.contract.method('counter').read() == 1
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from web3.types import RPCEndpoint
+
+from matic.web3_client.batching import BatchingHTTPProvider
+
+
+class FakeResponse:
+    def __init__(self, status: int, body) -> None:
+        self.status_code = status
+        self.content = json.dumps(body).encode()
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(f'{self.status_code} Error', response=self)
+
+
+class FakeSession:
+    """Node answering ``result = params[0]`` after ``rtt`` seconds."""
+
+    def __init__(
+        self, reject_batches: bool = False, rtt: float = 0.05, batch_status: int = 200
+    ) -> None:
+        self.reject_batches = reject_batches
+        self.batch_status = batch_status
+        self.rtt = rtt
+        self.posts: list = []
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def _answer(request: dict) -> dict:
+        return {'jsonrpc': '2.0', 'id': request['id'], 'result': request['params'][0]}
+
+    def post(self, endpoint_uri, data, **kwargs) -> FakeResponse:
+        body = json.loads(data)
+        with self.lock:
+            self.posts.append(body)
+        time.sleep(self.rtt)
+        if not isinstance(body, list):
+            return FakeResponse(200, self._answer(body))
+        if self.reject_batches:
+            return FakeResponse(400, {'error': {'code': -32600, 'message': 'no'}})
+        if self.batch_status != 200:
+            return FakeResponse(self.batch_status, {'message': 'try later'})
+        # Out of order, as nodes are allowed to answer
+        return FakeResponse(200, [self._answer(request) for request in body[::-1]])
+
+
+def _provider(session: FakeSession, **kwargs) -> BatchingHTTPProvider:
+    return BatchingHTTPProvider('http://batching.test', session=session, **kwargs)
+
+
+def _call_concurrently(provider: BatchingHTTPProvider, count: int) -> list:
+    barrier = threading.Barrier(count)
+
+    def call(i: int):
+        barrier.wait()
+        return provider.make_request(RPCEndpoint('eth_test'), [i])['result']
+
+    with ThreadPoolExecutor(count) as pool:
+        return list(pool.map(call, range(count)))
+
+
+def test_sequential_requests_not_delayed():
+    session = FakeSession()
+    provider = _provider(session, window=10)
+
+    method = RPCEndpoint('eth_test')
+    assert [provider.make_request(method, [i])['result'] for i in range(3)] == [0, 1, 2]
+    assert all(isinstance(body, dict) for body in session.posts)
+
+
+def test_concurrent_requests_batched():
+    session = FakeSession()
+    provider = _provider(session, window=0.2, max_batch_size=4)
+
+    assert _call_concurrently(provider, 9) == list(range(9))
+    assert len(session.posts) < 9
+    assert any(isinstance(body, list) for body in session.posts)
+    assert all(len(body) <= 4 for body in session.posts if isinstance(body, list))
+    assert provider.batching_supported
+
+
+def test_batch_rejected():
+    session = FakeSession(reject_batches=True)
+    provider = _provider(session, window=0.2)
+
+    assert _call_concurrently(provider, 6) == list(range(6))
+    assert not provider.batching_supported
+
+    session.posts.clear()
+    assert _call_concurrently(provider, 3) == list(range(3))
+    assert all(isinstance(body, dict) for body in session.posts)
+
+
+@pytest.mark.parametrize('status', [429, 502])
+def test_batch_failed_temporarily(status):
+    session = FakeSession(rtt=0, batch_status=status)
+    provider = _provider(session)
+    method = RPCEndpoint('eth_test')
+
+    responses = provider.make_batch_request([(method, [i]) for i in range(3)])
+    assert [response['result'] for response in responses] == [0, 1, 2]
+    assert provider.batching_supported
+
+    session.batch_status = 200
+    session.posts.clear()
+    provider.make_batch_request([(method, [i]) for i in range(3)])
+    assert len(session.posts) == 1
+
+
+def test_invalid_batch_size():
+    with pytest.raises(ValueError, match='max_batch_size'):
+        _provider(FakeSession(), max_batch_size=0)
+
+
+@pytest.mark.parametrize('reject_batches', [False, True])
+def test_make_batch_request(reject_batches):
+    session = FakeSession(reject_batches, rtt=0)
+    provider = _provider(session, max_batch_size=4)
+
+    method = RPCEndpoint('eth_test')
+    responses = provider.make_batch_request([(method, [i]) for i in range(10)])
+    assert [response['result'] for response in responses] == list(range(10))
+    if not reject_batches:
+        assert [len(body) for body in session.posts] == [4, 4, 2]
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from eth_account import Account
+
+from matic.exceptions import BulkSendException, EIP1559NotSupportedException
+from matic.json_types import ITransactionWriteResult
+from matic.web3_client import TransactionWriteResult
+
+PRIVATE_KEY = '0x' + '11' * 32
+SENDER = Account.from_key(PRIVATE_KEY).address
+EIP_1559_OPTION = {
+    'nonce': 0,
+    'gas_limit': 100_000,
+    'chain_id': 131277322940537,
+    'max_fee_per_gas': 2 * 10**9,
+    'max_priority_fee_per_gas': 10**9,
+}
+
+
+@pytest.fixture()
+def token(make_token, fund):
+    fund(SENDER)
+    return make_token()
+
+
+def test_process_write_many(token, provider):
+    methods = (token.contract.method('increment', i) for i in range(1, 21))
+
+    provider.calls.clear()
+    results = token.process_write_many(methods, PRIVATE_KEY, max_in_flight=4)
+
+    assert [r.transaction_config['nonce'] for r in results] == list(range(20))
+    assert token.contract.method('counter').read() == sum(range(1, 21))
+    assert provider.calls.count('eth_sendRawTransaction') == 20
+    assert provider.calls.count('eth_getTransactionCount') == 1
+    assert provider.calls.count('eth_gasPrice') == 1
+
+
+def test_process_write_many_eip_1559(make_token, fund):
+    fund(SENDER)
+    token = make_token(supports_eip_1559=True)
+    # More preparations than threads of client executor, fees are looked up there
+    methods = [token.contract.method('increment') for _ in range(20)]
+
+    results = token.process_write_many(methods, PRIVATE_KEY)
+
+    assert len(results) == 20
+    assert token.contract.method('counter').read() == 20
+
+
+def test_failed_preparation_leaves_no_gap(token):
+    def failing_estimate(tx):
+        raise ValueError('execution reverted')
+
+    methods = [token.contract.method('increment') for _ in range(5)]
+    methods[1].estimate_gas = failing_estimate
+
+    with pytest.raises(BulkSendException, match='1 of 5') as exc_info:
+        token.process_write_many(methods, PRIVATE_KEY, max_in_flight=2)
+
+    error: BulkSendException = exc_info.value
+    results = error.results
+    assert list(error.errors) == [1]
+    assert results[1] is None
+    nonces = [r.transaction_config['nonce'] for r in results if r is not None]
+    assert nonces == [0, 1, 2, 3]
+    assert token.contract.method('counter').read() == 4
+
+
+def test_failed_send_stops_later_ones(token, monkeypatch):
+    client = token.get_client(False)
+    send_raw_transaction = client.send_raw_transaction
+
+    def failing_send(raw, config=None):
+        if config['nonce'] == 2:
+            raise ValueError('insufficient funds for gas * price + value')
+        return send_raw_transaction(raw, config)
+
+    monkeypatch.setattr(client, 'send_raw_transaction', failing_send)
+    methods = [token.contract.method('increment') for _ in range(5)]
+
+    with pytest.raises(BulkSendException, match='3 of 5') as exc_info:
+        token.process_write_many(methods, PRIVATE_KEY, max_in_flight=2)
+
+    error: BulkSendException = exc_info.value
+    assert list(error.errors) == [2, 3, 4]
+    assert 'insufficient funds' in str(error.errors[2])
+    assert 'Not sent' in str(error.errors[4])
+    assert token.contract.method('counter').read() == 2
+
+    monkeypatch.undo()
+    methods = [token.contract.method('increment') for _ in range(2)]
+    results = token.process_write_many(methods, PRIVATE_KEY)
+    assert [r.transaction_config['nonce'] for r in results] == [2, 3]
+    assert token.contract.method('counter').read() == 4
+
+
+def test_accepted_after_failure_reported_sent(token, monkeypatch):
+    client = token.get_client(False)
+    send_raw_transaction = client.send_raw_transaction
+    queued_hash = b'\x03' * 32
+
+    # Batch where the node rejects nonce 2, but queues nonce 3
+    def send_batch(transactions):
+        results: list[ITransactionWriteResult | Exception] = []
+        for raw, config in transactions:
+            if config['nonce'] == 2:
+                results.append(ValueError('insufficient funds for gas'))
+            elif config['nonce'] == 3:
+                results.append(TransactionWriteResult(queued_hash, config, client))
+            elif config['nonce'] > 3:
+                results.append(ValueError('invalid request'))
+            else:
+                results.append(send_raw_transaction(raw, config))
+        return results
+
+    monkeypatch.setattr(client, 'send_raw_transactions', send_batch)
+    methods = [token.contract.method('increment') for _ in range(5)]
+
+    with pytest.raises(BulkSendException, match='2 of 5') as exc_info:
+        token.process_write_many(methods, PRIVATE_KEY, max_in_flight=5)
+
+    error: BulkSendException = exc_info.value
+    assert list(error.errors) == [2, 4]
+    queued = error.results[3]
+    assert queued is not None
+    assert queued.transaction_hash == queued_hash
+
+    # Failed nonce is used again: it unblocks the queued transaction
+    monkeypatch.undo()
+    results = token.process_write_many(
+        [token.contract.method('increment')], PRIVATE_KEY
+    )
+    assert results[0].transaction_config['nonce'] == 2
+
+
+def test_failed_signing_stops_later_ones(token, monkeypatch):
+    client = token.get_client(False)
+    sign_transaction = client.sign_transaction
+
+    def failing_sign(config, private_key):
+        if config['nonce'] == 1:
+            raise ValueError('cannot sign')
+        return sign_transaction(config, private_key)
+
+    monkeypatch.setattr(client, 'sign_transaction', failing_sign)
+    methods = [token.contract.method('increment') for _ in range(5)]
+
+    with pytest.raises(BulkSendException, match='4 of 5') as exc_info:
+        token.process_write_many(methods, PRIVATE_KEY, max_in_flight=4)
+
+    error: BulkSendException = exc_info.value
+    assert list(error.errors) == [1, 2, 3, 4]
+    assert 'cannot sign' in str(error.errors[1])
+    assert token.contract.method('counter').read() == 1
+
+    monkeypatch.undo()
+    results = token.process_write_many(
+        [token.contract.method('increment')], PRIVATE_KEY
+    )
+    assert results[0].transaction_config['nonce'] == 1
+
+
+def test_broken_signing_pool_releases_nonces(token):
+    class BrokenPool:
+        def sign_transactions(self, configs):
+            raise BrokenProcessPool('worker died')
+
+    methods = [token.contract.method('increment') for _ in range(3)]
+    with pytest.raises(BulkSendException, match='3 of 3'):
+        token.process_write_many(methods, PRIVATE_KEY, signing_pool=BrokenPool())
+
+    results = token.process_write_many(
+        [token.contract.method('increment')], PRIVATE_KEY
+    )
+    assert results[0].transaction_config['nonce'] == 0
+    assert token.contract.method('counter').read() == 1
+
+
+def test_sign_write_offline(token, provider):
+    # Default sender is another account: the key owner signs anyway
+    assert token.client.get_default_config(False)['from'] != SENDER
+    method = token.contract.method('increment', 5)
+    option = {'nonce': 0, 'gas_limit': 100_000, 'chain_id': 131277322940537}
+
+    with pytest.raises(ValueError, match='gas_price'):
+        token.sign_write(method, option, PRIVATE_KEY)
+
+    provider.calls.clear()
+    raw = token.sign_write(method, {**option, 'gas_price': 10**9}, PRIVATE_KEY)
+    assert provider.calls == []
+
+    client = token.get_client(False)
+    client.send_raw_transaction(raw)
+    assert token.contract.method('counter').read() == 5
+
+
+def test_sign_write_offline_eip_1559(make_token, fund, provider):
+    fund(SENDER)
+    token = make_token(supports_eip_1559=True)
+    method = token.contract.method('increment', 7)
+
+    provider.calls.clear()
+    raw = token.sign_write(method, EIP_1559_OPTION, PRIVATE_KEY)
+    assert provider.calls == []
+
+    token.get_client(False).send_raw_transaction(raw)
+    assert token.contract.method('counter').read() == 7
+
+
+def test_sign_write_offline_eip_1559_unsupported(token):
+    method = token.contract.method('increment', 7)
+
+    with pytest.raises(EIP1559NotSupportedException):
+        token.sign_write(method, EIP_1559_OPTION, PRIVATE_KEY)
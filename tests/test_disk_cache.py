@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from matic import services
+from matic.utils.disk_cache import DiskCache
+
+
+class FakeStore:
+    def __init__(self):
+        self.calls = []
+        self.data = {'abi': [1, 2, 3], 'bytecode': '0x00'}
+        self.fail = False
+        self.not_modified = False
+
+    def __call__(self, url, etag, last_modified):
+        self.calls.append((url, etag, last_modified))
+        if self.fail:
+            raise ConnectionError
+        if etag == '"v1"' or self.not_modified:
+            return None, etag, last_modified
+        return self.data, '"v1"', 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+
+def test_fresh_entry_served_from_disk(tmp_path):
+    store = FakeStore()
+    cache = DiskCache(tmp_path, ttl=60)
+    assert cache.get('http://x/a.json', store, lambda d: d['abi']) == [1, 2, 3]
+    # Another process (new instance) gets the parsed value without a request
+    assert DiskCache(tmp_path, ttl=60).get('http://x/a.json', store) == [1, 2, 3]
+    assert len(store.calls) == 1
+
+
+def test_stale_entry_revalidated(tmp_path):
+    store = FakeStore()
+    cache = DiskCache(tmp_path, ttl=0)
+    cache.get('http://x/a.json', store, lambda d: d['abi'])
+    assert cache.get('http://x/a.json', store, lambda d: d['abi']) == [1, 2, 3]
+    assert store.calls[-1] == (
+        'http://x/a.json',
+        '"v1"',
+        'Mon, 01 Jan 2024 00:00:00 GMT',
+    )
+
+    store.fail = True
+    assert cache.get('http://x/a.json', store) == [1, 2, 3]
+
+    with pytest.raises(ConnectionError):
+        cache.get('http://x/b.json', store)
+
+
+def test_corrupted_entry_refetched(tmp_path):
+    store = FakeStore()
+    cache = DiskCache(tmp_path, ttl=60)
+    cache.get('http://x/a.json', store)
+    for path in tmp_path.iterdir():
+        path.write_bytes(b'garbage')
+    assert cache.get('http://x/a.json', store) == store.data
+    assert len(store.calls) == 2
+
+
+def test_entries_are_json(tmp_path):
+    cache = DiskCache(tmp_path, ttl=60)
+    cache.get('http://x/a.json', FakeStore())
+    (path,) = tmp_path.iterdir()
+    assert json.loads(path.read_text())['data'] == FakeStore().data
+
+
+def test_not_modified_without_entry_is_miss(tmp_path):
+    store = FakeStore()
+    store.not_modified = True
+    cache = DiskCache(tmp_path, ttl=60)
+
+    with pytest.raises(ValueError, match='not cached'):
+        cache.get('http://x/a.json', store, lambda d: d['abi'])
+    assert list(tmp_path.iterdir()) == []
+
+    store.not_modified = False
+    assert cache.get('http://x/a.json', store, lambda d: d['abi']) == [1, 2, 3]
+
+
+def test_services_use_disk_cache(tmp_path, mocker):
+    mocker.patch.object(services, 'DISK_CACHE')
+    cache = services.configure_disk_cache(tmp_path, ttl=60)
+    fetch = mocker.patch.object(
+        services, '_get_json_conditional', return_value=({'abi': []}, None, None)
+    )
+
+    assert services.get_abi('testnet', 'mumbai', 'pos', 'X') == []
+    assert services.get_abi('testnet', 'mumbai', 'pos', 'X') == []
+    fetch.assert_called_once()
+    assert cache is services.DISK_CACHE
+
+
+def test_async_services_use_disk_cache(tmp_path, mocker):
+    mocker.patch.object(services, 'DISK_CACHE')
+    services.configure_disk_cache(tmp_path, ttl=60)
+    fetch = mocker.patch.object(
+        services,
+        '_async_get_json_conditional',
+        mocker.AsyncMock(return_value=({'abi': [1]}, None, None)),
+    )
+    sync_fetch = mocker.patch.object(services, '_get_json_conditional')
+
+    async def run():
+        return [
+            await services.async_get_abi('testnet', 'mumbai', 'pos', 'X'),
+            await services.async_get_abi('testnet', 'mumbai', 'pos', 'X'),
+        ]
+
+    assert asyncio.run(run()) == [[1], [1]]
+    assert services.get_abi('testnet', 'mumbai', 'pos', 'X') == [1]
+    fetch.assert_awaited_once()
+    sync_fetch.assert_not_called()
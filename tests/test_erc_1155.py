@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import pytest
+from eth_abi import decode_abi, encode_abi
+from eth_typing import HexAddress, HexStr
+from web3.providers.base import BaseProvider
+
+from matic.json_types import IPOSClientConfig, NeighbourClientConfig
+from matic.pos.erc_1155 import ERC1155
+from matic.utils import abi_manager
+from matic.utils.web3_side_chain_client import Web3SideChainClient
+
+TOKEN = HexAddress(HexStr('0x1111111111111111111111111111111111111111'))
+USERS = [
+    '0x2222222222222222222222222222222222222222',
+    '0x3333333333333333333333333333333333333333',
+]
+
+BALANCE_OF_BATCH_ABI = [
+    {
+        'type': 'function',
+        'name': 'balanceOfBatch',
+        'stateMutability': 'view',
+        'inputs': [
+            {'name': 'accounts', 'type': 'address[]'},
+            {'name': 'ids', 'type': 'uint256[]'},
+        ],
+        'outputs': [{'name': '', 'type': 'uint256[]'}],
+    }
+]
+
+
+def _balance(user: str, token_id: int) -> int:
+    return int(user[-1]) * 1000 + token_id
+
+
+class BalanceProvider(BaseProvider):
+    """Node with ERC-1155 token at ``TOKEN``, recording sizes of batches."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+
+    def make_request(self, method, params):
+        if method == 'eth_chainId':
+            return {'jsonrpc': '2.0', 'id': 1, 'result': '0x1'}
+        assert method == 'eth_call'
+        data = bytes.fromhex(params[0]['data'][10:])
+        users, ids = decode_abi(['address[]', 'uint256[]'], data)
+        self.batch_sizes.append(len(users))
+        balances = [_balance(user, token_id) for user, token_id in zip(users, ids)]
+        result = encode_abi(['uint256[]'], [balances])
+        return {'jsonrpc': '2.0', 'id': 1, 'result': '0x' + result.hex()}
+
+
+@pytest.fixture()
+def provider():
+    return BalanceProvider()
+
+
+@pytest.fixture()
+def token(provider, monkeypatch):
+    monkeypatch.setitem(
+        abi_manager.CACHE,
+        ('localnet', 'test'),
+        {'address': {}, 'abi': {'pos': {'ChildERC1155': BALANCE_OF_BATCH_ABI}}},
+    )
+    chain_config: NeighbourClientConfig = {'provider': provider, 'default_config': {}}
+    config: IPOSClientConfig = {
+        'network': 'localnet',
+        'version': 'test',
+        'parent': chain_config,
+        'child': chain_config,
+    }
+    client = Web3SideChainClient(config)
+    return ERC1155(TOKEN, False, client, lambda: pytest.fail('not needed'))
+
+
+@pytest.mark.parametrize(
+    ('count', 'batch_size', 'expected_sizes'),
+    [
+        (0, 2, []),
+        (1, 2, [1]),
+        (4, 2, [2, 2]),
+        (5, 2, [2, 2, 1]),
+        (5, None, [5]),
+    ],
+)
+def test_get_balances_by_chunks(token, provider, count, batch_size, expected_sizes):
+    pairs = [(USERS[i % 2], i) for i in range(count)]
+
+    balances = token.get_balances(pairs, batch_size=batch_size)
+
+    assert balances == [_balance(user, token_id) for user, token_id in pairs]
+    assert provider.batch_sizes == expected_sizes
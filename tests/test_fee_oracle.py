@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from matic.web3_client import Web3Client
+
+FEE_HISTORY = {
+    'oldestBlock': '0x1',
+    'baseFeePerGas': ['0x64', '0x64', '0x96', '0xc8'],
+    'gasUsedRatio': [0.5, 0, 0.9],
+    # Empty block (zero gas used) is ignored
+    'reward': [['0x1', '0x2', '0x3'], ['0x0', '0x0', '0x0'], ['0x3', '0x6', '0x9']],
+}
+
+
+@pytest.fixture()
+def fee_history(provider):
+    provider.results['eth_feeHistory'] = FEE_HISTORY
+
+
+def test_suggest(provider, fee_history):
+    client = Web3Client(provider, fee_refresh_interval=60)
+    oracle = client.fee_oracle
+
+    with ThreadPoolExecutor(8) as executor:
+        normal = list(executor.map(lambda _: oracle.suggest(), range(20)))
+    assert normal == [{'max_fee_per_gas': 404, 'max_priority_fee_per_gas': 4}] * 20
+    assert oracle.suggest('slow')['max_priority_fee_per_gas'] == 2
+    assert client.get_fee_suggestion('fast') == {
+        'max_fee_per_gas': 406,
+        'max_priority_fee_per_gas': 6,
+    }
+    assert provider.calls.count('eth_feeHistory') == 1
+
+    oracle.clear()
+    oracle.suggest()
+    assert provider.calls.count('eth_feeHistory') == 2
+
+
+def test_gas_price_shared(provider):
+    client = Web3Client(provider, fee_refresh_interval=60)
+    assert client.gas_price == client.gas_price > 0
+    assert provider.calls.count('eth_gasPrice') == 1
+
+    # eth-tester has no fee history: fees are left to the node
+    assert client.get_fee_suggestion() is None
+    # Failure is not retried until refresh interval passes
+    assert client.get_fee_suggestion('fast') is None
+    assert provider.calls.count('eth_feeHistory') == 1
+    with pytest.raises(ValueError, match='sampling failed'):
+        client.fee_oracle.suggest()
+
+    client.fee_oracle.clear()
+    assert client.get_fee_suggestion() is None
+    assert provider.calls.count('eth_feeHistory') == 2
+
+
+@pytest.fixture()
+def token(make_token, fee_history):
+    return make_token(is_parent=True, supports_eip_1559=True, fee_speed='fast')
+
+
+def test_create_transaction_config_fills_fees(token, provider):
+    method = token.contract.method('increment')
+
+    def prepare(option=None, is_parent=True):
+        return token.create_transaction_config(option, method, is_parent, True)
+
+    config = prepare()
+    assert config['max_fee_per_gas'] == 406
+    assert config['max_priority_fee_per_gas'] == 6
+
+    # Explicit fees (or legacy gas price) and non-EIP-1559 chains are untouched
+    assert prepare({'max_priority_fee_per_gas': 1}).get('max_fee_per_gas') is None
+    assert 'max_fee_per_gas' not in prepare({'gas_price': 10**9})
+    assert 'max_fee_per_gas' not in prepare(is_parent=False)
+    assert provider.calls.count('eth_feeHistory') == 1
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor, Future
+from typing import Any
+
+import pytest
+
+from matic.utils.gas_estimator import GasEstimateCache, is_gas_error
+
+
+class InlineExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        future: Future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+class FakeMethod:
+    address = '0xABCD'
+
+    def __init__(self, data: bytes, gas: int | Exception) -> None:
+        self.data = data
+        self.gas = gas
+        self.calls = 0
+
+    def encode_abi(self):
+        return self.data
+
+    def estimate_gas(self, config):
+        self.calls += 1
+        if isinstance(self.gas, Exception):
+            raise self.gas
+        return self.gas
+
+
+def test_estimate_cached_and_refreshed():
+    cache = GasEstimateCache(InlineExecutor(), multiplier=1.5, refresh_interval=60)
+    method: Any = FakeMethod(b'\x01\x02\x03\x04' + b'\x00' * 32, 100)
+
+    # Margin is added to cached estimates only
+    assert [cache.estimate(method, {}) for _ in range(3)] == [100, 150, 150]
+    assert method.calls == 1
+
+    # Same selector, other calldata shape: estimated separately
+    longer: Any = FakeMethod(method.data + b'\x00' * 32, 200)
+    assert cache.estimate(longer, {}) == 200
+    assert len(cache) == 2
+
+    # Only estimates served from cache are dropped
+    assert not cache.invalidate(longer)
+    assert cache.estimate(longer, {}) == 300
+    assert cache.invalidate(longer)
+    assert len(cache) == 1
+    # Estimated live again: nothing to drop until it is served from cache
+    assert cache.estimate(longer, {}) == 200
+    assert not cache.invalidate(longer)
+    cache.estimate(longer, {})
+    assert cache.invalidate(longer)
+    assert len(cache) == 1
+
+    # Stale estimate is served, while refreshed in background
+    cache.refresh_interval = 0
+    method.gas = 120
+    assert cache.estimate(method, {}) == 150
+    assert cache.estimate(method, {}) == 180
+    assert method.calls == 3
+
+    # Refresh reverts: estimate is dropped, next call is estimated live
+    method.gas = ValueError('execution reverted')
+    assert cache.estimate(method, {}) == 180
+    assert len(cache) == 0
+    with pytest.raises(ValueError, match='reverted'):
+        cache.estimate(method, {})
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.fixture()
+def token(make_token):
+    return make_token(is_parent=True, cache_gas_estimates=True)
+
+
+def test_process_write_uses_cache(token, provider):
+    assert token.client.get_gas_estimate_cache(False) is None
+    cache = token.client.get_gas_estimate_cache(True)
+    assert cache is not None
+
+    def increment(*args):
+        method = token.contract.method('increment', *args)
+        return token.process_write(method).transaction_config['gas_limit']
+
+    provider.calls.clear()
+    gas_limits = [increment(1) for _ in range(3)]
+    assert provider.calls.count('eth_estimateGas') == 1
+    assert gas_limits[1] == gas_limits[2] == int(gas_limits[0] * 1.5)
+
+    increment()
+    assert provider.calls.count('eth_estimateGas') == 2
+    assert len(cache) == 2
+    assert token.contract.method('counter').read() == 4
+
+
+def test_write_with_stale_estimate_retried(token, provider):
+    cache = token.client.get_gas_estimate_cache(True)
+    token.process_write(token.contract.method('increment'))
+    for entry in cache._entries.values():
+        entry.gas = 1
+
+    provider.calls.clear()
+    result = token.process_write(token.contract.method('increment'))
+    assert provider.calls.count('eth_estimateGas') == 1
+    assert result.transaction_config['gas_limit'] > 1
+    assert token.contract.method('counter').read() == 2
+
+
+def test_write_failed_otherwise_not_retried(token):
+    token.process_write(token.contract.method('increment'))
+    method = token.contract.method('increment')
+    writes = []
+
+    def timed_out_write(*args):
+        writes.append(args)
+        raise TimeoutError('read timed out')
+
+    # Transaction may be broadcast already: sending it again would duplicate it
+    method.write = timed_out_write
+    with pytest.raises(TimeoutError):
+        token.process_write(method)
+    assert len(writes) == 1
+    assert len(token.client.get_gas_estimate_cache(True)) == 1
+
+
+def test_is_gas_error():
+    assert is_gas_error(ValueError({'message': 'intrinsic gas too low'}))
+    assert is_gas_error(ValueError('Insufficient gas'))
+    assert not is_gas_error(ValueError('execution reverted'))
+    assert not is_gas_error(TimeoutError('read timed out'))
@@ -0,0 +1,62 @@
+"""Import-time regression guard, based on ``python -X importtime``."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = frozenset(
+    {'web3', 'eth_abi', 'eth_account', 'rlp', 'mpt', 'requests', 'aiohttp'}
+)
+# Generous: actual import takes few milliseconds.
+IMPORT_TIME_BUDGET_US = 150_000
+
+
+def measure_import(statement: str) -> dict[str, int]:
+    """Run statement in fresh interpreter and get cumulative import times (us)."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        timings[name.strip()] = int(cumulative)
+    return timings
+
+
+@pytest.mark.parametrize(
+    'statement',
+    [
+        'import matic',
+        'from matic.utils import keccak256',
+        'from matic.utils.merkle_tree import MerkleTree',
+        'import matic.pos, matic.plasma',
+        'import matic.json_types',
+    ],
+)
+def test_light_imports(statement):
+    timings = measure_import(statement)
+    top = sorted(timings.items(), key=lambda item: -item[1])[:10]
+
+    heavy = {name.split('.')[0] for name in timings} & HEAVY_MODULES
+    assert not heavy, f'{statement!r} imports {heavy}; slowest: {top}'
+    assert timings['matic'] < IMPORT_TIME_BUDGET_US, f'slowest: {top}'
+
+
+def test_lazy_attributes():
+    import matic
+    import matic.plasma
+    import matic.pos
+
+    assert matic.POSClient is matic.pos.POSClient
+    assert matic.PlasmaClient is matic.plasma.PlasmaClient
+    assert {'ERC20', 'ERC721', 'ERC1155'} <= set(dir(matic.pos))
+    with pytest.raises(AttributeError, match='no attribute'):
+        matic.NotExisting  # noqa: B018
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import itertools
+
+import pytest
+from web3._utils.module_testing.math_contract import MATH_ABI, MATH_BYTECODE
+from web3._utils.module_testing.revert_contract import (
+    _REVERT_CONTRACT_ABI,
+    REVERT_CONTRACT_BYTECODE,
+)
+from web3.exceptions import BadFunctionCallOutput
+
+from matic.abstracts import BaseContractMethod
+from matic.exceptions import MulticallCallFailedException
+from matic.json_types import IBaseClientConfig, NeighbourClientConfig
+from matic.utils import abi_manager
+from matic.utils.base_token import BaseToken
+from matic.utils.bridge_client import BridgeClient
+from matic.utils.multicall import MULTICALL3_ABI, Multicall, then
+from matic.utils.snapshot import ERC20_BALANCE_ABI
+from matic.utils.web3_side_chain_client import Web3SideChainClient
+from matic.web3_client import EthMethod
+from tests.multicall3 import MULTICALL3_BYTECODE, assemble, deploy_code
+
+
+@pytest.fixture()
+def addresses(deploy):
+    return {
+        'multicall': deploy(MULTICALL3_ABI, MULTICALL3_BYTECODE),
+        'math': deploy(MATH_ABI, MATH_BYTECODE),
+        'revert': deploy(_REVERT_CONTRACT_ABI, REVERT_CONTRACT_BYTECODE),
+    }
+
+
+def test_multicall_results_in_order(client, provider, addresses):
+    math = client.get_contract(addresses['math'], MATH_ABI)
+    revert = client.get_contract(addresses['revert'], _REVERT_CONTRACT_ABI)
+    sender = client._web3.eth.accounts[0]
+    mc = Multicall(client, addresses['multicall'], chunk_size=2, tx={'from': sender})
+
+    futures = [
+        mc.add(math.method('add', 2, 3)),
+        mc.add(revert.method('revertWithMessage')),
+        mc.add(math.method('multiply7', -1)),
+        mc.add(revert.method('normalFunction')),
+        mc.add(math.method('counter')),
+    ]
+    assert not any(future.done() for future in futures)
+
+    provider.calls.clear()
+    results = mc.results(return_exceptions=True)
+
+    assert provider.calls.count('eth_call') == 3
+    assert results[0] == 5
+    assert isinstance(results[1], MulticallCallFailedException)
+    assert 'Function has been reverted.' in str(results[1])
+    assert results[2:] == [-7, True, 0]
+    with pytest.raises(MulticallCallFailedException):
+        mc.results()
+    assert futures[4].result() == 0
+
+
+def test_multicall_reads_methods_without_decoder(
+    client, provider, addresses, make_token
+):
+    class PlainMethod(EthMethod):
+        decode_result = BaseContractMethod.decode_result
+
+        # Signature of custom methods written before block_identifier was added
+        def read(self, tx=None, return_transaction=False):
+            return super().read(tx, return_transaction)
+
+    math = client.get_contract(addresses['math'], MATH_ABI).method('add', 2, 3)
+    plain = PlainMethod(math.address, math.method, client, math.function)
+    mc = Multicall(client, addresses['multicall'])
+
+    provider.calls.clear()
+    future = mc.add(plain)
+    assert future.result() == 5
+    assert provider.calls.count('eth_call') == 1
+    assert mc.results() == [5]
+    assert provider.calls.count('eth_call') == 1
+
+    token = make_token()
+    assert token.process_read(plain) == 5
+
+
+def test_multicall_not_deployed(client, addresses):
+    math = client.get_contract(addresses['math'], MATH_ABI)
+    sender = client._web3.eth.accounts[0]
+    with Multicall(client, sender, tx={'from': sender}) as mc:
+        futures = [mc.add(math.method('counter')), mc.add(math.method('return13'))]
+    for future in futures:
+        with pytest.raises(BadFunctionCallOutput):
+            future.result()
+
+
+@pytest.fixture()
+def side_chain_client(client, provider, addresses, monkeypatch):
+    monkeypatch.setitem(
+        abi_manager.CACHE,
+        ('localnet', 'test'),
+        {'address': {}, 'abi': {'test': {'Math': MATH_ABI}}},
+    )
+    sender = client._web3.eth.accounts[0]
+    chain_config: NeighbourClientConfig = {
+        'provider': provider,
+        'default_config': {'from': sender},
+        'multicall_address': addresses['multicall'],
+    }
+    config: IBaseClientConfig = {
+        'network': 'localnet',
+        'version': 'test',
+        'parent': chain_config,
+        'child': chain_config,
+    }
+    return Web3SideChainClient(config)
+
+
+def test_process_read_in_multicall(side_chain_client, provider, addresses):
+    token = BaseToken(addresses['math'], False, 'Math', side_chain_client, 'test')
+
+    def add(a, b):
+        return token.process_read(token.contract.method('add', a, b))
+
+    assert add(1, 2) == 3
+    provider.calls.clear()
+    with side_chain_client.multicall(is_parent=False, chunk_size=10) as mc:
+        first = add(1, 2)
+        doubled = then(add(2, 2), lambda value: value * 2)
+        assert token.resolve_read(add(3, 3)) == 6
+        last = add(4, 4)
+        assert side_chain_client.get_active_multicall(True) is None
+        assert side_chain_client.get_active_multicall(False) is mc
+
+    assert provider.calls.count('eth_call') == 2
+    assert first.result() == 3
+    assert doubled.result() == 8
+    assert last.result() == 8
+    assert mc.results() == [3, 4, 6, 8]
+    assert side_chain_client.get_active_multicall(False) is None
+
+
+def test_multicall_cancelled_on_error(side_chain_client, addresses):
+    token = BaseToken(addresses['math'], False, 'Math', side_chain_client, 'test')
+
+    futures = []
+
+    def read_and_fail():
+        with side_chain_client.multicall():
+            futures.append(token.process_read(token.contract.method('counter')))
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        read_and_fail()
+    assert futures[0].cancelled()
+    assert side_chain_client.get_active_multicall(False) is None
+
+
+@pytest.mark.parametrize('concurrency', [None, 3])
+def test_iter_reads(side_chain_client, provider, addresses, concurrency):
+    token = BaseToken(addresses['math'], False, 'Math', side_chain_client, 'test')
+
+    def double(i):
+        return then(token.process_read(token.contract.method('add', i, i)), int)
+
+    provider.calls.clear()
+    reads = token.iter_reads(double, 5, page_size=2, concurrency=concurrency)
+    assert list(itertools.islice(reads, 3)) == [0, 2, 4]
+    reads.close()
+    # Only two pages were read
+    assert provider.calls.count('eth_call') == (2 if concurrency is None else 4)
+
+    assert list(token.iter_reads(double, 5, 2, concurrency)) == [0, 2, 4, 6, 8]
+
+
+def test_iter_reads_without_multicall(side_chain_client, client, provider, addresses):
+    config = side_chain_client.config['child']
+    config['multicall_address'] = client._web3.eth.accounts[0]
+    token = BaseToken(addresses['math'], False, 'Math', side_chain_client, 'test')
+
+    def double(i):
+        return then(token.process_read(token.contract.method('add', i, i)), int)
+
+    provider.calls.clear()
+    assert list(token.iter_reads(double, 3)) == [0, 2, 4]
+    assert provider.calls.count('eth_call') == 3
+    assert provider.calls.count('eth_getCode') == 1
+    assert not side_chain_client.has_multicall()
+    assert provider.calls.count('eth_getCode') == 1
+
+
+# balanceOf(user) = uint(user) + block.number
+BALANCE_BYTECODE = deploy_code(
+    assemble('4 CALLDATALOAD NUMBER ADD 0 MSTORE 0x20 0 RETURN')
+)
+
+
+def test_snapshot_balances(side_chain_client, client, provider, deploy):
+    tokens = [deploy(ERC20_BALANCE_ABI, BALANCE_BYTECODE) for _ in range(2)]
+    users = client._web3.eth.accounts[:3]
+
+    provider.calls.clear()
+    first = side_chain_client.snapshot_balances(tokens, users, chunk_size=4)
+    assert provider.calls.count('eth_call') == 2
+    assert first.tokens == tuple(tokens)
+    assert first.users == tuple(users)
+    offset = first.get(tokens[1], users[2]) - int(users[2], 16)
+    assert first.balances == ((*(int(user, 16) + offset for user in users),),) * 2
+
+    provider.ethereum_tester.mine_blocks(3)
+    second = side_chain_client.snapshot_balances(tokens, users)
+    assert second.block_number == first.block_number + 3
+    assert first.diff(second) == {
+        (token, user): 3 for token in tokens for user in users
+    }
+    assert second.diff(second) == {}
+    with pytest.raises(ValueError, match='different'):
+        first.diff(side_chain_client.snapshot_balances(tokens[:1], users))
+
+    pinned = side_chain_client.snapshot_balances(
+        tokens, users, block_number=first.block_number
+    )
+    assert pinned == first
+
+
+def test_portfolio_snapshot(side_chain_client, client, deploy):
+    token = deploy(ERC20_BALANCE_ABI, BALANCE_BYTECODE)
+    users = client._web3.eth.accounts[:2]
+    bridge = BridgeClient(side_chain_client.config)
+
+    snapshot = bridge.snapshot_balances(users, child_tokens=[token])
+    assert snapshot.parent.tokens == ()
+    assert snapshot.parent.balances == ()
+    assert snapshot.child.balances[0][1] - snapshot.child.balances[0][0] == int(
+        users[1], 16
+    ) - int(users[0], 16)
+    assert snapshot.diff(snapshot) == {'parent': {}, 'child': {}}
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from eth_utils.exceptions import ValidationError
+
+from matic.utils.base_token import BaseToken
+from matic.utils.nonce_manager import NonceManager, is_nonce_error
+
+
+@pytest.fixture()
+def sender(client):
+    return client._web3.eth.accounts[1]
+
+
+def test_reserve_concurrently(client, provider, sender):
+    manager = NonceManager(client)
+
+    provider.calls.clear()
+    with ThreadPoolExecutor(8) as executor:
+        nonces = list(executor.map(lambda _: manager.reserve(sender), range(50)))
+
+    assert sorted(nonces) == list(range(50))
+    assert provider.calls.count('eth_getTransactionCount') == 1
+    assert manager.is_reserved(sender.lower(), 49)
+    manager.commit(sender, 49)
+    assert not manager.is_reserved(sender, 49)
+
+
+def test_release_and_resync(client, provider, sender):
+    manager = NonceManager(client)
+    first, second = manager.reserve(sender), manager.reserve(sender)
+
+    # Last one is handed out again
+    manager.release(sender, second)
+    assert manager.reserve(sender) == second
+
+    # Gap: resync with the chain
+    provider.calls.clear()
+    manager.release(sender, first)
+    manager.release(sender, first)  # not reserved anymore: no-op
+    assert manager.reserve(sender) == 0
+    assert provider.calls.count('eth_getTransactionCount') == 1
+
+    manager.resync()
+    assert manager.reserve(sender) == 0
+
+
+@pytest.fixture()
+def token(make_token, sender):
+    return make_token(is_parent=True, sender=sender, manage_nonces=True)
+
+
+def test_process_write_uses_nonce_manager(token, provider, sender):
+    assert token.client.get_nonce_manager(False) is None
+    manager = token.client.get_nonce_manager(True)
+
+    def increment(option=None):
+        return token.process_write(token.contract.method('increment'), option)
+
+    provider.calls.clear()
+    results = [increment() for _ in range(3)]
+    assert [r.transaction_config['nonce'] for r in results] == [0, 1, 2]
+    assert provider.calls.count('eth_getTransactionCount') == 1
+    assert not any(manager.is_reserved(sender, nonce) for nonce in range(3))
+
+    # Failed send: nonce is released and reused
+    with pytest.raises(ValidationError, match='Insufficient gas'):
+        increment({'gas_limit': 1})
+    assert increment().transaction_config['nonce'] == 3
+
+    # Explicit nonce 0 is not replaced
+    prepared = increment({'nonce': 0, 'gas_limit': 100_000, 'return_transaction': True})
+    assert prepared.transaction_config['nonce'] == 0
+    assert increment().transaction_config['nonce'] == 4
+
+
+def test_used_nonce_resynced(token, client, provider, sender):
+    def increment():
+        return token.process_write(token.contract.method('increment'))
+
+    assert increment().transaction_config['nonce'] == 0
+    # Nonce 1 is taken by transaction sent bypassing the manager
+    web3 = client._web3
+    web3.eth.send_transaction({'from': sender, 'to': sender, 'nonce': 1})
+
+    with pytest.raises(ValidationError, match='nonce'):
+        increment()
+    provider.calls.clear()
+    assert increment().transaction_config['nonce'] == 2
+    assert provider.calls.count('eth_getTransactionCount') == 1
+
+
+@pytest.mark.parametrize(
+    ('message', 'expected'),
+    [
+        ('nonce too low', True),
+        ('already known', True),
+        ('replacement transaction underpriced', True),
+        ('insufficient funds for gas * price + value', False),
+    ],
+)
+def test_is_nonce_error(message, expected):
+    error = ValueError({'code': -32000, 'message': message})
+    assert is_nonce_error(error) is expected
+
+
+def test_create_transaction_config_without_manager(token, provider, sender):
+    child_token = BaseToken(token.address, False, 'Math', token.client, 'test')
+    method = child_token.contract.method('increment')
+
+    provider.calls.clear()
+    configs = [
+        child_token.create_transaction_config(None, method, False, True)
+        for _ in range(2)
+    ]
+    assert [config['nonce'] for config in configs] == [0, 0]
+    assert configs[0]['chain_id'] == configs[1]['chain_id']
+    assert provider.calls.count('eth_getTransactionCount') == 2
+    assert provider.calls.count('eth_estimateGas') == 2
+
+    # web3 validates chainId of estimated transactions itself, ours is cached
+    provider.calls.clear()
+    assert child_token.get_client(False).chain_id == configs[0]['chain_id']
+    assert provider.calls == []
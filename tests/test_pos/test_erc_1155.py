@@ -21,6 +21,16 @@ def test_get_balance_parent(erc_1155_parent: ERC1155, from_: HexAddress):
     assert balance > 0
 
 
+@pytest.mark.read()
+def test_get_balances(erc_1155_child: ERC1155, from_: HexAddress, to: HexAddress):
+    pairs = [(from_, TOKEN_ID), (to, TOKEN_ID), (from_, TOKEN_ID)]
+    expected = [erc_1155_child.get_balance(user, token) for user, token in pairs]
+
+    assert erc_1155_child.get_balances(pairs) == expected
+    assert erc_1155_child.get_balances(pairs, batch_size=2) == expected
+    assert erc_1155_child.get_balances([]) == []
+
+
 @pytest.mark.read()
 def test_is_withdraw_exited(erc_1155_parent: ERC1155):
     tx_hash = bytes.fromhex(
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from web3._utils.module_testing.math_contract import MATH_ABI, MATH_BYTECODE
+
+import matic.utils
+from matic.json_types import IBaseClientConfig, NeighbourClientConfig
+from matic.utils import abi_manager
+from matic.utils.base_token import BaseToken
+from matic.utils.web3_side_chain_client import Web3SideChainClient
+from matic.web3_client import Web3Client
+from matic.web3_client.read_cache import FALLBACK_CONFIRMATIONS, ReadCache
+
+
+@pytest.fixture()
+def client(provider):
+    return Web3Client(provider, read_cache_size=2)
+
+
+@pytest.fixture()
+def math(client, deploy):
+    return client.get_contract(deploy(MATH_ABI, MATH_BYTECODE), MATH_ABI)
+
+
+def _increment(client: Web3Client, math) -> int:
+    web3 = client._web3
+    tx_hash = math.contract.functions.increment().transact(
+        {'from': web3.eth.accounts[0]}
+    )
+    return web3.eth.wait_for_transaction_receipt(tx_hash)['blockNumber']
+
+
+def test_finalized_reads_cached(client, provider, math):
+    web3 = client._web3
+    tx = {'from': web3.eth.accounts[0]}
+    first_block = _increment(client, math)
+    provider.ethereum_tester.mine_blocks(FALLBACK_CONFIRMATIONS)
+    last_block = _increment(client, math)
+
+    def read(block):
+        return math.method('counter').read(tx, block_identifier=block)
+
+    provider.calls.clear()
+    assert read(first_block) == 1
+    assert read(first_block) == 1
+    assert read(hex(first_block)) == 1
+    assert provider.calls.count('eth_call') == 1
+    assert client.read_cache.finalized_block == last_block - FALLBACK_CONFIRMATIONS
+
+    # Not finalized yet, or moving tag: always read
+    provider.calls.clear()
+    assert [read(last_block), read(last_block), read('latest')] == [2, 2, 2]
+    assert provider.calls.count('eth_call') == 3
+
+    # Block hash identifies the state, so it is cached even if not finalized
+    provider.calls.clear()
+    block_hash = web3.eth.get_block(last_block).hash
+    assert [read(block_hash), read(block_hash.hex())] == [2, 2]
+    assert provider.calls.count('eth_call') == 1
+
+    # LRU: maxsize is 2, so the oldest entry (first_block) is evicted
+    provider.calls.clear()
+    assert [read(first_block - 1), read(block_hash), read(first_block)] == [0, 2, 1]
+    assert provider.calls.count('eth_call') == 2
+
+
+@pytest.mark.parametrize(
+    ('answer', 'supported'),
+    [
+        (ConnectionError('timed out'), True),
+        ({'error': {'code': -32000, 'message': 'header not found'}}, True),
+        ({'error': {'code': -32602, 'message': 'invalid argument 0'}}, False),
+        (ValueError('unknown block tag finalized'), False),
+        ({'result': None}, False),
+    ],
+)
+def test_finalized_tag_unsupported(answer, supported):
+    def send_rpc_request(method, params):
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+    client: Any = SimpleNamespace(
+        send_rpc_request=send_rpc_request,
+        _web3=SimpleNamespace(eth=SimpleNamespace(block_number=1000)),
+    )
+    cache = ReadCache(client, 1)
+
+    expected = -1 if supported else 1000 - FALLBACK_CONFIRMATIONS
+    assert cache._get_finalized() == expected
+    assert cache._finalized_tag_supported is supported
+
+
+def test_no_cache_by_default(provider, math):
+    client = Web3Client(provider)
+    block = _increment(client, math)
+
+    provider.calls.clear()
+    assert client.read_cache is None
+    for _ in range(2):
+        assert math.method('counter').read(block_identifier=block - 1) == 0
+    assert provider.calls.count('eth_call') == 2
+
+
+def test_process_read_at_block(client, provider, math, monkeypatch):
+    monkeypatch.setitem(
+        abi_manager.CACHE,
+        ('localnet', 'test'),
+        {'address': {}, 'abi': {'test': {'Math': MATH_ABI}}},
+    )
+    chain_config: NeighbourClientConfig = {
+        'provider': provider,
+        'default_config': {'from': client._web3.eth.accounts[0]},
+        'read_cache_size': 16,
+    }
+    config: IBaseClientConfig = {
+        'network': 'localnet',
+        'version': 'test',
+        'parent': chain_config,
+        'child': chain_config,
+    }
+    side_chain_client = Web3SideChainClient(config)
+    token = BaseToken(math.address, False, 'Math', side_chain_client, 'test')
+    block = _increment(client, math)
+    _increment(client, math)
+
+    def counter(option=None):
+        return token.process_read(token.contract.method('counter'), option)
+
+    assert isinstance(side_chain_client.child, Web3Client)
+    assert side_chain_client.child.read_cache is not None
+    assert side_chain_client.child.read_cache.maxsize == 16
+    assert counter() == 2
+    assert counter({'block_identifier': block}) == 1
+    assert counter({'block_identifier': block - 1}) == 0
+
+
+def test_custom_client_without_options(client, provider, monkeypatch):
+    class LegacyClient(Web3Client):
+        def __init__(self, provider):
+            super().__init__(provider)
+
+    monkeypatch.setattr(matic.utils, 'Web3Client', LegacyClient)
+    monkeypatch.setitem(
+        abi_manager.CACHE, ('localnet', 'test'), {'address': {}, 'abi': {}}
+    )
+    chain_config: NeighbourClientConfig = {
+        'provider': provider,
+        'default_config': {'from': client._web3.eth.accounts[0]},
+        'read_cache_size': 16,
+    }
+    config: IBaseClientConfig = {
+        'network': 'localnet',
+        'version': 'test',
+        'parent': chain_config,
+        'child': chain_config,
+    }
+    with pytest.warns(UserWarning, match="'read_cache_size'"):
+        side_chain_client = Web3SideChainClient(config)
+    assert isinstance(side_chain_client.child, LegacyClient)
+    assert side_chain_client.child.read_cache is None
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import threading
+from concurrent import futures
+
+import pytest
+from web3.exceptions import TimeExhausted
+from web3.types import TxParams, Wei
+
+from matic.json_types import (
+    ITransactionReceipt,
+    ITransactionRequestConfig,
+    ITransactionWriteResult,
+)
+from matic.web3_client import TransactionWriteResult, Web3Client
+from matic.web3_client.receipt_waiter import ReceiptWaiter, as_completed
+
+
+def _transfer(client: Web3Client, sender: int) -> TransactionWriteResult:
+    web3 = client._web3
+    tx: TxParams = {
+        'from': web3.eth.accounts[sender],
+        'to': web3.eth.accounts[0],
+        'value': Wei(1),
+    }
+    return TransactionWriteResult(web3.eth.send_transaction(tx), {}, client)
+
+
+def test_mined_already(client):
+    result = _transfer(client, 1)
+    assert result.get_receipt(timeout=5).status == 1
+    assert result.done()
+    assert len(client.receipt_waiter) == 0
+
+    receipt = client.get_transaction_receipt(result.transaction_hash, timeout=5)
+    assert receipt.transaction_hash == result.transaction_hash
+
+
+def test_failed_check_retried(client, monkeypatch):
+    waiter = client.receipt_waiter
+    get_receipt = waiter._get_receipt
+    failures = [ValueError('connection reset')]
+
+    def flaky_get_receipt(key):
+        if failures:
+            raise failures.pop()
+        return get_receipt(key)
+
+    monkeypatch.setattr(waiter, '_get_receipt', flaky_get_receipt)
+    # Mined before the first check: no block scan finds it later
+    result = _transfer(client, 1)
+
+    assert result.get_receipt(timeout=5).status == 1
+    assert not failures
+
+
+def test_pending_resolved_by_block_scan(client, provider):
+    tester = provider.ethereum_tester
+    tester.disable_auto_mine_transactions()
+    # One pending transaction per sender: eth-tester rejects future nonces
+    results = [_transfer(client, sender) for sender in range(1, 10)]
+
+    done: list[ITransactionWriteResult] = []
+    for result in results:
+        result.add_done_callback(done.append)
+    with pytest.raises(TimeExhausted):
+        results[0].get_receipt(timeout=0.5)
+    assert not any(result.done() for result in results)
+
+    provider.calls.clear()
+    tester.mine_blocks()
+    completed = list(as_completed(results, timeout=5))
+
+    assert sorted(map(id, completed)) == sorted(map(id, results))
+    assert sorted(map(id, done)) == sorted(map(id, results))
+    assert provider.calls.count('eth_getTransactionReceipt') == 9
+    assert provider.calls.count('eth_getBlockByNumber') == 1
+    assert [result.receipt.status for result in results] == [1] * 9
+
+
+def test_not_mined_expires(client, provider):
+    waiter = ReceiptWaiter(client, poll_interval=0.01, max_pending_blocks=2)
+    future = waiter.watch(b'\x01' * 32)
+
+    for _ in range(100):
+        provider.ethereum_tester.mine_blocks()
+        if futures.wait([future], timeout=0.05).done:
+            break
+
+    with pytest.raises(TimeExhausted, match='after 2 blocks'):
+        future.result(timeout=0)
+    assert len(waiter) == 0
+
+
+def test_mined_replacement_keeps_shared_watch(client):
+    other_hash = b'\x02' * 32
+    shared = client.receipt_waiter.watch(other_hash)
+    other = TransactionWriteResult(other_hash, {}, client)
+    assert not other.done()
+
+    result = _transfer(client, 1)
+    result.add_replacement(other_hash, {})
+    result.get_receipt(timeout=5)
+
+    # Another result still waits for the hash that lost here
+    assert not shared.cancelled()
+    assert not other.future.cancelled()
+    shared.cancel()
+
+
+def test_custom_result_defaults(client):
+    class CustomResult(ITransactionWriteResult):
+        """Result class written before done/callback/replacement hooks."""
+
+        def __init__(self, tx_hash: bytes) -> None:
+            self.tx_hash = tx_hash
+
+        @property
+        def transaction_hash(self) -> bytes:
+            return self.tx_hash
+
+        @property
+        def transaction_config(self) -> ITransactionRequestConfig:
+            return {}
+
+        def get_receipt(self, timeout: float = 120) -> ITransactionReceipt:
+            return client.get_transaction_receipt(self.tx_hash, timeout)
+
+    result = CustomResult(_transfer(client, 1).transaction_hash)
+    done = threading.Event()
+    result.add_done_callback(lambda _: done.set())
+
+    assert done.wait(5)
+    assert result.done()
+    with pytest.raises(NotImplementedError):
+        result.add_replacement(b'\x01' * 32, {})
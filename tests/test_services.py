@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from matic import services
+
+
+@pytest.fixture()
+def fresh_session():
+    services.close_session()
+    yield
+    services.close_session()
+
+
+@pytest.mark.usefixtures('fresh_session')
+def test_session_is_shared():
+    session = services.get_session()
+    assert services.get_session() is session
+
+    new_session = services.configure_session(pool_maxsize=2, max_retries=1)
+    assert new_session is not session
+    assert services.get_session() is new_session
+
+    adapter = new_session.get_adapter('https://static.matic.network')
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 2
+    assert adapter.max_retries.total == 1
+
+
+@pytest.mark.usefixtures('fresh_session')
+def test_requests_use_session_with_timeout(mocker):
+    get = mocker.patch.object(services.get_session(), 'get')
+    get.return_value.json.return_value = {'abi': [{'type': 'function'}]}
+
+    abi = services.get_abi('testnet', 'mumbai', 'pos', 'ChildERC20', 'http://abi/')
+
+    assert abi == [{'type': 'function'}]
+    get.assert_called_once_with(
+        'http://abi/testnet/mumbai/artifacts/pos/ChildERC20.json',
+        timeout=services.DEFAULT_TIMEOUT,
+    )
+    get.return_value.raise_for_status.assert_called_once_with()
+
+
+def test_retry_backoff_is_jittered():
+    retry: Retry = services._JitteredRetry(total=3, backoff_factor=1)
+    for _ in range(2):
+        retry = retry.increment(method='GET', url='/')
+    assert isinstance(retry, services._JitteredRetry)
+    backoffs = {retry.get_backoff_time() for _ in range(10)}
+    assert len(backoffs) > 1
+    assert all(0 <= b <= 2 for b in backoffs)
+
+
+def test_async_get_blocks_included_with_retry():
+    from aiohttp import web
+
+    calls = []
+
+    async def block_included(request):
+        calls.append(request.match_info['number'])
+        if len(calls) == 1:
+            return web.Response(status=503)
+        return web.json_response(
+            {
+                'headerBlockNumber': '0x2710',
+                'blockNumber': request.match_info['number'],
+                'start': '0',
+                'end': '255',
+                'proposer': '0x00',
+                'root': '0x00',
+                'createdAt': '1',
+                'message': 'success',
+            }
+        )
+
+    async def run():
+        app = web.Application()
+        app.router.add_get('/mumbai/block-included/{number}', block_included)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            return await services.async_get_blocks_included(
+                'testnet', [5, 6, 7], f'http://127.0.0.1:{port}/', concurrency=2
+            )
+        finally:
+            await services.close_async_session()
+            await runner.cleanup()
+
+    blocks = asyncio.run(run())
+
+    assert [block.block_number for block in blocks] == [5, 6, 7]
+    assert blocks[0].header_block_number == 10000
+    assert len(calls) == 4
+
+
+def test_async_session_closed_with_loop():
+    async def run():
+        return services.get_async_session()
+
+    session = asyncio.run(run())
+    assert session.closed
+
+
+def test_close_async_session():
+    async def run():
+        session = services.get_async_session()
+        await services.close_async_session()
+        assert session.closed
+        new_session = services.get_async_session()
+        assert new_session is not session
+        return new_session
+
+    assert asyncio.run(run()).closed
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import pytest
+from eth_account import Account
+
+from matic.web3_client.receipt_waiter import as_completed
+
+PRIVATE_KEYS = ['0x' + digit * 64 for digit in '123']
+SENDERS = [Account.from_key(key).address for key in PRIVATE_KEYS]
+
+
+@pytest.fixture()
+def token(make_token, fund):
+    for sender in SENDERS:
+        fund(sender)
+    return make_token(signers=PRIVATE_KEYS)
+
+
+def test_least_loaded_signer(token, provider):
+    pool = token.client.get_signer_pool(False)
+    assert token.client.get_nonce_manager(False) is not None
+
+    provider.ethereum_tester.disable_auto_mine_transactions()
+    # One pending transaction per sender: eth-tester rejects future nonces
+    results = [
+        token.process_write(
+            token.contract.method('increment'),
+            {'gas_limit': 10**5, 'use_signer_pool': True},
+        )
+        for _ in SENDERS
+    ]
+
+    assert [r.transaction_config['from'] for r in results] == SENDERS
+    assert [pool.in_flight(sender) for sender in SENDERS] == [1, 1, 1]
+
+    provider.ethereum_tester.mine_blocks()
+    assert len(list(as_completed(results, timeout=5))) == 3
+    assert [pool.in_flight(sender) for sender in SENDERS] == [0, 0, 0]
+    assert token.contract.method('counter').read() == 3
+
+
+def test_pool_is_opt_in(token, client):
+    pool = token.client.get_signer_pool(False)
+    default_sender = client._web3.eth.accounts[0]
+
+    # E.g. approve and deposit: the second one relies on the first one sender
+    results = [token.process_write(token.contract.method('increment')) for _ in '12']
+
+    assert [r.transaction_config['from'] for r in results] == [default_sender] * 2
+    assert [pool.in_flight(sender) for sender in SENDERS] == [0, 0, 0]
+
+
+def test_pool_misuse(token, make_token):
+    method = token.contract.method('increment')
+    with pytest.raises(ValueError, match='private key'):
+        token.process_write(method, {'use_signer_pool': True}, PRIVATE_KEYS[0])
+
+    token = make_token()
+    with pytest.raises(ValueError, match='no "signers"'):
+        token.process_write(
+            token.contract.method('increment'), {'use_signer_pool': True}
+        )
+
+
+def test_explicit_sender_bypasses_pool(token):
+    pool = token.client.get_signer_pool(False)
+    method = token.contract.method('increment')
+
+    result = token.process_write(method, {'from': SENDERS[2]}, PRIVATE_KEYS[2])
+
+    assert result.transaction_config['from'] == SENDERS[2]
+    assert pool.in_flight(SENDERS[2]) == 0
+
+
+def test_failed_send_unloads_signer(token):
+    pool = token.client.get_signer_pool(False)
+
+    def failing_send(address, key):
+        raise ValueError('nonce too low')
+
+    with pytest.raises(ValueError, match='nonce too low'):
+        pool.write(failing_send)
+    assert pool.in_flight(SENDERS[0]) == 0
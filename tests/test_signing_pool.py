@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+from eth_account import Account
+
+from matic.web3_client.signing_pool import SigningPool
+
+PRIVATE_KEY = '0x' + '11' * 32
+SENDER = Account.from_key(PRIVATE_KEY).address
+OTHER_KEY = '0x' + '22' * 32
+
+
+@pytest.fixture()
+def token(make_token, fund):
+    fund(SENDER)
+    return make_token()
+
+
+@pytest.fixture(scope='module')
+def pool():
+    with SigningPool([PRIVATE_KEY, OTHER_KEY], processes=2) as pool:
+        yield pool
+
+
+def _config(sender: str, nonce: int):
+    return {
+        'from': sender,
+        'to': '0x' + '33' * 20,
+        'value': nonce,
+        'nonce': nonce,
+        'gas_limit': 21_000,
+        'gas_price': 10**9,
+        'chain_id': 1,
+    }
+
+
+def test_sign_in_order(pool):
+    other = Account.from_key(OTHER_KEY).address
+    configs = [_config(SENDER if i % 2 else other, i) for i in range(20)]
+
+    raws = pool.sign_transactions(configs)
+
+    assert len(raws) == 20
+    for config, raw in zip(configs, raws):
+        key = PRIVATE_KEY if config['from'] == SENDER else OTHER_KEY
+        transaction = {
+            'to': config['to'],
+            'value': config['value'],
+            'nonce': config['nonce'],
+            'gas': 21_000,
+            'gasPrice': 10**9,
+            'chainId': 1,
+        }
+        expected = Account.sign_transaction(transaction, key).rawTransaction
+        assert raw == bytes(expected)
+
+
+def test_unknown_sender(pool):
+    unknown = Account.from_key('0x' + '44' * 32).address
+
+    raws = pool.sign_transactions([_config(unknown, 0), _config(SENDER, 1)])
+
+    assert isinstance(raws[0], ValueError)
+    assert isinstance(raws[1], bytes)
+
+
+def test_process_write_many(token, pool):
+    methods = (token.contract.method('increment', i) for i in range(1, 11))
+
+    results = token.process_write_many(
+        methods, PRIVATE_KEY, max_in_flight=4, signing_pool=pool
+    )
+
+    assert [r.transaction_config['nonce'] for r in results] == list(range(10))
+    assert token.contract.method('counter').read() == sum(range(1, 11))
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from eth_typing import HexAddress, HexStr
+from web3 import EthereumTesterProvider, Web3
+from web3._utils.module_testing.math_contract import MATH_ABI, MATH_BYTECODE
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError
+from web3.providers.base import BaseProvider
+
+import matic
+from matic import web3_client
+from matic.web3_client import Web3Client
+
+ADDRESS_1 = HexAddress(HexStr('0x1111111111111111111111111111111111111111'))
+ADDRESS_2 = HexAddress(HexStr('0x2222222222222222222222222222222222222222'))
+
+
+def _function(name, *input_types, outputs=('uint256',)):
+    return {
+        'type': 'function',
+        'name': name,
+        'stateMutability': 'view',
+        'inputs': [{'name': f'arg{i}', 'type': t} for i, t in enumerate(input_types)],
+        'outputs': [{'name': '', 'type': t} for t in outputs],
+    }
+
+
+ABI = [
+    _function('balanceOf', 'address'),
+    _function('allowance', 'address', 'address'),
+    _function('safeTransferFrom', 'address', 'address', 'uint256'),
+    _function('safeTransferFrom', 'address', 'address', 'uint256', 'bytes'),
+]
+
+
+@pytest.fixture()
+def tester_client():
+    return Web3Client(EthereumTesterProvider())
+
+
+def test_contract_factory_shared_by_abi(tester_client: Web3Client):
+    first = tester_client.get_contract(ADDRESS_1, ABI)
+    second = tester_client.get_contract(ADDRESS_2, copy.deepcopy(ABI))
+
+    assert first.factory is second.factory
+    assert first.method('balanceOf', ADDRESS_2).method.address == ADDRESS_1
+    assert second.method('balanceOf', ADDRESS_1).method.address == ADDRESS_2
+    assert second.contract.address == ADDRESS_2
+
+    other = tester_client.get_contract(ADDRESS_1, ABI[:1])
+    assert other.factory is not first.factory
+
+
+def test_abi_fingerprints_bounded(tester_client: Web3Client, monkeypatch):
+    monkeypatch.setattr(web3_client, 'ABI_FINGERPRINT_CACHE_SIZE', 2)
+    abis = [copy.deepcopy(ABI) for _ in range(5)]
+    factories = {tester_client.get_contract(ADDRESS_1, abi).factory for abi in abis}
+
+    assert len(factories) == 1
+    assert len(tester_client._abi_fingerprints) == 2
+
+
+def test_abi_fingerprints_thread_safe(tester_client: Web3Client, monkeypatch):
+    monkeypatch.setattr(web3_client, 'ABI_FINGERPRINT_CACHE_SIZE', 2)
+    abis = [copy.deepcopy(ABI) for _ in range(200)]
+
+    with ThreadPoolExecutor(8) as executor:
+        contracts = list(
+            executor.map(lambda abi: tester_client.get_contract(ADDRESS_1, abi), abis)
+        )
+
+    assert len({contract.factory for contract in contracts}) == 1
+    assert len(tester_client._abi_fingerprints) == 2
+
+
+def test_contract_address_validated(tester_client: Web3Client):
+    with pytest.raises(Exception, match='checksum'):
+        tester_client.get_contract(HexAddress(HexStr(ADDRESS_1.replace('1', 'a'))), ABI)
+
+
+def test_overload_resolution(tester_client: Web3Client):
+    contract = tester_client.get_contract(ADDRESS_1, ABI)
+
+    short = contract.method('safeTransferFrom', ADDRESS_1, ADDRESS_2, 1)
+    long = contract.method('safeTransferFrom', ADDRESS_1, ADDRESS_2, 1, b'\x01')
+    assert short.function.input_types == ('address', 'address', 'uint256')
+    assert long.function.input_types[-1] == 'bytes'
+    assert contract.dispatch._resolved[('safeTransferFrom', 3)] is short.function
+
+    with pytest.raises(ValueError, match='No function with matching name'):
+        contract.method('transfer', ADDRESS_1)
+    with pytest.raises(ValueError, match='matching name and args'):
+        contract.method('safeTransferFrom', ADDRESS_1)
+    # Single overload is checked as well
+    with pytest.raises(ValueError, match='takes 1 arguments, 2 given'):
+        contract.method('balanceOf', ADDRESS_1, ADDRESS_2)
+    assert ('balanceOf', 2) not in contract.dispatch._resolved
+
+
+def test_overload_resolution_by_value(tester_client: Web3Client):
+    abi = [_function('set', 'uint8'), _function('set', 'int256')]
+    contract = tester_client.get_contract(ADDRESS_1, abi)
+
+    assert contract.method('set', -1).function.input_types == ('int256',)
+    assert contract.method('set', 300).function.input_types == ('int256',)
+    with pytest.raises(ValueError, match='Cannot resolve'):
+        contract.method('set', 1)
+
+
+@pytest.mark.parametrize(
+    ('name', 'args'),
+    [
+        ('balanceOf', (ADDRESS_2,)),
+        ('allowance', (ADDRESS_1, ADDRESS_2)),
+        ('safeTransferFrom', (ADDRESS_1, ADDRESS_2, 5, b'data')),
+    ],
+)
+def test_precompiled_encoding_matches_web3(tester_client: Web3Client, name, args):
+    contract = tester_client.get_contract(ADDRESS_1, ABI)
+    method = contract.method(name, *args)
+
+    expected = contract.contract.encodeABI(fn_name=name, args=args)
+    assert method.encode_abi() == bytes.fromhex(expected[2:])
+    assert method.method.selector == expected[:10]
+    assert method.method.address == ADDRESS_1
+    assert method.method.abi is method.function.abi
+
+
+def _deploy(client: Web3Client, abi, bytecode):
+    web3 = client._web3
+    factory = web3.eth.contract(abi=abi, bytecode=bytecode)
+    tx_hash = factory.constructor().transact({'from': web3.eth.accounts[0]})
+    address = web3.eth.wait_for_transaction_receipt(tx_hash)['contractAddress']
+    assert address is not None
+    return client.get_contract(address, abi)
+
+
+@pytest.fixture()
+def math_contract(tester_client: Web3Client):
+    return _deploy(tester_client, MATH_ABI, MATH_BYTECODE)
+
+
+def test_precompiled_read(math_contract):
+    add = math_contract.method('add', 2, 3)
+    assert add.function.output_types == ('int256',)
+    assert add.read() == 5
+    assert add.function.decode_output(b'\xff' * 32) == (-1,)
+
+    assert math_contract.method('increment').function.input_types == ()
+    assert math_contract.method('increment', 2).function.input_types == ('uint256',)
+
+
+@pytest.mark.parametrize(('name', 'args'), [('add', (2, -3)), ('counter', ())])
+def test_direct_read_matches_web3(math_contract, name, args):
+    method = math_contract.method(name, *args)
+    tx = {'from': math_contract.client._web3.eth.accounts[0]}
+    assert method.read(tx, direct=True) == method.read(tx)
+
+    math_contract.client.direct_reads = True
+    assert math_contract.method(name, *args).read(tx) == method.read(tx, direct=False)
+
+
+@pytest.mark.parametrize(
+    ('response', 'error'),
+    [
+        (
+            {'error': {'code': 3, 'message': 'execution reverted: Nope'}},
+            pytest.raises(ContractLogicError, match='Nope'),
+        ),
+        (
+            {'error': {'code': -32000, 'message': 'header not found'}},
+            pytest.raises(ValueError, match='header not found'),
+        ),
+        ({'result': '0x'}, pytest.raises(BadFunctionCallOutput, match='balanceOf')),
+    ],
+)
+def test_direct_read_errors(response, error):
+    client = Web3Client(StaticProvider({'jsonrpc': '2.0', 'id': 1, **response}))
+    method = client.get_contract(ADDRESS_1, ABI).method('balanceOf', ADDRESS_2)
+    with error:
+        method.read(direct=True)
+
+
+@pytest.mark.parametrize(
+    ('block', 'expected'),
+    [(None, 'latest'), (16, '0x10'), (b'\x01' * 32, '0x' + '01' * 32)],
+)
+def test_direct_read_at_block(block, expected):
+    provider = StaticProvider({'jsonrpc': '2.0', 'id': 1, 'result': '0x' + '00' * 32})
+    method = (
+        Web3Client(provider).get_contract(ADDRESS_1, ABI).method('balanceOf', ADDRESS_2)
+    )
+    assert method.read(block_identifier=block, direct=True) == 0
+    assert provider.params[1] == expected
+
+
+def test_direct_read_checksums_addresses(tester_client: Web3Client):
+    abi = [_function('owners', outputs=('address', 'address[]'))]
+    function = tester_client.get_contract(ADDRESS_1, abi).method('owners').function
+    data = tester_client.encode_parameters(
+        [ADDRESS_2, [ADDRESS_1.replace('1', 'a')]], function.output_types
+    )
+    assert function.checksum_output
+    checksummed = Web3.toChecksumAddress(ADDRESS_1.replace('1', 'a'))
+    assert function.decode_result(data) == [ADDRESS_2, [checksummed]]
+
+
+class StaticProvider(BaseProvider):
+    """Provider answering every request with the same response after fixed delay."""
+
+    def __init__(self, response, rtt: float = 0) -> None:
+        self.response = response
+        self.rtt = rtt
+        self.methods: list[str] = []
+
+    def make_request(self, method, params):
+        self.methods.append(method)
+        self.params = params
+        time.sleep(self.rtt)
+        return self.response
+
+
+def test_direct_read_request_count():
+    response = {'jsonrpc': '2.0', 'id': 1, 'result': '0x' + '00' * 31 + '2a'}
+    provider = StaticProvider(response)
+    contract = Web3Client(provider).get_contract(ADDRESS_1, ABI)
+
+    for _ in range(3):
+        assert contract.method('balanceOf', ADDRESS_2).read(direct=True) == 42
+    assert provider.methods == ['eth_call'] * 3
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('rtt', [0, 0.001])
+def test_direct_read_benchmark(rtt):
+    """Calls per second of both read paths at fixed RTT (see log output)."""
+    response = {'jsonrpc': '2.0', 'id': 1, 'result': '0x' + '00' * 31 + '2a'}
+    client = Web3Client(StaticProvider(response, rtt))
+    contract = client.get_contract(ADDRESS_1, ABI)
+
+    rates = {}
+    for direct in (False, True):
+        calls, start = 0, time.perf_counter()
+        while (elapsed := time.perf_counter() - start) < 0.5:
+            assert contract.method('balanceOf', ADDRESS_2).read(direct=direct) == 42
+            calls += 1
+        rates[direct] = calls / elapsed
+
+    matic.logger.info(
+        'RTT %.1f ms: web3 %.0f calls/s, direct %.0f calls/s',
+        rtt * 1000,
+        rates[False],
+        rates[True],
+    )